@@ -0,0 +1,141 @@
+"""Benchmark the per frame overhead of the CAN message logger
+
+The notifier calls the logger for every received CAN frame (including
+streaming data). Run this script directly to compare the time the logger
+needs per frame, if logging is disabled, enabled or filtered:
+
+    python Test/Benchmark/can_logging.py
+
+Please note that the benchmark overwrites the files ``can.log`` and
+``can.blf`` in the user’s log directory.
+"""
+
+# -- Imports ------------------------------------------------------------------
+
+from logging import getLogger, LogRecord
+from timeit import timeit
+
+from can import Listener, Message as CANMessage
+
+from icotronic.can.listener import Logger
+from icotronic.can.protocol.identifier import Identifier
+from icotronic.can.protocol.message import Message
+
+# -- Classes ------------------------------------------------------------------
+
+
+class EagerLogger(Listener):
+    """Logger that creates a message wrapper per frame (old implementation)"""
+
+    def __init__(self) -> None:
+        self.logger = getLogger("icotronic.can.messages")
+
+    def on_message_received(self, msg: CANMessage) -> None:
+        """React to a received message on the bus
+
+        Args:
+
+            msg:
+                The received CAN message the notifier should react to
+
+        """
+
+        self.logger.debug("%s", Message(msg))
+
+    def on_error(self, exc: Exception) -> None:
+        """Handle any exception in the receive thread
+
+        Args:
+
+            exc:
+                The exception causing the thread to stop
+
+        """
+
+        self.logger.error("Error while monitoring CAN bus data: %s", exc)
+
+
+# -- Functions ----------------------------------------------------------------
+
+
+def reject(record: LogRecord) -> bool:  # pylint: disable=unused-argument
+    """Filter out all log records
+
+    Args:
+
+        record:
+            The log record that should be filtered
+
+    Returns:
+
+        ``False`` for every log record
+
+    """
+
+    return False
+
+
+def report(name: str, listener: Listener, message: CANMessage) -> None:
+    """Print the time a listener needs to handle a single CAN frame
+
+    Args:
+
+        name:
+            A description of the listener configuration
+
+        listener:
+            The listener that should handle the CAN frames
+
+        message:
+            The CAN frame the listener should handle
+
+    """
+
+    frames = 100_000
+    time_ns = timeit(lambda: listener(message), number=frames) / frames
+    print(f"{name:<32} {time_ns * 10**9:8.1f} ns")
+
+
+def main() -> None:
+    """Run benchmarks"""
+
+    # Streaming data message from STH 1
+    message = CANMessage(
+        arbitration_id=Identifier(
+            block="Streaming",
+            block_command=0x20,
+            sender="STH 1",
+            receiver="SPU 1",
+            request=False,
+        ).value,
+        data=[0, 1, 2, 3, 4, 5, 6, 7],
+        is_extended_id=True,
+    )
+
+    print(f"{'CAN Logger':<32} {'Time per Frame':>14}")
+
+    logger = Logger(level="INFO")
+    eager = EagerLogger()
+    report("Disabled (message wrapper)", eager, message)
+    report("Disabled", logger, message)
+    logger.stop()
+
+    logger = Logger(level="DEBUG", binary=False)
+    logger.logger.addFilter(reject)
+    report("Filtered", logger, message)
+    logger.logger.removeFilter(reject)
+    logger.stop()
+
+    logger = Logger(level="DEBUG", binary=False)
+    report("Enabled (text)", logger, message)
+    logger.stop()
+
+    logger = Logger(level="DEBUG", binary=True)
+    report("Enabled (binary)", logger, message)
+    logger.stop()
+
+
+# -- Main ---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark the decoding of CAN frames
+
+Run this script directly to compare the time needed to decode CAN frames
+using the message wrapper class and the functions of the module
+``icotronic.can.protocol.decode``:
+
+    python Test/Benchmark/decode.py
+"""
+
+# -- Imports ------------------------------------------------------------------
+
+from functools import partial
+from timeit import timeit
+
+from can import Message as CANMessage
+
+from icotronic.can.protocol.decode import decode_frame, decode_messages
+from icotronic.can.protocol.message import Message
+
+# -- Functions ----------------------------------------------------------------
+
+
+def wrap(messages: list[CANMessage]) -> None:
+    """Decode messages using the message wrapper class
+
+    Args:
+
+        messages:
+            The python-can messages that should be decoded
+
+    """
+
+    for message in messages:
+        identifier = Message(message).identifier()
+        identifier.sender()
+        identifier.receiver()
+        identifier.block()
+        identifier.block_command()
+        identifier.is_acknowledgment()
+        identifier.is_error()
+
+
+def decode(messages: list[CANMessage]) -> None:
+    """Decode messages one by one
+
+    Args:
+
+        messages:
+            The python-can messages that should be decoded
+
+    """
+
+    for message in messages:
+        decode_frame(message.arbitration_id, message.data)
+
+
+def main() -> None:
+    """Run benchmarks"""
+
+    frames = 10_000
+    messages = [
+        Message(
+            sender="STH 1",
+            receiver="SPU 1",
+            block="Streaming",
+            block_command="Data",
+            request=False,
+            data=[counter % 256] + [0] * 7,
+        ).to_python_can()
+        for counter in range(frames)
+    ]
+
+    print(f"{'Decoder':<32} {'Time per Frame':>14}")
+    for name, function in (
+        ("Message wrapper", wrap),
+        ("Single frame", decode),
+        ("Batch (NumPy)", decode_messages),
+    ):
+        time_ns = timeit(partial(function, messages), number=10) / 10 / frames
+        print(f"{name:<32} {time_ns * 10**9:8.1f} ns")
+
+
+# -- Main ---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Benchmark the construction cost of identifiers and messages
+
+Run this script directly to compare the time needed to create identifiers
+and messages with and without the cache of precomputed identifier values:
+
+    python Test/Benchmark/identifier.py
+"""
+
+# -- Imports ------------------------------------------------------------------
+
+from collections.abc import Callable
+from timeit import timeit
+
+from icotronic.can.listener import ResponseListener
+from icotronic.can.protocol.identifier import Identifier, identifier_value
+from icotronic.can.protocol.message import Message
+
+# -- Functions ----------------------------------------------------------------
+
+
+def report(name: str, function: Callable[[], object]) -> None:
+    """Print the time needed to call a function
+
+    Args:
+
+        name:
+            A description of the function
+
+        function:
+            The function that should be benchmarked
+
+    """
+
+    number = 20_000
+    time_ns = timeit(function, number=number) / number * 10**9
+    print(f"{name:<40} {time_ns:8.1f} ns")
+
+
+def uncached_identifier() -> int:
+    """Calculate the value of a request identifier without cache
+
+    Returns:
+
+        The value of the identifier
+
+    """
+
+    return identifier_value.__wrapped__(
+        0,
+        block="Product Data",
+        block_command="Serial Number 1",
+        sender="SPU 1",
+        receiver="STU 1",
+        request=True,
+    )
+
+
+def uncached_acknowledgment(identifier: Identifier) -> int:
+    """Calculate the value of an acknowledgment identifier without cache
+
+    Args:
+
+        identifier:
+            The identifier of the request
+
+    Returns:
+
+        The value of the acknowledgment identifier
+
+    """
+
+    return identifier_value.__wrapped__(
+        identifier.value,
+        sender=identifier.receiver(),
+        receiver=identifier.sender(),
+        request=False,
+        error=False,
+    )
+
+
+def main() -> None:
+    """Run benchmarks"""
+
+    identifier = Identifier(
+        block="Product Data",
+        block_command="Serial Number 1",
+        sender="SPU 1",
+        receiver="STU 1",
+        request=True,
+    )
+    message = Message(identifier=identifier, data=[0] * 8)
+
+    print(f"{'Construction':<40} {'Time':>11}")
+    report("Identifier (uncached)", uncached_identifier)
+    report(
+        "Identifier (cached)",
+        lambda: Identifier(
+            block="Product Data",
+            block_command="Serial Number 1",
+            sender="SPU 1",
+            receiver="STU 1",
+            request=True,
+        ),
+    )
+    report(
+        "Message",
+        lambda: Message(
+            block="Product Data",
+            block_command="Serial Number 1",
+            sender="SPU 1",
+            receiver="STU 1",
+            request=True,
+            data=[0] * 8,
+        ),
+    )
+    report(
+        "Acknowledgment (keywords, uncached)",
+        lambda: uncached_acknowledgment(identifier),
+    )
+    report("Acknowledgment (bit operations)", identifier.acknowledge)
+    report("ResponseListener", lambda: ResponseListener(message, None))
+
+
+# -- Main ---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Benchmark memory usage and creation time of streaming data objects
+
+Run this script directly to compare the current data types with the layout
+used before (instance dictionary per streaming message, list of data points
+per channel):
+
+    python Test/Benchmark/streaming_data.py
+"""
+
+# -- Imports ------------------------------------------------------------------
+
+from collections.abc import Callable
+from timeit import timeit
+from tracemalloc import get_traced_memory, start, stop
+
+from icotronic.can.streaming import StreamingData, StreamingDataBlock
+from icotronic.measurement import ChannelData, DataPoint
+
+# -- Classes ------------------------------------------------------------------
+
+
+# pylint: disable=too-few-public-methods
+
+
+class StreamingDataDict:
+    """Streaming data using an instance dictionary (old implementation)"""
+
+    def __init__(
+        self, counter: int, timestamp: float, values: list[float]
+    ) -> None:
+        if not 2 <= len(values) <= 3:
+            raise ValueError("Incorrect number of streaming values")
+
+        self.counter = counter
+        self.timestamp = timestamp
+        self.values = values
+
+
+# pylint: enable=too-few-public-methods
+
+# -- Functions ----------------------------------------------------------------
+
+
+def memory_per_object(create: Callable[[], object], number: int) -> float:
+    """Determine the memory used by a single object
+
+    Args:
+
+        create:
+            A function that creates ``number`` objects
+
+        number:
+            The number of objects created by ``create``
+
+    Returns:
+
+        The (average) memory usage per object in bytes
+
+    """
+
+    start()
+    objects = create()
+    used, _ = get_traced_memory()
+    stop()
+    del objects
+
+    return used / number
+
+
+def report(name: str, create: Callable[[], object], number: int) -> None:
+    """Print memory usage and construction time of some objects
+
+    Args:
+
+        name:
+            A description of the created objects
+
+        create:
+            A function that creates ``number`` objects
+
+        number:
+            The number of objects created by ``create``
+
+    """
+
+    memory = memory_per_object(create, number)
+    runs = 5
+    time_ns = timeit(create, number=runs) / runs / number * 10**9
+    print(f"{name:<32} {memory:8.1f} bytes {time_ns:8.1f} ns")
+
+
+def main() -> None:
+    """Run benchmarks"""
+
+    messages = 100_000
+    values = [32768, 32769, 32770]
+
+    print(f"{'Streaming messages':<32} {'Memory':>14} {'Time':>11}")
+    report(
+        "StreamingData (dictionary)",
+        lambda: [
+            StreamingDataDict(counter % 256, counter * 0.001, list(values))
+            for counter in range(messages)
+        ],
+        messages,
+    )
+    report(
+        "StreamingData (slots)",
+        lambda: [
+            StreamingData(counter % 256, counter * 0.001, list(values))
+            for counter in range(messages)
+        ],
+        messages,
+    )
+
+    def create_block() -> StreamingDataBlock:
+        block = StreamingDataBlock()
+        for counter in range(messages):
+            block.counters.append(counter % 256)
+            block.timestamps.append(counter * 0.001)
+            block.values.extend(values)
+        return block
+
+    report("StreamingDataBlock", create_block, messages)
+
+    samples = messages * len(values)
+    print(f"\n{'Channel values':<32} {'Memory':>14} {'Time':>11}")
+    report(
+        "list[DataPoint]",
+        lambda: [
+            DataPoint(counter=counter % 256, timestamp=0.5, value=1.0)
+            for counter in range(samples)
+        ],
+        samples,
+    )
+
+    def create_channel_data() -> ChannelData:
+        channel_data = ChannelData()
+        for counter in range(messages):
+            channel_data.append_values(counter % 256, 0.5, values)
+        return channel_data
+
+    report("ChannelData (columns)", create_channel_data, samples)
+
+
+# -- Main ---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    main()
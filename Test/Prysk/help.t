@@ -4,7 +4,8 @@ Check help output for main command:
 
   $ icon --help
   usage: icon [-h] [--log {debug,info,warning,error,critical}]
-              {config,dataloss,list,measure,rename,stu} ...
+              {analyze,config,daemon,dataloss,eeprom,list,log,measure,rename,stu}
+              ...
   
   ICOtronic CLI tool
   
@@ -14,14 +15,32 @@ Check help output for main command:
                           minimum log level
   
   Subcommands:
-    {config,dataloss,list,measure,rename,stu}
+    {analyze,config,daemon,dataloss,eeprom,list,log,measure,rename,stu}
+      analyze             Print statistics about recorded CAN messages
       config              Open config file in default application
+      daemon              Share CAN connection with other processes
       dataloss            Check data loss at different sample rates
+      eeprom              Backup or restore EEPROM content
       list                List sensor nodes
+      log                 Print recorded CAN messages in human readable format
       measure             Store measurement data
       rename              Rename a sensor node
       stu                 Execute commands related to stationary receiver unit
 
+Check help output of analyze command:
+
+  $ icon analyze -h
+  usage: icon analyze [-h] [-i INTERVAL] [filepath]
+  
+  positional arguments:
+    filepath              Recorded CAN log file (default: recorded file of ICOn)
+  
+  option.* (re)
+    -h, --help            show this help message and exit
+    -i INTERVAL, --interval INTERVAL
+                          Time interval in seconds used to calculate the bus
+                          load
+
 Check help output of config command:
 
   $ icon config -h
@@ -30,6 +49,19 @@ Check help output of config command:
   option.* (re)
     -h, --help  show this help message and exit
 
+Check help output of EEPROM command:
+
+  $ icon eeprom -h
+  usage: icon eeprom [-h] {backup,restore} ...
+  
+  option.* (re)
+    -h, --help        show this help message and exit
+  
+  Subcommands:
+    {backup,restore}
+      backup          Store EEPROM content of STU (and sensor node) in file
+      restore         Write EEPROM content of STU (and sensor node) from file
+
 Check help output of list command:
 
   $ icon list -h
@@ -38,12 +70,26 @@ Check help output of list command:
   option.* (re)
     -h, --help  show this help message and exit
 
+Check help output of log command:
+
+  $ icon log -h
+  usage: icon log [-h] [filepath]
+  
+  positional arguments:
+    filepath    Recorded CAN log file (default: recorded file of ICOn)
+  
+  option.* (re)
+    -h, --help  show this help message and exit
+
 Check help output of measure command:
 
   $ icon measure --help | grep -Ev '^[[:space:]]+Node number of sensor node'
   usage: icon measure [-h] [-t TIME] [-1 [FIRST_CHANNEL]] [-2 [SECOND_CHANNEL]]
-                      [-3 [THIRD_CHANNEL]]* (glob)
-                      [-s 2–127] [-a {1,2,3,4,8,16,32,64,128,256}]
+                      [-3 [THIRD_CHANNEL]] [--trigger {threshold,rms,rate}]
+                      [--trigger-level TRIGGER_LEVEL]
+                      [--pre-trigger PRE_TRIGGER] [--hold HOLD]
+                      (-n NAME | -m MAC_ADRESS | -d NUMBER) [-s 2–127]
+                      [-a {1,2,3,4,8,16,32,64,128,256}]
                       [-o {1,2,4,8,16,32,64,128,256,512,1024,2048,4096}]
                       [-v {1.25,1.65,1.8,2.1,2.2,2.5,2.7,3.3,5,6.6}]
   
@@ -62,6 +108,18 @@ Check help output of measure command:
                           sensor channel number for third measurement channel (1
                           - 255; 0 to disable)
   
+  Trigger:
+    --trigger {threshold,rms,rate}
+                          Only store data around events where the deviation from
+                          the ADC center (threshold), its RMS over 0.1 s (rms)
+                          or the difference of consecutive values (rate) reaches
+                          the trigger level
+    --trigger-level TRIGGER_LEVEL
+                          Trigger level in raw ADC units
+    --pre-trigger PRE_TRIGGER
+                          Time in seconds stored before a trigger event
+    --hold HOLD           Time in seconds stored after the last trigger event
+  
   Sensor Node Identifier:
     -n* Name of sensor node (glob)
     -m* (glob)
@@ -0,0 +1,82 @@
+"""Test the scheduler for outbound CAN frames without hardware"""
+
+# -- Imports ------------------------------------------------------------------
+
+from asyncio import gather
+from collections.abc import Iterator
+
+from can import Bus, BusABC, CanError, Message as CANMessage
+from pytest import fixture, MonkeyPatch
+
+from icotronic.can.scheduler import Priority, Scheduler
+
+# pylint: disable=redefined-outer-name
+
+# -- Fixtures -----------------------------------------------------------------
+
+
+@fixture
+def buses() -> Iterator[tuple[BusABC, BusABC]]:
+    """Connect two virtual CAN buses"""
+
+    with (
+        Bus(interface="virtual", channel="scheduler") as bus,
+        Bus(interface="virtual", channel="scheduler") as other,
+    ):
+        yield bus, other
+
+
+# -- Functions ----------------------------------------------------------------
+
+
+async def test_priority_order(buses: tuple[BusABC, BusABC]):
+    """Check that queued frames are sent according to their priority"""
+
+    bus, other = buses
+
+    priorities = (
+        Priority.BULK,
+        Priority.METADATA,
+        Priority.BULK,
+        Priority.STREAMING,
+        Priority.CONTROL,
+    )
+    scheduler = Scheduler(bus, rate=100, burst=1)
+    await gather(*(
+        scheduler.send(CANMessage(data=[number]), priority)
+        for number, priority in enumerate(priorities)
+    ))
+
+    received = [other.recv(0) for _ in priorities]
+    # The first frame does not have to wait, all other frames do
+    assert [message.data[0] for message in received] == [0, 4, 3, 1, 2]
+    assert scheduler.delayed == len(priorities) - 1
+    assert scheduler.depth() == 0
+
+
+async def test_send_error(
+    buses: tuple[BusABC, BusABC], monkeypatch: MonkeyPatch
+):
+    """Check that a failed frame does not stop the other queued frames"""
+
+    bus, other = buses
+
+    send = bus.send
+
+    def fail_second_frame(message: CANMessage, timeout=None) -> None:
+        if message.data[0] == 1:
+            raise CanError("Unable to send frame")
+        send(message, timeout)
+
+    monkeypatch.setattr(bus, "send", fail_second_frame)
+
+    scheduler = Scheduler(bus, rate=100, burst=1)
+    results = await gather(
+        *(scheduler.send(CANMessage(data=[number])) for number in range(3)),
+        return_exceptions=True,
+    )
+
+    assert results[0] is None
+    assert isinstance(results[1], CanError)
+    assert results[2] is None
+    assert [other.recv(0).data[0] for _ in range(2)] == [0, 2]
@@ -0,0 +1,337 @@
+"""Test request handling of the SPU without hardware
+
+The tests connect the SPU and a simulated node via a virtual CAN bus.
+"""
+
+# -- Imports ------------------------------------------------------------------
+
+from asyncio import gather, get_running_loop, to_thread
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+from time import monotonic
+
+from can import (
+    Bus,
+    BusABC,
+    Listener,
+    LogReader,
+    Message as CANMessage,
+    Notifier,
+)
+from pytest import fixture, raises
+
+from icotronic.can.error import NoResponseError
+from icotronic.can.latency import RoundTripTime
+from icotronic.can.node.spu import SPU
+from icotronic.can.protocol.message import Message
+from icotronic.can.recorder import Recorder
+
+# pylint: disable=redefined-outer-name
+
+# -- Classes ------------------------------------------------------------------
+
+
+class Node(Listener):
+    """Simulate a node that acknowledges requests
+
+    Args:
+
+        bus:
+            The CAN bus used to send the acknowledgments
+
+    """
+
+    def __init__(self, bus: BusABC) -> None:
+
+        self.bus = bus
+        self.delay: Callable[[Message], float | None] = lambda request: 0
+        """Get the time in seconds before the node answers a request
+
+        If the function returns ``None``, then the node ignores the request.
+        """
+        self.frames: list[Message] = []
+        """Received requests and sent acknowledgments in chronological order"""
+
+    def requests(self) -> list[Message]:
+        """Get the received requests
+
+        Returns:
+
+            All requests the node received
+
+        """
+
+        return [
+            frame
+            for frame in self.frames
+            if not frame.identifier().is_acknowledgment()
+        ]
+
+    def on_message_received(self, msg: CANMessage) -> None:
+        """Acknowledge a request
+
+        Args:
+
+            msg:
+                The received request
+
+        """
+
+        request = Message(msg)
+        self.frames.append(request)
+        delay = self.delay(request)
+        if delay is None:
+            return
+
+        get_running_loop().call_later(delay, self._send, request.acknowledge())
+
+    def _send(self, response: Message) -> None:
+        """Send a response
+
+        Args:
+
+            response:
+                The response that should be sent
+
+        """
+
+        self.frames.append(response)
+        self.bus.send(response.to_python_can())
+
+    def on_error(self, exc: Exception) -> None:
+        """Fail on any exception in the receive thread
+
+        Args:
+
+            exc:
+                The exception causing the thread to stop
+
+        """
+
+        raise exc
+
+
+# -- Fixtures -----------------------------------------------------------------
+
+
+@fixture
+async def connection() -> AsyncIterator[tuple[SPU, Node]]:
+    """Connect the SPU to a simulated node via a virtual CAN bus"""
+
+    loop = get_running_loop()
+    # Recorders derive the channel number from trailing digits of the name
+    channel = "spu"
+    with (
+        Bus(interface="virtual", channel=channel) as spu_bus,
+        Bus(interface="virtual", channel=channel) as node_bus,
+    ):
+        node = Node(node_bus)
+        # Use a short timeout to stop the receive threads quickly
+        spu_notifier = Notifier(spu_bus, [], timeout=0.1, loop=loop)
+        node_notifier = Notifier(node_bus, [node], timeout=0.1, loop=loop)
+        try:
+            yield SPU(spu_bus, spu_notifier), node
+        finally:
+            await to_thread(spu_notifier.stop)
+            await to_thread(node_notifier.stop)
+
+
+# -- Functions ----------------------------------------------------------------
+
+
+def product_data_request(block_command: str) -> Message:
+    """Create a product data request for the STU
+
+    Args:
+
+        block_command:
+            The name of the product data command
+
+    Returns:
+
+        A request message for the given product data
+
+    """
+
+    return Message(
+        block="Product Data",
+        block_command=block_command,
+        sender="SPU 1",
+        receiver="STU 1",
+        request=True,
+        data=[0] * 8,
+    )
+
+
+async def test_latency_histogram(connection: tuple[SPU, Node]):
+    """Check that the SPU exposes the latency of its requests"""
+
+    spu, _ = connection
+
+    assert not spu.latency_histogram()
+
+    for block_command in ("GTIN", "GTIN", "Hardware Version"):
+        await spu.request(
+            product_data_request(block_command), f"get {block_command}"
+        )
+
+    # Every command uses its own round trip time statistics
+    assert len(spu.round_trip_times) == 2
+    histogram = spu.latency_histogram()
+    assert sum(histogram.values()) == 3
+    assert set(histogram) <= set(RoundTripTime.BUCKETS)
+    assert list(histogram) == sorted(histogram)
+
+
+async def test_retry_budget(connection: tuple[SPU, Node]):
+    """Check that a request without response stops after the total timeout"""
+
+    spu, node = connection
+
+    message = product_data_request("GTIN")
+    await spu.request(message, "get GTIN")
+    identifier = message.identifier()
+    rtt = spu.round_trip_times[
+        identifier.receiver(), identifier.command_number()
+    ]
+    # The fast response lowers the timeout below the fixed schedule
+    assert rtt.timeout() < 0.6
+    rtt.total_timeout = 1
+
+    node.delay = lambda request: None
+    start = monotonic()
+    with raises(NoResponseError):
+        await spu.request(message, "get GTIN", retries=10)
+
+    assert monotonic() - start < 1.5
+    assert rtt.timeouts == len(rtt.schedule(attempts=10))
+    # One request for the first response and then the retries
+    assert 1 < len(node.requests()) - 1 < 10
+
+
+async def test_record_sent_frames(
+    connection: tuple[SPU, Node], tmp_path: Path
+):
+    """Check that sent and received frames use the same clock"""
+
+    spu, _ = connection
+
+    filepath = tmp_path / "can.blf"
+    recorder = Recorder(filepath)
+    spu.notifier.add_listener(recorder)
+    spu.scheduler.listeners.append(recorder)
+    await spu.request(product_data_request("GTIN"), "get GTIN")
+    spu.notifier.remove_listener(recorder)
+    recorder.stop()
+
+    request, response = LogReader(filepath)
+    assert not request.is_rx
+    assert response.is_rx
+    assert 0 <= response.timestamp - request.timestamp < 0.5
+
+
+async def test_out_of_order_responses(connection: tuple[SPU, Node]):
+    """Check that responses in a different order reach their requests"""
+
+    spu, node = connection
+
+    # The node answers the first request last
+    node.delay = lambda request: (
+        0.2 if request.identifier().block_command_name() == "GTIN" else 0
+    )
+    gtin, hardware_version = await gather(
+        spu.request(product_data_request("GTIN"), "get GTIN"),
+        spu.request(
+            product_data_request("Hardware Version"), "get hardware version"
+        ),
+    )
+
+    assert Message(gtin).identifier().block_command_name() == "GTIN"
+    assert (
+        Message(hardware_version).identifier().block_command_name()
+        == "Hardware Version"
+    )
+    responses = [
+        frame.identifier().block_command_name()
+        for frame in node.frames
+        if frame.identifier().is_acknowledgment()
+    ]
+    assert responses == ["Hardware Version", "GTIN"]
+    assert not spu.responses.listeners
+
+
+async def test_pipelined_requests(connection: tuple[SPU, Node]):
+    """Check concurrent requests to the same node with the same response id"""
+
+    spu, node = connection
+
+    # Later requests receive their responses first
+    node.delay = lambda request: (8 - request.data[1]) * 0.02
+    responses = await gather(*(
+        spu.request_bluetooth(
+            "STU 1", 5, "get name", sensor_node_number=sensor_node_number
+        )
+        for sensor_node_number in range(8)
+    ))
+
+    assert [response.data[1] for response in responses] == list(range(8))
+
+    # The SPU does not wait for a response before sending the next request,
+    # but limits the number of requests waiting for a response
+    pending = maximum_pending = 0
+    for frame in node.frames:
+        pending += -1 if frame.identifier().is_acknowledgment() else 1
+        maximum_pending = max(pending, maximum_pending)
+    assert maximum_pending == spu.window
+    assert len(node.requests()) == 8
+
+
+async def test_ambiguous_requests(connection: tuple[SPU, Node]):
+    """Check that requests with indistinguishable responses do not overlap"""
+
+    spu, node = connection
+
+    node.delay = lambda request: 0.05
+    # The responses for the MAC addresses of different sensor nodes look
+    # the same
+    responses = await spu.gather_requests(
+        spu.bluetooth_request(
+            "STU 1", 17, "get MAC address", sensor_node_number=number
+        )
+        for number in range(2)
+    )
+
+    assert [response.data[1] for response in responses] == [0, 1]
+    # The second request waits until the first request received its response
+    frames = [
+        (frame.identifier().is_acknowledgment(), frame.data[1])
+        for frame in node.frames
+    ]
+    assert frames == [(False, 0), (True, 0), (False, 1), (True, 1)]
+
+
+async def test_timeout_releases_response(connection: tuple[SPU, Node]):
+    """Check that a request without response lets waiting requests continue"""
+
+    spu, node = connection
+
+    # The node never answers requests for the first sensor node
+    node.delay = lambda request: None if request.data[1] == 0 else 0
+    first, second = (
+        spu.bluetooth_request(
+            "STU 1", 17, "get MAC address", sensor_node_number=number
+        )
+        for number in range(2)
+    )
+    unanswered, response = await gather(
+        spu.request(*first._replace(retries=1)),
+        spu.request(*second),
+        return_exceptions=True,
+    )
+
+    assert isinstance(unanswered, NoResponseError)
+    assert isinstance(response, CANMessage)
+    assert response.data[1] == 1
+    assert [frame.data[1] for frame in node.requests()] == [0, 1]
+    assert not spu.expected_responses
+    assert not spu.waiting_requests
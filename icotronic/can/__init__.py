@@ -13,9 +13,11 @@ from icotronic.can.error import (
     NoResponseError,
 )
 from icotronic.can.connection import Connection
+from icotronic.can.session import Session
 from icotronic.can.streaming import (
     StreamingConfiguration,
     StreamingData,
+    StreamingDataBlock,
     StreamingError,
     StreamingTimeoutError,
     StreamingBufferError,
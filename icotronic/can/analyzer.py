@@ -0,0 +1,622 @@
+"""Analyze recorded ICOtronic CAN traffic
+
+The analyzer reads recorded CAN frames one by one, so the memory usage
+does not depend on the size of the recorded trace. It supports the text log
+of ICOtronic (``can.log``) and all log file formats of python-can (e.g. ASC
+and BLF).
+"""
+
+# -- Imports ------------------------------------------------------------------
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from datetime import datetime
+from os import PathLike
+from pathlib import Path
+from re import compile as re_compile
+
+from can import LogReader, Message as CANMessage
+
+from icotronic.can.dataloss import MessageStats
+from icotronic.can.latency import RoundTripTime
+from icotronic.can.protocol.decode import command_name, node_name
+from icotronic.can.protocol.message import Message
+
+# -- Classes ------------------------------------------------------------------
+
+
+class CommandStats:
+    """Store request statistics of a single command
+
+    Examples:
+
+        Get the textual representation of some statistics
+
+        >>> stats = CommandStats()
+        >>> stats.requests = 3
+        >>> stats.add_latency(0.002)
+        >>> stats.add_latency(0.004)
+        >>> stats # doctest:+NORMALIZE_WHITESPACE
+        Requests: 3, Responses: 2, Retries: 0, Errors: 0, Unanswered: 0,
+        Latency: 3.00 ms (Maximum: 4.00 ms)
+
+    """
+
+    def __init__(self) -> None:
+
+        self.requests = 0
+        """Number of sent requests (without retries)"""
+
+        self.retries = 0
+        """Number of repeated requests"""
+
+        self.errors = 0
+        """Number of error responses"""
+
+        self.unanswered = 0
+        """Number of requests without response"""
+
+        self.latency = RoundTripTime()
+        """Distribution of the time between request and response"""
+
+        self.total_latency = 0.0
+        self.maximum_latency = 0.0
+
+    def __repr__(self) -> str:
+        """Get the textual representation of the command statistics
+
+        Returns:
+
+            A string representing the command statistics
+
+        """
+
+        attributes = [
+            f"Requests: {self.requests}",
+            f"Responses: {self.latency.samples}",
+            f"Retries: {self.retries}",
+            f"Errors: {self.errors}",
+            f"Unanswered: {self.unanswered}",
+        ]
+        if self.latency.samples > 0:
+            attributes.append(
+                f"Latency: {self.mean_latency() * 1000:.2f} ms "
+                f"(Maximum: {self.maximum_latency * 1000:.2f} ms)"
+            )
+
+        return ", ".join(attributes)
+
+    def add_latency(self, latency: float) -> None:
+        """Add the time between a request and its response
+
+        Args:
+
+            latency:
+                The time between request and response in seconds
+
+        """
+
+        self.latency.add(latency)
+        self.total_latency += latency
+        self.maximum_latency = max(self.maximum_latency, latency)
+
+    def mean_latency(self) -> float:
+        """Get the average time between request and response
+
+        Returns:
+
+            The average latency in seconds
+
+        """
+
+        samples = self.latency.samples
+        return self.total_latency / samples if samples > 0 else 0.0
+
+
+# pylint: disable=too-many-instance-attributes
+
+
+class TraceAnalyzer:
+    """Collect statistics about ICOtronic CAN traffic
+
+    The analyzer matches requests and responses via their identifiers. If
+    a request with the same identifier and payload is sent again before the
+    analyzer received a response, then it counts this request as retry.
+
+    Args:
+
+        interval:
+            The length of the time intervals (in seconds) used to calculate
+            the bus load
+
+        bitrate:
+            The bitrate of the CAN bus in bits per second
+
+    Examples:
+
+        Import required library code
+
+        >>> from icotronic.can.protocol.identifier import Identifier
+
+        Analyze a request that was answered after a retry
+
+        >>> request = Identifier(block="System", block_command="Reset",
+        ...                      sender="SPU 1", receiver="STH 1",
+        ...                      request=True)
+        >>> analyzer = TraceAnalyzer()
+        >>> analyzer.add(0.0, request.value)
+        >>> analyzer.add(0.5, request.value)
+        >>> analyzer.add(0.502, request.acknowledge().value)
+        >>> analyzer.commands[("System", "Reset")]
+        ... # doctest:+NORMALIZE_WHITESPACE
+        Requests: 1, Responses: 1, Retries: 1, Errors: 0, Unanswered: 0,
+        Latency: 2.00 ms (Maximum: 2.00 ms)
+
+        Analyze streaming data with a lost message
+
+        >>> data = Identifier(block="Streaming", block_command="Data",
+        ...                   sender="STH 1", receiver="SPU 1",
+        ...                   request=False)
+        >>> for counter in (1, 2, 4):
+        ...     analyzer.add(1 + counter / 1000, data.value,
+        ...                  bytes([0, counter, 0, 0, 0, 0, 0, 0]))
+        >>> analyzer.streams
+        {'STH 1': Retrieved: 3, Lost: 1, Dataloss: 0.25}
+
+    """
+
+    HEADER_BITS = 67
+    """Number of bits of an extended CAN frame without payload and stuffing"""
+
+    PENDING_LIMIT = 16
+    """Maximum number of unanswered requests stored per identifier"""
+
+    ERROR_LIMIT = 10
+    """Maximum number of stored error responses"""
+
+    def __init__(self, interval: float = 1, bitrate: int = 1_000_000) -> None:
+
+        self.interval = interval
+        self.bitrate = bitrate
+
+        self.frames = 0
+        """Number of analyzed CAN frames"""
+
+        self.commands: dict[tuple[str, str], CommandStats] = {}
+        """Request statistics for every block and block command"""
+
+        self.streams: dict[str, MessageStats] = {}
+        """Streaming data statistics for every sending node"""
+
+        self.bus_load: list[tuple[float, float]] = []
+        """Start time and bus load (between 0 and 1) of every interval"""
+
+        self.error_messages: list[str] = []
+        """Explanation of the first error responses (including the time
+        since the first frame)"""
+
+        self.pending: dict[int, deque[tuple[float, bytes]]] = {}
+        self.last_counters: dict[int, int] = {}
+        self.start_time = 0.0
+        self.interval_start: float | None = None
+        self.interval_bits = 0
+
+    def __repr__(self) -> str:
+        """Get the textual representation of the analysis results
+
+        Returns:
+
+            A string containing a report about the analyzed frames
+
+        Examples:
+
+            Get the report of an empty trace
+
+            >>> TraceAnalyzer()
+            Frames: 0
+
+        """
+
+        lines = [f"Frames: {self.frames}"]
+
+        if self.commands:
+            lines.extend(["", "Requests:"])
+            for (block, block_command), stats in sorted(self.commands.items()):
+                lines.append(f"  {block} – {block_command}: {stats}")
+                for bound, count in stats.latency.histogram().items():
+                    lines.append(f"    ≤ {bound * 1000:g} ms: {count}")
+
+        if self.error_messages:
+            lines.extend(["", "Error Responses:"])
+            lines.extend(f"  {message}" for message in self.error_messages)
+
+        if self.streams:
+            lines.extend(["", "Streaming:"])
+            for node, node_stats in sorted(self.streams.items()):
+                lines.append(f"  {node}: {node_stats}")
+
+        bus_load = self.intervals()
+        if bus_load:
+            lines.extend(["", "Bus Load:"])
+            for timestamp, load in bus_load:
+                lines.append(
+                    f"  {timestamp - self.start_time:10.3f} s: "
+                    f"{load * 100:6.2f} %"
+                )
+
+        return "\n".join(lines)
+
+    def _update_bus_load(self, timestamp: float, length: int) -> None:
+        """Add a frame to the bus load calculation
+
+        Args:
+
+            timestamp:
+                The time the frame was recorded
+
+            length:
+                The number of payload bytes of the frame
+
+        """
+
+        start = self.interval_start
+        if start is None:
+            start = self.interval_start = self.start_time = timestamp
+        elif timestamp >= start + self.interval:
+            self.bus_load.append((
+                start,
+                self.interval_bits / (self.bitrate * self.interval),
+            ))
+            # Skip intervals without frames
+            start += (timestamp - start) // self.interval * self.interval
+            self.interval_start = start
+            self.interval_bits = 0
+
+        self.interval_bits += self.HEADER_BITS + 8 * length
+
+    def _add_request(
+        self, timestamp: float, identifier: int, data: bytes
+    ) -> None:
+        """Add a request
+
+        Args:
+
+            timestamp:
+                The time the request was recorded
+
+            identifier:
+                The 29 bit identifier of the request
+
+            data:
+                The payload of the request
+
+        """
+
+        stats = self._command_stats(identifier)
+        pending = self.pending.setdefault(identifier, deque())
+        for index, (_, pending_data) in enumerate(pending):
+            if pending_data == data:
+                # Use the time of the latest attempt to calculate the latency
+                pending[index] = (timestamp, data)
+                stats.retries += 1
+                return
+
+        stats.requests += 1
+        if len(pending) >= self.PENDING_LIMIT:
+            pending.popleft()
+            stats.unanswered += 1
+        pending.append((timestamp, data))
+
+    def _add_response(
+        self, timestamp: float, identifier: int, data: bytes
+    ) -> bool:
+        """Add a (possible) response to a request
+
+        Args:
+
+            timestamp:
+                The time the response was recorded
+
+            identifier:
+                The 29 bit identifier of the response
+
+            data:
+                The payload of the response
+
+        Returns:
+
+            ``True``, if the frame is the response to a recorded request or
+            ``False`` otherwise
+
+        """
+
+        sender = (identifier >> 6) & 0x1F
+        receiver = identifier & 0x1F
+        # Swap sender and receiver, set request bit and clear error bit
+        request = (
+            identifier & ~(0x1F << 6 | 0x1F | 1 << 12)
+            | 1 << 13
+            | receiver << 6
+            | sender
+        )
+
+        pending = self.pending.get(request)
+        if not pending:
+            return False
+
+        request_time, _ = pending.popleft()
+        stats = self._command_stats(identifier)
+        stats.add_latency(timestamp - request_time)
+
+        if identifier >> 12 & 1:
+            stats.errors += 1
+            if len(self.error_messages) < self.ERROR_LIMIT:
+                message = Message(
+                    CANMessage(
+                        arbitration_id=identifier,
+                        data=data,
+                        is_extended_id=True,
+                    )
+                )
+                self.error_messages.append(
+                    f"{timestamp - self.start_time:.3f} s: {message}"
+                )
+
+        return True
+
+    def _add_streaming_data(self, identifier: int, data: bytes) -> None:
+        """Add a streaming data frame
+
+        Args:
+
+            identifier:
+                The 29 bit identifier of the streaming data frame
+
+            data:
+                The payload of the streaming data frame
+
+        """
+
+        sender = (identifier >> 6) & 0x1F
+        name = node_name(sender)
+        stats = self.streams.get(name)
+        if stats is None:
+            stats = self.streams[name] = MessageStats()
+
+        counter = data[1]
+        last_counter = self.last_counters.get(sender)
+        if last_counter is not None:
+            if counter == last_counter:
+                return  # Skip data with same message counter
+            stats.lost += (counter - last_counter) % 256 - 1
+        stats.retrieved += 1
+        self.last_counters[sender] = counter
+
+    def _command_stats(self, identifier: int) -> CommandStats:
+        """Get the statistics of the command of a frame
+
+        Args:
+
+            identifier:
+                The 29 bit identifier of a frame
+
+        Returns:
+
+            The statistics of the command
+
+        """
+
+        command = command_name(
+            (identifier >> 22) & 0x3F, identifier >> 14 & 0xFF
+        )
+        stats = self.commands.get(command)
+        if stats is None:
+            stats = self.commands[command] = CommandStats()
+
+        return stats
+
+    def add(
+        self, timestamp: float, arbitration_id: int, data: bytes = b""
+    ) -> None:
+        """Analyze a CAN frame
+
+        Args:
+
+            timestamp:
+                The time the frame was recorded in seconds
+
+            arbitration_id:
+                The 29 bit identifier of the frame
+
+            data:
+                The payload of the frame
+
+        """
+
+        self.frames += 1
+        self._update_bus_load(timestamp, len(data))
+
+        if arbitration_id >> 13 & 1:
+            self._add_request(timestamp, arbitration_id, data)
+            return
+
+        if self._add_response(timestamp, arbitration_id, data):
+            return
+
+        # Block “Streaming” (0x04), Commands “Data” (0x00) & “Voltage” (0x20)
+        if (
+            (arbitration_id >> 22) & 0x3F == 0x04
+            and (arbitration_id >> 14) & 0xFF in (0x00, 0x20)
+            and len(data) == 8
+        ):
+            self._add_streaming_data(arbitration_id, data)
+
+    def intervals(self) -> list[tuple[float, float]]:
+        """Get the bus load of all intervals including the current interval
+
+        Returns:
+
+            A list containing the start time and bus load (between 0 and 1)
+            of every interval that contains frames
+
+        """
+
+        if self.interval_start is None:
+            return []
+
+        return self.bus_load + [(
+            self.interval_start,
+            self.interval_bits / (self.bitrate * self.interval),
+        )]
+
+    def finish(self) -> None:
+        """Count all requests without a response as unanswered"""
+
+        for identifier, pending in self.pending.items():
+            if pending:
+                self._command_stats(identifier).unanswered += len(pending)
+                pending.clear()
+
+
+# pylint: enable=too-many-instance-attributes
+
+# -- Functions ----------------------------------------------------------------
+
+
+TEXT_LOG_LINE = re_compile(r"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d,\d{3} 0b[01]+ ")
+"""Pattern of a line in the text log of ICOtronic"""
+
+
+def read_text_log(filepath: str | PathLike[str]) -> Iterator[CANMessage]:
+    """Read the frames of an ICOtronic text log file
+
+    Args:
+
+        filepath:
+            The path of a text log file (``can.log``)
+
+    Returns:
+
+        An iterator over the recorded frames
+
+    Examples:
+
+        Import required library code
+
+        >>> from tempfile import TemporaryDirectory
+
+        Read an example log file
+
+        >>> with TemporaryDirectory() as directory:
+        ...     filepath = Path(directory) / "can.log"
+        ...     _ = filepath.write_text(
+        ...         "2026-01-01 12:00:00,123 0b00000000000000110001111000001 "
+        ...         "2 0x1 0xfe # [SPU 1 → STH 1, Block: System, ...]\\n"
+        ...         "2026-01-01 12:00:01,000 ERROR Some error\\n",
+        ...         encoding="utf-8")
+        ...     messages = list(read_text_log(filepath))
+        >>> len(messages)
+        1
+        >>> Message(messages[0]) # doctest:+NORMALIZE_WHITESPACE
+        0b00000000000000110001111000001 2 0x1 0xfe
+        # [SPU 1 → STH 1, Block: System, Command: Reset, Request]
+
+    """
+
+    last_second = ""
+    second_timestamp = 0.0
+    with open(filepath, encoding="utf-8") as log_file:
+        for line in log_file:
+            if TEXT_LOG_LINE.match(line) is None:
+                continue  # Skip other log output (e.g. errors)
+
+            date, time, identifier, length, *payload = line.split(" #", 1)[
+                0
+            ].split()
+            second, milliseconds = time.split(",")
+            # Parsing the date is slow, so we only do it once per second
+            if second != last_second:
+                last_second = second
+                second_timestamp = datetime.strptime(
+                    f"{date} {second}", "%Y-%m-%d %H:%M:%S"
+                ).timestamp()
+
+            yield CANMessage(
+                timestamp=second_timestamp + int(milliseconds) / 1000,
+                arbitration_id=int(identifier[2:], 2),
+                is_extended_id=True,
+                data=bytes(int(byte, 16) for byte in payload[: int(length)]),
+            )
+
+
+def read_trace(filepath: str | PathLike[str]) -> Iterator[CANMessage]:
+    """Read the frames of a recorded CAN trace
+
+    Args:
+
+        filepath:
+            The path of a text log file of ICOtronic or a log file supported
+            by python-can (e.g. ASC or BLF)
+
+    Returns:
+
+        An iterator over the recorded frames
+
+    """
+
+    path = Path(filepath)
+    if path.suffix.lower() == ".log":
+        with open(path, encoding="utf-8") as log_file:
+            first_line = log_file.readline()
+        # Python-can uses the extension “.log” for the format of `candump`
+        if TEXT_LOG_LINE.match(first_line) is not None:
+            return read_text_log(path)
+
+    return iter(LogReader(path))
+
+
+def analyze_trace(
+    filepath: str | PathLike[str],
+    interval: float = 1,
+    bitrate: int = 1_000_000,
+) -> TraceAnalyzer:
+    """Analyze a recorded CAN trace
+
+    Args:
+
+        filepath:
+            The path of a text log file of ICOtronic or a log file supported
+            by python-can (e.g. ASC or BLF)
+
+        interval:
+            The length of the time intervals (in seconds) used to calculate
+            the bus load
+
+        bitrate:
+            The bitrate of the CAN bus in bits per second
+
+    Returns:
+
+        The analyzer containing the statistics of the trace
+
+    """
+
+    analyzer = TraceAnalyzer(interval, bitrate)
+    add = analyzer.add
+    for message in read_trace(filepath):
+        if message.is_error_frame or message.is_remote_frame:
+            continue
+        add(message.timestamp, message.arbitration_id, bytes(message.data))
+    analyzer.finish()
+
+    return analyzer
+
+
+# -- Main ---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    from doctest import testmod
+
+    testmod()
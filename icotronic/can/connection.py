@@ -105,11 +105,15 @@ class Connection:
 
         # We must set the event loop explicitly, otherwise the code will use
         # the synchronous API of python-can.
+        logger = Logger()
         self.notifier = Notifier(
-            self.bus, listeners=[Logger()], loop=get_running_loop()
+            self.bus, listeners=[logger], loop=get_running_loop()
         )
+        spu = SPU(self.bus, self.notifier)
+        # The notifier only handles received frames
+        spu.scheduler.listeners.append(logger)
 
-        return STU(SPU(self.bus, self.notifier))
+        return STU(spu)
 
     async def __aexit__(
         self,
@@ -21,3 +21,7 @@ class ErrorResponseError(CANConnectionError):
 
 class NoResponseError(CANConnectionError):
     """Thrown if no response message for a request was received"""
+
+
+class EEPROMVerificationError(CANConnectionError):
+    """Thrown if EEPROM data differs from the data written before"""
@@ -0,0 +1,278 @@
+"""Support for tracking the latency of requests to ICOtronic nodes"""
+
+# -- Imports ------------------------------------------------------------------
+
+from __future__ import annotations
+
+from bisect import bisect_left
+
+# -- Classes ------------------------------------------------------------------
+
+
+# pylint: disable=too-many-instance-attributes
+
+
+class RoundTripTime:
+    """Estimate the round trip time of requests and derive timeouts from it
+
+    The class uses the algorithm of TCP (`RFC 6298`_) to calculate a
+    smoothed round trip time and its variation. The retransmission timeout
+    of the first attempt is based on these values. Every further attempt
+    doubles the timeout, up to four times the timeout of the first attempt
+    (and at most ``maximum_timeout``). All attempts of a single request
+    wait at most ``total_timeout`` seconds for a response.
+
+    .. _RFC 6298: https://www.rfc-editor.org/rfc/rfc6298
+
+    Args:
+
+        minimum_timeout:
+            The smallest timeout in seconds
+
+        maximum_timeout:
+            The largest timeout in seconds
+
+        total_timeout:
+            The maximum time in seconds all attempts of a request wait for
+            a response
+
+    Examples:
+
+        Without measured round trip times the timeouts use a fixed schedule
+
+        >>> rtt = RoundTripTime()
+        >>> [rtt.timeout(attempt) for attempt in range(1, 4)]
+        [0.6, 0.7, 0.8]
+
+        A request stops after the attempts that fit into the total timeout
+
+        >>> rtt.schedule(attempts=10)
+        [0.6, 0.7, 0.8, 0.9, 1.0]
+
+        Add some measured round trip times
+
+        >>> for value in (0.02, 0.03, 0.025, 0.02):
+        ...     rtt.add(value)
+        >>> rtt # doctest:+NORMALIZE_WHITESPACE
+        Samples: 4, Smoothed RTT: 21.50 ms, RTT Variation: 6.76 ms,
+        Timeout: 100.00 ms, Timeouts: 0
+
+        Fast responses lead to short timeouts
+
+        >>> timeouts = rtt.schedule(attempts=10)
+        >>> timeouts
+        [0.1, 0.2, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4]
+        >>> round(sum(timeouts), 1)
+        3.5
+
+        Slow responses (e.g. relayed via Bluetooth) increase the timeout
+
+        >>> slow = RoundTripTime()
+        >>> for value in (0.3, 0.35, 0.3):
+        ...     slow.add(value)
+        >>> [round(timeout, 2) for timeout in slow.schedule(attempts=10)]
+        [0.69, 1.37, 2]
+
+        Get the latency histogram
+
+        >>> rtt.histogram()
+        {0.025: 3, 0.05: 1}
+
+    """
+
+    BUCKETS = (
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        float("inf"),
+    )
+    """Upper bounds (in seconds) of the latency histogram buckets"""
+
+    ALPHA = 1 / 8
+    """Weight of new samples for the smoothed round trip time"""
+
+    BETA = 1 / 4
+    """Weight of new samples for the round trip time variation"""
+
+    BACKOFF_LIMIT = 4
+    """Maximum factor between the timeout of a retry and the first attempt"""
+
+    def __init__(
+        self,
+        minimum_timeout: float = 0.1,
+        maximum_timeout: float = 2,
+        total_timeout: float = 5,
+    ) -> None:
+
+        self.minimum_timeout = minimum_timeout
+        self.maximum_timeout = maximum_timeout
+        self.total_timeout = total_timeout
+
+        self.smoothed: float | None = None
+        """Smoothed round trip time in seconds"""
+
+        self.variation = 0.0
+        """Round trip time variation in seconds"""
+
+        self.samples = 0
+        """Number of measured round trip times"""
+
+        self.timeouts = 0
+        """Number of requests that timed out"""
+
+        self.counts = [0] * len(self.BUCKETS)
+
+    def __repr__(self) -> str:
+        """Get the textual representation of the round trip time
+
+        Returns:
+
+            A string representing the round trip time statistics
+
+        Examples:
+
+            Get the representation without measured round trip times
+
+            >>> RoundTripTime()
+            Samples: 0
+
+        """
+
+        if self.smoothed is None:
+            return "Samples: 0"
+
+        return ", ".join([
+            f"Samples: {self.samples}",
+            f"Smoothed RTT: {self.smoothed * 1000:.2f} ms",
+            f"RTT Variation: {self.variation * 1000:.2f} ms",
+            f"Timeout: {self.timeout() * 1000:.2f} ms",
+            f"Timeouts: {self.timeouts}",
+        ])
+
+    def add(self, rtt: float) -> None:
+        """Add a measured round trip time
+
+        Args:
+
+            rtt:
+                The time between sending a request and receiving its
+                response in seconds
+
+        """
+
+        if self.smoothed is None:
+            self.smoothed = rtt
+            self.variation = rtt / 2
+        else:
+            self.variation += self.BETA * (
+                abs(self.smoothed - rtt) - self.variation
+            )
+            self.smoothed += self.ALPHA * (rtt - self.smoothed)
+
+        self.samples += 1
+        self.counts[bisect_left(self.BUCKETS, rtt)] += 1
+
+    def timeout(self, attempt: int = 1) -> float:
+        """Get the timeout for a certain attempt of a request
+
+        Args:
+
+            attempt:
+                The number of the attempt (starting with ``1``)
+
+        Returns:
+
+            The time in seconds to wait for a response
+
+        """
+
+        if self.smoothed is None:
+            # Fixed schedule used before the first response
+            return round(min(attempt * 0.1 + 0.5, self.maximum_timeout), 3)
+
+        timeout = max(self.smoothed + 4 * self.variation, self.minimum_timeout)
+        backoff = min(2 ** (attempt - 1), self.BACKOFF_LIMIT)
+
+        return min(timeout * backoff, self.maximum_timeout)
+
+    def schedule(
+        self, attempts: int, minimum_timeout: float = 0
+    ) -> list[float]:
+        """Get the timeouts of all attempts of a request
+
+        The sum of the timeouts is at most :attr:`total_timeout`, i.e. the
+        returned list might contain less timeouts than the requested number
+        of attempts. It always contains at least the timeout of the first
+        attempt though.
+
+        Args:
+
+            attempts:
+                The maximum number of attempts
+
+            minimum_timeout:
+                The smallest timeout of a single attempt in seconds
+
+        Returns:
+
+            The time in seconds to wait for a response in each attempt
+
+        Examples:
+
+            Use a larger minimum timeout
+
+            >>> RoundTripTime().schedule(attempts=10, minimum_timeout=1.5)
+            [1.5, 1.5, 1.5]
+
+        """
+
+        timeouts: list[float] = []
+        remaining = self.total_timeout
+        for attempt in range(1, attempts + 1):
+            timeout = max(self.timeout(attempt), minimum_timeout)
+            if timeouts and timeout > remaining:
+                break
+            timeouts.append(timeout)
+            remaining -= timeout
+
+        return timeouts
+
+    def add_timeout(self) -> None:
+        """Count a request attempt that did not receive a response in time"""
+
+        self.timeouts += 1
+
+    def histogram(self) -> dict[float, int]:
+        """Get the distribution of the measured round trip times
+
+        Returns:
+
+            A dictionary that maps the upper bound of every non-empty bucket
+            (in seconds) to the number of round trip times in this bucket
+
+        """
+
+        return {
+            bound: count
+            for bound, count in zip(self.BUCKETS, self.counts)
+            if count > 0
+        }
+
+
+# pylint: enable=too-many-instance-attributes
+
+# -- Main ---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    from doctest import testmod
+
+    testmod()
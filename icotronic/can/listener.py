@@ -6,14 +6,21 @@ from __future__ import annotations
 
 from asyncio import Queue
 from collections.abc import Sequence
-from logging import getLogger
+from logging import DEBUG, getLogger, Handler, WARNING
+from logging.handlers import QueueListener
+from queue import SimpleQueue
 from typing import NamedTuple
 
 from can import Listener, Message as CANMessage
 
 from icotronic.can.protocol.message import Message
+from icotronic.can.recorder import Recorder
 from icotronic.config import settings
-from icotronic.utility.log import get_log_file_handler
+from icotronic.utility.log import (
+    DeferredQueueHandler,
+    get_log_file_handler,
+    get_log_filepath,
+)
 
 # -- Classes ------------------------------------------------------------------
 
@@ -32,9 +39,48 @@ class Response(NamedTuple):
 
 
 class Logger(Listener):
-    """Log ICOtronic CAN messages in a machine and human readable format"""
+    """Log ICOtronic CAN messages in a machine and human readable format
 
-    def __init__(self):
+    If the log level does not include debug messages, then the logger ignores
+    received messages without doing any work. Otherwise a separate thread
+    formats and writes the messages, so the receive thread only has to queue
+    them.
+
+    In binary mode the logger records the raw frames in the file ``can.blf``
+    instead of writing the human readable text to ``can.log``. You can
+    convert the recorded frames into text later (e.g. with ``icon log``).
+
+    The notifier only forwards received frames to the logger. To log sent
+    frames too, add the logger to the listeners of the scheduler that sends
+    them.
+
+    Args:
+
+        level:
+            The minimum level of log messages. If you do not specify a level,
+            then the logger uses the level from the configuration
+            (``logger.can.level``).
+
+        binary:
+            Record frames in binary format instead of text. If you do not
+            specify a value, then the logger uses the format from the
+            configuration (``logger.can.format``).
+
+    Examples:
+
+        Ignore messages, if debug logging is disabled
+
+        >>> logger = Logger(level="INFO")
+        >>> logger.enabled
+        False
+        >>> logger.on_message_received(CANMessage())
+        >>> logger.stop()
+
+    """
+
+    def __init__(
+        self, level: str | int | None = None, binary: bool | None = None
+    ) -> None:
         # This logger exists only for writing CAN messages.
         # It specifically targets a namespace that is **not** part of the
         # module library, i.e. there is no file `icotronic.can.messages.py`.
@@ -42,20 +88,62 @@ class Logger(Listener):
         self.logger.propagate = False
         # We use `Logger` in the code below, since the `.logger` attribute
         # stores internal DynaConf data
-        self.logger.setLevel(settings.Logger.can.level)
-        self.logger.addHandler(get_log_file_handler("can.log"))
+        self.logger.setLevel(
+            settings.Logger.can.level if level is None else level
+        )
+        self.enabled = self.logger.isEnabledFor(DEBUG)
+        """States if the logger writes received messages"""
+
+        if binary is None:
+            binary = settings.Logger.can.format == "binary"
+
+        self.queue_listener: QueueListener | None = None
+        self.recorder: Recorder | None = None
+        # Handler for errors (and text messages)
+        file_handler = get_log_file_handler("can.log")
+        self.handlers: list[Handler] = [file_handler]
+        if self.enabled and binary:
+            self.recorder = Recorder(get_log_filepath("can.blf"))
+            file_handler.setLevel(WARNING)
+        elif self.enabled:
+            queue: SimpleQueue = SimpleQueue()
+            self.queue_listener = QueueListener(queue, file_handler)
+            self.queue_listener.start()
+            self.handlers = [DeferredQueueHandler(queue)]
+        for handler in self.handlers:
+            self.logger.addHandler(handler)
 
     def on_message_received(self, msg: CANMessage) -> None:
-        """React to a received message on the bus
+        """Log a received or sent message
 
         Args:
 
             msg:
-                The received CAN message the notifier should react to
+                The CAN message that should be logged
 
         """
 
-        self.logger.debug("%s", Message(msg))
+        if not self.enabled:
+            return
+
+        if self.recorder is not None:
+            self.recorder.on_message_received(msg)
+            return
+
+        # Creating the record directly avoids the (expensive) lookup of
+        # the caller’s stack frame in `logger.debug`
+        logger = self.logger
+        logger.handle(
+            logger.makeRecord(
+                logger.name,
+                DEBUG,
+                __file__,
+                0,
+                "%s",
+                (Message(msg),),
+                None,
+            )
+        )
 
     def on_error(self, exc: Exception) -> None:
         """Handle any exception in the receive thread.
@@ -70,7 +158,24 @@ class Logger(Listener):
         self.logger.error("Error while monitoring CAN bus data: %s", exc)
 
     def stop(self) -> None:
-        """Stop handling new messages"""
+        """Stop handling new messages
+
+        The method writes all queued messages before it returns.
+
+        """
+
+        for handler in self.handlers:
+            self.logger.removeHandler(handler)
+            handler.close()
+        self.handlers = []
+        if self.queue_listener is not None:
+            self.queue_listener.stop()
+            for handler in self.queue_listener.handlers:
+                handler.close()
+            self.queue_listener = None
+        if self.recorder is not None:
+            self.recorder.stop()
+            self.recorder = None
 
 
 class ResponseListener(Listener):
@@ -126,11 +231,7 @@ class ResponseListener(Listener):
         expected_data = self.expected_data
         error_reason = ""
         if normal_response and expected_data is not None:
-            error_response |= any(
-                expected != data
-                for expected, data in zip(expected_data, msg.data)
-                if expected is not None
-            )
+            error_response |= not self.matches(msg)
             error_reason = (
                 "Unexpected response message data:\n"
                 f"Expected: {list(expected_data)}\n"
@@ -148,6 +249,44 @@ class ResponseListener(Listener):
                 )
             )
 
+    def matches(self, msg: CANMessage) -> bool:
+        """Check if the data of a message contains the expected data
+
+        Args:
+
+            msg:
+                The CAN message that should be checked
+
+        Returns:
+
+            ``True``, if the message data matches the expected data or no
+            data was expected, ``False`` otherwise
+
+        Examples:
+
+            Check the data of some messages
+
+            >>> request = Message(block="System", block_command="Bluetooth",
+            ...                   sender="SPU 1", receiver="STU 1",
+            ...                   request=True, data=[5, 0])
+            >>> listener = ResponseListener(request, expected_data=[5, None])
+            >>> listener.matches(CANMessage(data=[5, 1]))
+            True
+            >>> listener.matches(CANMessage(data=[6, 0]))
+            False
+
+        """
+
+        expected_data = self.expected_data
+        if expected_data is None:
+            return True
+
+        return all(
+            expected == data
+            for expected, data in zip(expected_data, msg.data)
+            if expected is not None
+        )
+
     async def on_message(self) -> Response | None:
         """Return answer messages for the specified message identifier
 
@@ -179,6 +318,242 @@ class ResponseListener(Listener):
         """Stop handling new messages"""
 
 
+class ResponseRouter(Listener):
+    """Forward response messages to the listeners waiting for them
+
+    Instead of adding one listener per request to the notifier, you can add
+    the listeners to a single router. For every received message the router
+    only needs a single dictionary lookup to find the interested listeners,
+    regardless of the number of pending requests.
+
+    If multiple pending requests expect a response with the same identifier
+    (e.g. Bluetooth commands), then the router only forwards a response to
+    the listener that expects its data. Requests should therefore never
+    wait for responses they can not tell apart at the same time (see
+    :func:`expected_data_overlaps`).
+
+    Examples:
+
+        Import required library code
+
+        >>> from icotronic.can.protocol.identifier import Identifier
+
+        Route the response of a request to the waiting listener
+
+        >>> router = ResponseRouter()
+        >>> request = Message(block="System", block_command="Reset",
+        ...                   sender="SPU 1", receiver="STU 1",
+        ...                   request=True)
+        >>> listener = ResponseListener(request, expected_data=None)
+        >>> router.add(listener)
+        >>> response = CANMessage(
+        ...     arbitration_id=request.identifier().acknowledge().value)
+        >>> router.on_message_received(response)
+        >>> listener.queue.qsize()
+        1
+
+        Messages with other identifiers are ignored
+
+        >>> other = CANMessage(arbitration_id=Identifier(
+        ...     block="Streaming", block_command=0x20, sender="STH 1",
+        ...     receiver="SPU 1", request=False).value)
+        >>> router.on_message_received(other)
+        >>> listener.queue.qsize()
+        1
+
+        Responses with the same identifier are forwarded based on their data
+
+        >>> bluetooth = [
+        ...     Message(block="System", block_command="Bluetooth",
+        ...             sender="SPU 1", receiver="STU 1", request=True,
+        ...             data=[subcommand, 0])
+        ...     for subcommand in (5, 6)
+        ... ]
+        >>> first, second = [ResponseListener(request, [request.data[0]])
+        ...                  for request in bluetooth]
+        >>> router.add(first)
+        >>> router.add(second)
+        >>> router.on_message_received(CANMessage(
+        ...     arbitration_id=bluetooth[1].identifier().acknowledge().value,
+        ...     data=[6, 0]))
+        >>> first.queue.qsize(), second.queue.qsize()
+        (0, 1)
+
+        If the data of a response matches multiple requests, then the router
+        ignores the response, since it does not know which request the
+        response belongs to
+
+        >>> router.remove(first)
+        >>> router.remove(second)
+        >>> mac_address = [
+        ...     Message(block="System", block_command="Bluetooth",
+        ...             sender="SPU 1", receiver="STU 1", request=True,
+        ...             data=[17, node])
+        ...     for node in (0, 1)
+        ... ]
+        >>> first, second = [ResponseListener(request, [17, None])
+        ...                  for request in mac_address]
+        >>> router.add(first)
+        >>> router.add(second)
+        >>> router.on_message_received(CANMessage(
+        ...     arbitration_id=mac_address[0].identifier().acknowledge().value,
+        ...     data=[17, 0]))
+        >>> first.queue.qsize(), second.queue.qsize()
+        (0, 0)
+
+        Removed listeners do not receive responses anymore
+
+        >>> router.remove(listener)
+        >>> router.on_message_received(response)
+        >>> listener.queue.qsize()
+        1
+
+    """
+
+    def __init__(self) -> None:
+
+        self.listeners: dict[int, list[ResponseListener]] = {}
+
+    def add(self, listener: ResponseListener) -> None:
+        """Forward responses to a listener
+
+        Args:
+
+            listener:
+                The listener that should receive responses
+
+        """
+
+        for identifier in (
+            listener.acknowledgment_identifier.value,
+            listener.error_identifier.value,
+        ):
+            self.listeners.setdefault(identifier, []).append(listener)
+
+    def remove(self, listener: ResponseListener) -> None:
+        """Stop forwarding responses to a listener
+
+        Args:
+
+            listener:
+                The listener that should not receive responses anymore
+
+        """
+
+        for identifier in (
+            listener.acknowledgment_identifier.value,
+            listener.error_identifier.value,
+        ):
+            listeners = self.listeners.get(identifier)
+            if listeners is None:
+                continue
+            if listener in listeners:
+                listeners.remove(listener)
+            if not listeners:
+                del self.listeners[identifier]
+
+    def on_message_received(self, msg: CANMessage) -> None:
+        """Forward a received message to the listeners waiting for it
+
+        Args:
+
+            msg:
+                The received CAN message the notifier should react to
+
+        """
+
+        listeners = self.listeners.get(msg.arbitration_id)
+        if listeners is None:
+            return
+
+        if len(listeners) > 1:
+            # Only forward the message to the request expecting its data.
+            # If there is no such request, then all listeners receive the
+            # message and treat it as unexpected response.
+            matching = [
+                listener for listener in listeners if listener.matches(msg)
+            ]
+            if len(matching) > 1:
+                # We can not know which request the response belongs to.
+                # Ignoring the response makes the requests try again.
+                getLogger(__name__).warning(
+                    "Ignoring ambiguous response: %s", Message(msg)
+                )
+                return
+            if matching:
+                listeners = matching
+
+        for listener in tuple(listeners):
+            listener.on_message_received(msg)
+
+    def on_error(self, exc: Exception) -> None:
+        """Handle any exception in the receive thread
+
+        Args:
+
+            exc:
+                The exception causing the thread to stop
+
+        """
+
+        getLogger().error("Error while monitoring CAN bus data: %s", exc)
+
+    def stop(self) -> None:
+        """Stop handling new messages"""
+
+
+# -- Functions ----------------------------------------------------------------
+
+
+def expected_data_overlaps(
+    first: bytearray | Sequence[int | None] | None,
+    second: bytearray | Sequence[int | None] | None,
+) -> bool:
+    """Check if a response might match two different expectations
+
+    Args:
+
+        first:
+            The first expected response data (see :class:`ResponseListener`)
+
+        second:
+            The second expected response data
+
+    Returns:
+
+        ``True``, if there is response data that matches both expectations,
+        ``False`` otherwise
+
+    Examples:
+
+        Responses to requests for the names of different sensor nodes differ
+
+        >>> expected_data_overlaps([5, 0], [5, 1])
+        False
+
+        Responses to requests for the MAC addresses of different sensor
+        nodes look the same
+
+        >>> expected_data_overlaps([17, None], [17, None])
+        True
+
+        Every response matches requests without expected data
+
+        >>> expected_data_overlaps(None, [5, 0])
+        True
+
+    """
+
+    if first is None or second is None:
+        return True
+
+    return all(
+        expected == other
+        for expected, other in zip(first, second)
+        if expected is not None and other is not None
+    )
+
+
 # -- Main ---------------------------------------------------------------------
 
 if __name__ == "__main__":
@@ -4,10 +4,22 @@
 
 from __future__ import annotations
 
+from asyncio import gather, Lock
+from collections.abc import Callable
+from logging import getLogger
+from typing import Any
+
+from netaddr import EUI
 from semantic_version import Version
 
+from icotronic.can.error import ErrorResponseError, NoResponseError
 from icotronic.can.node.eeprom.node import NodeEEPROM
 from icotronic.can.node.id import NodeId
+from icotronic.can.node.metadata import (
+    ProductData,
+    ProductDataCache,
+    product_data_cache,
+)
 from icotronic.can.node.spu import SPU
 from icotronic.can.protocol.message import Message
 from icotronic.can.status import State
@@ -40,6 +52,15 @@ class Node:
         self.id = node_id
         self.eeprom = eeprom_class(spu, node_id)
 
+        self.product_data_cache: ProductDataCache = product_data_cache
+        """Cache used to store the product data of the node"""
+        self.product_data: ProductData | None = None
+        self.product_data_fields: dict[str, Any] = {}
+        """Product data fields read successfully (by field name)"""
+        self.product_data_writes = 0
+        self.mac_address: EUI | None = None
+        self.product_data_lock = Lock()
+
     # ==========
     # = System =
     # ==========
@@ -89,6 +110,12 @@ class Node:
             minimum_timeout=1,
         )
 
+        # The reset might be part of a firmware update or EEPROM change
+        self.product_data = None
+        self.product_data_fields = {}
+        if self.mac_address is not None:
+            self.product_data_cache.invalidate(self.mac_address)
+
     # -----------------
     # - Get/Set State -
     # -----------------
@@ -152,6 +179,278 @@ class Node:
     # = Product Data =
     # ================
 
+    async def get_product_data(self, refresh: bool = False) -> ProductData:
+        """Retrieve the product data of the node
+
+        The coroutine reads the MAC address, the firmware version and the
+        number of EEPROM write requests of the node to check if the product
+        data cache (:attr:`product_data_cache`) contains valid data for the
+        node. Otherwise it reads all product data with concurrent requests
+        and stores it in the cache. If the node does not answer one of the
+        check requests, then the coroutine reads the product data without
+        using the cache. Further calls on the same object return the data
+        without any requests, as long as nobody wrote the EEPROM using
+        :attr:`eeprom`.
+
+        Args:
+
+            refresh:
+                Read the product data from the node, even if there is valid
+                cached data
+
+        Returns:
+
+            The product data of the node
+
+        Raises:
+
+            NoResponseError:
+                If the node did not respond to one of the requests
+
+            ErrorResponseError:
+                If the node answered one of the requests with an error
+                message (the fields read successfully are still available
+                in :attr:`product_data_fields`)
+
+        Examples:
+
+            Import required library code
+
+            >>> from asyncio import run
+            >>> from icotronic.can.connection import Connection
+
+            Read the product data of STU 1
+
+            >>> async def read_product_data():
+            ...     async with Connection() as stu:
+            ...         return await stu.get_product_data()
+            >>> product_data = run(read_product_data())
+            >>> product_data.release_name
+            'Valerie'
+
+        """
+
+        async with self.product_data_lock:
+            writes = self.eeprom.write_requests
+            if (
+                self.product_data is not None
+                and not refresh
+                and writes == self.product_data_writes
+            ):
+                return self.product_data
+
+            results: tuple[
+                EUI | BaseException,
+                Version | BaseException,
+                int | BaseException,
+            ] = await gather(
+                self.spu.get_mac_address(self.id),
+                self.get_firmware_version(),
+                self.eeprom.read_write_request_counter(),
+                return_exceptions=True,
+            )
+            mac_address, firmware_version, write_counter = results
+            errors = [
+                result
+                for result in results
+                if isinstance(result, BaseException)
+            ]
+            for error in errors:
+                if not isinstance(
+                    error, (ErrorResponseError, NoResponseError)
+                ):
+                    raise error
+            fields: dict[str, Any] = {"firmware_version": firmware_version}
+            product_data = None
+            if (
+                isinstance(mac_address, EUI)
+                and isinstance(firmware_version, Version)
+                and isinstance(write_counter, int)
+            ):
+                self.mac_address = mac_address
+                cache = self.product_data_cache
+                if not refresh:
+                    product_data = cache.get(
+                        mac_address, firmware_version, write_counter
+                    )
+                if product_data is None:
+                    fields.update(await self._read_product_data())
+                    product_data = self._create_product_data(fields)
+                    if product_data is not None:
+                        cache.put(mac_address, product_data, write_counter)
+            else:
+                getLogger(__name__).debug(
+                    "Reading product data of “%s” without cache: %s",
+                    self.id,
+                    errors[0],
+                )
+                fields.update(await self._read_product_data())
+                product_data = self._create_product_data(fields)
+
+            self.product_data = product_data
+            self.product_data_writes = writes
+            if product_data is not None:
+                self.product_data_fields = product_data._asdict()
+                return product_data
+
+            self.product_data_fields = {
+                name: value
+                for name, value in fields.items()
+                if not isinstance(value, BaseException)
+            }
+            raise next(
+                value
+                for value in fields.values()
+                if isinstance(value, BaseException)
+            )
+
+    @staticmethod
+    def _create_product_data(fields: dict[str, Any]) -> ProductData | None:
+        """Create product data from the values of the product data fields
+
+        Args:
+
+            fields:
+                The values of the product data fields; a field that could
+                not be read stores the exception that occurred
+
+        Returns:
+
+            The product data, if all fields could be read, ``None``
+            otherwise
+
+        Raises:
+
+            BaseException:
+                If a field stores an exception that is not the result of a
+                failed request
+
+        """
+
+        for value in fields.values():
+            if isinstance(value, BaseException) and not isinstance(
+                value, (ErrorResponseError, NoResponseError)
+            ):
+                raise value
+
+        if any(isinstance(value, BaseException) for value in fields.values()):
+            return None
+
+        return ProductData(**fields)
+
+    async def _read_product_data(self) -> dict[str, Any]:
+        """Read the product data of the node using concurrent requests
+
+        Returns:
+
+            The values of the product data fields (except for the firmware
+            version); a field that could not be read stores the exception
+            that occurred
+
+        """
+
+        def version(data: list[bytearray]) -> Version:
+            major, minor, patch = data[0][-3:]
+            return Version(major=major, minor=minor, patch=patch)
+
+        fields: dict[
+            str, tuple[dict[str, str], Callable[[list[bytearray]], Any]]
+        ] = {
+            "gtin": (
+                {"GTIN": "GTIN"},
+                lambda data: int.from_bytes(data[0], byteorder="little"),
+            ),
+            "hardware_version": (
+                {"Hardware Version": "hardware version"},
+                version,
+            ),
+            "release_name": (
+                {"Release Name": "firmware release name"},
+                lambda data: convert_bytes_to_text(data[0], until_null=True),
+            ),
+            "serial_number": (
+                {
+                    f"Serial Number {part}": (
+                        f"part {part} of the serial number"
+                    )
+                    for part in range(1, 5)
+                },
+                lambda data: convert_bytes_to_text(bytearray().join(data)),
+            ),
+            "product_name": (
+                {
+                    f"Product Name {part}": f"part {part} of the product name"
+                    for part in range(1, 17)
+                },
+                lambda data: convert_bytes_to_text(bytearray().join(data)),
+            ),
+            "oem_data": (
+                {
+                    f"OEM Free Use {part}": f"part {part} of the OEM data"
+                    for part in range(1, 9)
+                },
+                bytes().join,
+            ),
+        }
+
+        node = self.id
+        # Read every field separately, so that a single failed request does
+        # not make the other fields unavailable
+        responses = await gather(
+            *(
+                self.spu.gather_requests(
+                    self.spu.product_data_request(
+                        node=node,
+                        description=f"read {description} of node “{node}”",
+                        block_command=block_command,
+                    )
+                    for block_command, description in block_commands.items()
+                )
+                for block_commands, _ in fields.values()
+            ),
+            return_exceptions=True,
+        )
+
+        return {
+            name: (
+                result
+                if isinstance(result, BaseException)
+                else convert([response.data for response in result])
+            )
+            for (name, (_, convert)), result in zip(fields.items(), responses)
+        }
+
+    async def _get_product_data_field(self, name: str) -> Any:
+        """Retrieve a single field of the product data
+
+        In contrast to :meth:`get_product_data` the coroutine only fails, if
+        it is not able to read the requested field.
+
+        Args:
+
+            name:
+                The name of the product data field
+
+        Returns:
+
+            The value of the product data field
+
+        """
+
+        fields = self.product_data_fields
+        if (
+            name in fields
+            and self.eeprom.write_requests == self.product_data_writes
+        ):
+            return fields[name]
+
+        try:
+            return getattr(await self.get_product_data(), name)
+        except (ErrorResponseError, NoResponseError):
+            if name not in self.product_data_fields:
+                raise
+            return self.product_data_fields[name]
+
     async def get_gtin(self) -> int:
         """Retrieve the GTIN (Global Trade Identification Number) of the node
 
@@ -177,14 +476,7 @@ class Node:
 
         """
 
-        node = self.id
-        response = await self.spu.request_product_data(
-            node=node,
-            description=f"read GTIN of node “{node}”",
-            block_command="GTIN",
-        )
-
-        return int.from_bytes(response.data, byteorder="little")
+        return await self._get_product_data_field("gtin")
 
     async def get_hardware_version(self) -> Version:
         """Retrieve the hardware version of a node
@@ -211,15 +503,7 @@ class Node:
 
         """
 
-        node = self.id
-        response = await self.spu.request_product_data(
-            node=node,
-            description=f"read hardware version of node “{node}”",
-            block_command="Hardware Version",
-        )
-
-        major, minor, patch = response.data[-3:]
-        return Version(major=major, minor=minor, patch=patch)
+        return await self._get_product_data_field("hardware_version")
 
     async def get_firmware_version(self) -> Version:
         """Retrieve the firmware version of the node
@@ -280,15 +564,7 @@ class Node:
 
         """
 
-        node = self.id
-        response = await self.spu.request_product_data(
-            node=node,
-            description=f"read firmware release name of node “{node}”",
-            block_command="Release Name",
-        )
-
-        release_name = convert_bytes_to_text(response.data, until_null=True)
-        return release_name
+        return await self._get_product_data_field("release_name")
 
     async def get_serial_number(self) -> str:
         """Retrieve the serial number of a node
@@ -317,23 +593,7 @@ class Node:
 
         """
 
-        async def get_serial_number_part(part: int) -> bytearray:
-            """Retrieve a part of the serial number"""
-            node = self.id
-            response = await self.spu.request_product_data(
-                node=node,
-                description=(
-                    f"read part {part} of the serial number of node “{node}”"
-                ),
-                block_command=f"Serial Number {part}",
-            )
-            return response.data
-
-        serial_number_bytes = bytearray()
-        for part in range(1, 5):
-            serial_number_bytes.extend(await get_serial_number_part(part))
-
-        return convert_bytes_to_text(serial_number_bytes)
+        return await self._get_product_data_field("serial_number")
 
     async def get_product_name(self) -> str:
         """Retrieve the product name of a node
@@ -362,24 +622,7 @@ class Node:
 
         """
 
-        async def get_product_name_part(part: int) -> bytearray:
-            """Retrieve a part of the product name"""
-
-            node = self.id
-            response = await self.spu.request_product_data(
-                node=node,
-                description=(
-                    f"read part {part} of the product name of node “{node}”"
-                ),
-                block_command=f"Product Name {part}",
-            )
-            return response.data
-
-        product_name_bytes = bytearray()
-        for part in range(1, 17):
-            product_name_bytes.extend(await get_product_name_part(part))
-
-        return convert_bytes_to_text(product_name_bytes)
+        return await self._get_product_data_field("product_name")
 
     async def get_oem_data(self) -> bytearray:
         """Retrieve the OEM (free use) data
@@ -408,23 +651,7 @@ class Node:
 
         """
 
-        async def get_oem_part(part: int) -> bytearray:
-            """Retrieve a part of the OEM data"""
-            node = self.id
-            response = await self.spu.request_product_data(
-                node=node,
-                description=(
-                    f"read part {part} of the OEM data of node “{node}”"
-                ),
-                block_command=f"OEM Free Use {part}",
-            )
-            return response.data
-
-        oem_data = bytearray()
-        for part in range(1, 9):
-            oem_data.extend(await get_oem_part(part))
-
-        return oem_data
+        return bytearray(await self._get_product_data_field("oem_data"))
 
 
 # -- Main ---------------------------------------------------------------------
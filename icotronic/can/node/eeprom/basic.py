@@ -2,17 +2,36 @@
 
 # -- Imports ------------------------------------------------------------------
 
+from collections.abc import Mapping
+from logging import getLogger
 from struct import pack, unpack
+from typing import Any, NamedTuple
 
+from icotronic.can.error import (
+    EEPROMVerificationError,
+    ErrorResponseError,
+    NoResponseError,
+)
 from icotronic.can.protocol.message import Message
+from icotronic.can.node.eeprom.snapshot import EEPROMField, EEPROMSnapshot
 from icotronic.can.node.id import NodeId
-from icotronic.can.node.spu import SPU
+from icotronic.can.node.spu import Request, SPU
 
 from icotronic.utility.data import convert_bytes_to_text
 
 # -- Classes ------------------------------------------------------------------
 
 
+class WriteResult(NamedTuple):
+    """Number of (skipped) write requests of a difference based write"""
+
+    written: int = 0
+    """Number of write requests sent to the node"""
+
+    skipped: int = 0
+    """Number of write requests not sent, since the data did not change"""
+
+
 class EEPROM:
     """Read and write EEPROM data of ICOtronic nodes
 
@@ -26,10 +45,70 @@ class EEPROM:
 
     """
 
+    PAGE_SIZE = 256
+    """Number of bytes in a single EEPROM page"""
+
+    FIELDS: dict[str, EEPROMField] = {}
+    """Known fields of the EEPROM (used by :attr:`snapshot`)"""
+
     def __init__(self, spu: SPU, node: NodeId) -> None:
 
         self.spu = spu
         self.id = node
+        self.snapshot = EEPROMSnapshot(self)
+        """Cached data of the known EEPROM fields"""
+        self.write_requests = 0
+        """Number of write requests sent using this object"""
+
+    def _read_requests(
+        self, address: int, offset: int, length: int
+    ) -> list[Request]:
+        """Create the requests to read EEPROM data
+
+        Args:
+
+            address:
+                The page number in the EEPROM
+
+            offset:
+                The offset to the base address in the specified page
+
+            length:
+                This value specifies how many bytes you want to read
+
+        Returns:
+
+            A list of requests that read at most 4 bytes each
+
+        """
+
+        requests = []
+        reserved = [0] * 5
+        node = self.id
+        while length > 0:
+            # Read at most 4 bytes of data at once
+            read_length = 4 if length > 4 else length
+            message = Message(
+                block="EEPROM",
+                block_command="Read",
+                sender=self.spu.id,
+                receiver=node,
+                request=True,
+                data=[address, offset, read_length, *reserved],
+            )
+            # The acknowledgment contains page, offset and length of the
+            # request, so we can match concurrent requests to the same node
+            requests.append(
+                Request(
+                    message,
+                    description=f"read EEPROM data from “{node}”",
+                    response_data=[address, offset, read_length],
+                )
+            )
+            length -= read_length
+            offset += read_length
+
+        return requests
 
     async def read(self, address: int, offset: int, length: int) -> list[int]:
         """Read EEPROM data
@@ -71,33 +150,112 @@ class EEPROM:
         """
 
         read_data: list[int] = []
-        reserved = [0] * 5
         data_start = 4  # Start index of data in response message
 
-        node = self.id
-        while length > 0:
-            # Read at most 4 bytes of data at once
-            read_length = 4 if length > 4 else length
-            message = Message(
-                block="EEPROM",
-                block_command="Read",
-                sender=self.spu.id,
-                receiver=node,
-                request=True,
-                data=[address, offset, read_length, *reserved],
-            )
+        for request in self._read_requests(address, offset, length):
+            response = await self.spu.request(*request)
+            read_length = request.message.data[2]
+            data_end = data_start + read_length
+            read_data.extend(response.data[data_start:data_end])
+
+        return read_data
+
+    async def read_bulk(
+        self, address: int, offset: int, length: int
+    ) -> list[int]:
+        """Read a large amount of EEPROM data
+
+        In contrast to :meth:`read` this coroutine does not wait for the
+        response of a request, before it sends the next request. If one of
+        the (concurrent) requests fails, then the coroutine reads the data
+        again one request at a time.
+
+        Args:
+
+            address:
+                The page number in the EEPROM
+
+            offset:
+                The offset to the base address in the specified page
+
+            length:
+                This value specifies how many bytes you want to read
+
+        Returns:
+
+            A list containing the EEPROM data at the specified location
+
+        Examples:
+
+            Import required library code
 
-            response = await self.spu.request(
-                message, description=f"read EEPROM data from “{node}”"
+            >>> from asyncio import run
+            >>> from icotronic.can.connection import Connection
+
+            Read EEPROM data from STU 1
+
+            >>> async def read_eeprom():
+            ...     async with Connection() as stu:
+            ...         return await stu.eeprom.read_bulk(
+            ...             address=0, offset=0, length=64)
+            >>> data = run(read_eeprom())
+            >>> len(data)
+            64
+
+        """
+
+        requests = self._read_requests(address, offset, length)
+        try:
+            responses = await self.spu.gather_requests(requests)
+        except (ErrorResponseError, NoResponseError) as error:
+            getLogger(__name__).warning(
+                "Concurrent read of EEPROM data from “%s” failed (%s), "
+                "reading data sequentially",
+                self.id,
+                error,
             )
+            return await self.read(address, offset, length)
 
-            data_end = data_start + read_length
+        data_start = 4  # Start index of data in response message
+        read_data: list[int] = []
+        for request, response in zip(requests, responses):
+            data_end = data_start + request.message.data[2]
             read_data.extend(response.data[data_start:data_end])
-            length -= read_length
-            offset += read_length
 
         return read_data
 
+    async def read_page(self, address: int) -> list[int]:
+        """Read a whole EEPROM page
+
+        Args:
+
+            address:
+                The page number in the EEPROM
+
+        Returns:
+
+            A list containing all bytes of the EEPROM page
+
+        Examples:
+
+            Import required library code
+
+            >>> from asyncio import run
+            >>> from icotronic.can.connection import Connection
+
+            Read the first EEPROM page of STU 1
+
+            >>> async def read_page():
+            ...     async with Connection() as stu:
+            ...         return await stu.eeprom.read_page(0)
+            >>> page = run(read_page())
+            >>> len(page)
+            256
+
+        """
+
+        return await self.read_bulk(address, offset=0, length=self.PAGE_SIZE)
+
     async def read_float(self, address: int, offset: int) -> float:
         """Read EEPROM data in float format
 
@@ -236,6 +394,87 @@ class EEPROM:
         data = await self.read(address, offset, length)
         return convert_bytes_to_text(data, until_null=True)
 
+    async def read_write_request_counter(self) -> int:
+        """Retrieve the number of EEPROM write requests
+
+        Returns:
+
+            The number of write requests the node received
+
+        Examples:
+
+            Import required library code
+
+            >>> from asyncio import run
+            >>> from icotronic.can.connection import Connection
+
+            Read the EEPROM write request counter of STU 1
+
+            >>> async def read_write_request_counter():
+            ...     async with Connection() as stu:
+            ...         return await stu.eeprom.read_write_request_counter()
+            >>> counter = run(read_write_request_counter())
+            >>> counter >= 0
+            True
+
+        """
+
+        node = self.id
+        message = Message(
+            block="EEPROM",
+            block_command="Read Write Request Counter",
+            sender=self.spu.id,
+            receiver=node,
+            request=True,
+            data=[0] * 8,
+        )
+        response = await self.spu.request(
+            message,
+            description=f"read EEPROM write request counter of “{node}”",
+        )
+
+        return int.from_bytes(response.data[4:], "little")
+
+    async def _write_block(
+        self, address: int, offset: int, data: list[int]
+    ) -> None:
+        """Write at most 4 bytes of EEPROM data using a single request
+
+        Args:
+
+            address:
+                The page number in the EEPROM
+
+            offset:
+                The offset to the base address in the specified page
+
+            data:
+                The (at most 4) bytes that should be written
+
+        """
+
+        node = self.id
+        write_length = len(data)
+        # Use zeroes to fill up missing data bytes
+        write_data = [*data, *([0] * (4 - write_length))]
+
+        reserved = [0] * 1
+        message = Message(
+            block="EEPROM",
+            block_command="Write",
+            sender=self.spu.id,
+            receiver=node,
+            request=True,
+            data=[address, offset, write_length, *reserved, *write_data],
+        )
+
+        # Count the request even if it fails, since the node might still
+        # have changed the EEPROM content
+        self.write_requests += 1
+        await self.spu.request(
+            message, description=f"write EEPROM data in “{node}”"
+        )
+
     async def write(
         self,
         address: int,
@@ -295,30 +534,180 @@ class EEPROM:
             # Fill up additional data bytes
             data.extend([0] * (length - len(data)))
 
-        node = self.id
+        # Remove the (soon outdated) page from the cache before writing, so
+        # even a failed write does not leave incorrect cached data behind
+        self.snapshot.invalidate(address)
 
         while data:
             write_data = data[:4]  # Maximum of 4 bytes per message
-            write_length = len(write_data)
-            # Use zeroes to fill up missing data bytes
-            write_data.extend([0] * (4 - write_length))
+            await self._write_block(address, offset, write_data)
 
-            reserved = [0] * 1
-            message = Message(
-                block="EEPROM",
-                block_command="Write",
-                sender=self.spu.id,
-                receiver=node,
-                request=True,
-                data=[address, offset, write_length, *reserved, *write_data],
-            )
+            data = data[4:]
+            offset += len(write_data)
+
+    async def write_diff(
+        self, address: int, offset: int, data: list[int]
+    ) -> WriteResult:
+        """Write only the changed parts of EEPROM data
+
+        This coroutine compares the given data with the current EEPROM
+        content in blocks of 4 bytes (the maximum amount of data of a single
+        write request). It only writes blocks that differ and afterwards
+        reads the whole range (using concurrent requests) to verify the
+        data. The current EEPROM content is taken from :attr:`snapshot`, if
+        the EEPROM write request counter shows that nobody wrote the EEPROM
+        since the snapshot read it (see :meth:`EEPROMSnapshot.check`).
+
+        Args:
+
+            address:
+                The page number in the EEPROM
+
+            offset:
+                The offset to the base address in the specified page
+
+            data:
+                A list of byte values that should be stored at the
+                specified EEPROM location
 
-            await self.spu.request(
-                message, description=f"write EEPROM data in “{node}”"
+        Returns:
+
+            The number of sent and skipped write requests
+
+        Raises:
+
+            EEPROMVerificationError:
+                If the EEPROM data differs from the written data
+
+        Examples:
+
+            Import required library code
+
+            >>> from asyncio import run
+            >>> from icotronic.can.connection import Connection
+
+            Write the same data twice to the EEPROM of STU 1
+
+            >>> async def write_twice(data):
+            ...     async with Connection() as stu:
+            ...         await stu.eeprom.write_diff(address=10, offset=0,
+            ...                                     data=data)
+            ...         return await stu.eeprom.write_diff(address=10,
+            ...                                            offset=0, data=data)
+            >>> run(write_twice([1, 2, 3, 4, 5]))
+            WriteResult(written=0, skipped=2)
+
+        """
+
+        snapshot = self.snapshot
+        # Another client (e.g. using the daemon) might have changed the
+        # EEPROM since the snapshot read it
+        await snapshot.check()
+        counter = snapshot.write_counter
+
+        length = len(data)
+        current = snapshot.cached(address, offset, length)
+        if current is None:
+            current = await self.read_bulk(address, offset, length)
+
+        changed = [
+            (offset + start, data[start : start + 4])
+            for start in range(0, length, 4)
+            if data[start : start + 4] != current[start : start + 4]
+        ]
+
+        try:
+            for block_offset, block in changed:
+                await self._write_block(address, block_offset, block)
+
+            read_data = await self.read_bulk(address, offset, length)
+        except BaseException:
+            snapshot.invalidate(address)
+            raise
+
+        for start in range(0, length, 4):
+            read_block = read_data[start : start + 4]
+            block = data[start : start + 4]
+            if read_block != block:
+                snapshot.invalidate(address)
+                raise EEPROMVerificationError(
+                    f"EEPROM data of “{self.id}” at page {address} with "
+                    f"offset {offset + start} is {read_block} instead of "
+                    f"{block}"
+                )
+
+        snapshot.patch(address, offset, data)
+        if changed:
+            # Keep the cached data only, if nobody else wrote the EEPROM
+            # in the meantime
+            new_counter = await self.read_write_request_counter()
+            if counter is None or new_counter != counter + len(changed):
+                snapshot.invalidate()
+            snapshot.write_counter = new_counter
+
+        return WriteResult(
+            written=len(changed), skipped=(length + 3) // 4 - len(changed)
+        )
+
+    async def apply_profile(self, profile: Mapping[str, Any]) -> WriteResult:
+        """Write values of known EEPROM fields
+
+        The coroutine reads the pages of the fields into :attr:`snapshot`
+        (if necessary) and then only writes the changed parts of every page
+        (see :meth:`write_diff`).
+
+        Args:
+
+            profile:
+                A mapping from field names (see :attr:`FIELDS`) to the
+                values that should be stored in the EEPROM
+
+        Returns:
+
+            The number of sent and skipped write requests
+
+        Examples:
+
+            Import required library code
+
+            >>> from asyncio import run
+            >>> from icotronic.can.connection import Connection
+
+            Write the current name of STU 1 again
+
+            >>> async def apply_name():
+            ...     async with Connection() as stu:
+            ...         name = await stu.eeprom.read_name()
+            ...         return await stu.eeprom.apply_profile({"name": name})
+            >>> run(apply_name())
+            WriteResult(written=0, skipped=2)
+
+        """
+
+        # Remove outdated data written by other clients
+        await self.snapshot.check()
+        await self.snapshot.update(profile)
+
+        pages: dict[int, dict[int, list[int]]] = {}
+        for name, value in profile.items():
+            field = self.FIELDS[name]
+            pages.setdefault(field.address, {})[field.offset] = field.encode(
+                value, field.length
             )
 
-            data = data[4:]
-            offset += write_length
+        written = skipped = 0
+        for address, fields in sorted(pages.items()):
+            start = min(fields)
+            end = max(offset + len(data) for offset, data in fields.items())
+            cached = self.snapshot.cached(address, start, end - start)
+            assert cached is not None
+            for offset, data in fields.items():
+                cached[offset - start : offset - start + len(data)] = data
+            result = await self.write_diff(address, start, cached)
+            written += result.written
+            skipped += result.skipped
+
+        return WriteResult(written, skipped)
 
     async def write_float(
         self,
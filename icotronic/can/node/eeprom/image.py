@@ -0,0 +1,316 @@
+"""Backup and restore the EEPROM content of ICOtronic nodes
+
+An :class:`EEPROMImage` stores the data of multiple EEPROM pages together
+with a CRC-32 checksum for every page. To store the images of multiple
+nodes (e.g. STU and sensor node) in a single (JSON) file use the functions
+:func:`save_images` and :func:`load_images`.
+"""
+
+# -- Imports ------------------------------------------------------------------
+
+from __future__ import annotations
+
+from asyncio import gather
+from collections.abc import Iterable, Mapping
+from json import dump, load
+from pathlib import Path
+from typing import Any
+from zlib import crc32
+
+from icotronic.can.node.eeprom.basic import EEPROM, WriteResult
+
+# -- Attributes ---------------------------------------------------------------
+
+BACKUP_PAGES = range(16)
+"""EEPROM pages stored in a backup by default"""
+
+# -- Classes ------------------------------------------------------------------
+
+
+class EEPROMImage:
+    """Store the data of EEPROM pages
+
+    Args:
+
+        pages:
+            A mapping from page numbers to the data of the pages
+
+    Examples:
+
+        Create an image and convert it into its serializable representation
+
+        >>> image = EEPROMImage({0: [1, 2, 3, 4], 4: [0xff] * 4})
+        >>> image
+        EEPROM Image: 2 pages, 8 bytes
+        >>> serialized = image.to_dict()
+        >>> serialized["0"]
+        {'data': '01020304', 'crc32': 3057449933}
+
+        Restore the image from the serialized data
+
+        >>> EEPROMImage.from_dict(serialized) == image
+        True
+
+        Changed data will not match the checksum
+
+        >>> serialized["4"]["data"] = "fffffffe"
+        >>> EEPROMImage.from_dict(serialized)
+        Traceback (most recent call last):
+           ...
+        ValueError: Checksum of EEPROM page 4 does not match data
+
+    """
+
+    def __init__(self, pages: Mapping[int, list[int]] | None = None) -> None:
+
+        self.pages: dict[int, list[int]] = {} if pages is None else dict(pages)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare this image to another object
+
+        Args:
+
+            other:
+                The object this image should be compared to
+
+        Returns:
+
+            ``True``, if the other object is an image with the same data,
+            ``False`` otherwise
+
+        """
+
+        if not isinstance(other, EEPROMImage):
+            return NotImplemented
+
+        return self.pages == other.pages
+
+    def __repr__(self) -> str:
+        """Get the textual representation of the image
+
+        Returns:
+
+            A string that contains the number of pages and bytes
+
+        """
+
+        size = sum(len(data) for data in self.pages.values())
+        return f"EEPROM Image: {len(self.pages)} pages, {size} bytes"
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """Convert the image into a JSON serializable representation
+
+        Returns:
+
+            A dictionary that maps the page numbers to the hexadecimal
+            representation and the CRC-32 checksum of the page data
+
+        """
+
+        return {
+            str(address): {
+                "data": bytes(data).hex(),
+                "crc32": crc32(bytes(data)),
+            }
+            for address, data in sorted(self.pages.items())
+        }
+
+    @classmethod
+    def from_dict(cls, image: Mapping[str, Mapping[str, Any]]) -> EEPROMImage:
+        """Create an image from its serializable representation
+
+        Args:
+
+            image:
+                The representation of the image (see :meth:`to_dict`)
+
+        Returns:
+
+            An image containing the page data
+
+        Raises:
+
+            ValueError:
+                If the checksum of a page does not match its data
+
+        """
+
+        pages: dict[int, list[int]] = {}
+        for address, page in image.items():
+            data = bytes.fromhex(page["data"])
+            if crc32(data) != page["crc32"]:
+                raise ValueError(
+                    f"Checksum of EEPROM page {address} does not match data"
+                )
+            pages[int(address)] = list(data)
+
+        return cls(pages)
+
+
+# -- Functions ----------------------------------------------------------------
+
+
+def save_images(
+    filepath: str | Path, images: Mapping[str, EEPROMImage]
+) -> None:
+    """Store EEPROM images in a JSON file
+
+    Args:
+
+        filepath:
+            The location of the JSON file
+
+        images:
+            A mapping from (node) names to EEPROM images
+
+    Examples:
+
+        Import required library code
+
+        >>> from tempfile import TemporaryDirectory
+
+        Store and load an image
+
+        >>> images = {"STU": EEPROMImage({0: [1, 2, 3]})}
+        >>> with TemporaryDirectory() as directory:
+        ...     filepath = Path(directory) / "eeprom.json"
+        ...     save_images(filepath, images)
+        ...     load_images(filepath) == images
+        True
+
+    """
+
+    with open(filepath, "w", encoding="utf-8") as file:
+        dump(
+            {name: image.to_dict() for name, image in images.items()},
+            file,
+            indent=2,
+        )
+
+
+def load_images(filepath: str | Path) -> dict[str, EEPROMImage]:
+    """Load EEPROM images from a JSON file
+
+    Args:
+
+        filepath:
+            The location of the JSON file
+
+    Returns:
+
+        A mapping from (node) names to EEPROM images
+
+    Raises:
+
+        ValueError:
+            If the file does not contain valid EEPROM images
+
+    """
+
+    with open(filepath, encoding="utf-8") as file:
+        try:
+            images = load(file)
+            return {
+                name: EEPROMImage.from_dict(image)
+                for name, image in images.items()
+            }
+        except (AttributeError, KeyError, TypeError) as error:
+            raise ValueError(f"Invalid EEPROM image data: {error}") from error
+
+
+async def backup(
+    eeprom: EEPROM, pages: Iterable[int] = BACKUP_PAGES
+) -> EEPROMImage:
+    """Read EEPROM pages into an image
+
+    The coroutine reads all pages concurrently, so the requests for the
+    next page do not have to wait until all data of the previous page
+    arrived.
+
+    Args:
+
+        eeprom:
+            The EEPROM that should be read
+
+        pages:
+            The numbers of the pages that should be read
+
+    Returns:
+
+        An image containing the data of the EEPROM pages
+
+    Examples:
+
+        Import required library code
+
+        >>> from asyncio import run
+        >>> from icotronic.can.connection import Connection
+
+        Read the first two pages of the EEPROM of STU 1
+
+        >>> async def backup_eeprom():
+        ...     async with Connection() as stu:
+        ...         return await backup(stu.eeprom, pages=range(2))
+        >>> run(backup_eeprom())
+        EEPROM Image: 2 pages, 512 bytes
+
+    """
+
+    addresses = list(pages)
+    data = await gather(*(eeprom.read_page(address) for address in addresses))
+
+    return EEPROMImage(dict(zip(addresses, data)))
+
+
+async def restore(eeprom: EEPROM, image: EEPROMImage) -> WriteResult:
+    """Write the data of an image into the EEPROM
+
+    The coroutine only writes the data that differs from the current
+    EEPROM content and verifies the written data (see
+    :meth:`EEPROM.write_diff`).
+
+    Args:
+
+        eeprom:
+            The EEPROM that should be written
+
+        image:
+            The image containing the EEPROM data
+
+    Returns:
+
+        The number of sent and skipped write requests
+
+    Examples:
+
+        Import required library code
+
+        >>> from asyncio import run
+        >>> from icotronic.can.connection import Connection
+
+        Restore a page of the EEPROM of STU 1
+
+        >>> async def backup_and_restore():
+        ...     async with Connection() as stu:
+        ...         image = await backup(stu.eeprom, pages=[0])
+        ...         return await restore(stu.eeprom, image)
+        >>> run(backup_and_restore())
+        WriteResult(written=0, skipped=64)
+
+    """
+
+    written = skipped = 0
+    for address, data in sorted(image.pages.items()):
+        result = await eeprom.write_diff(address, 0, data)
+        written += result.written
+        skipped += result.skipped
+
+    return WriteResult(written, skipped)
+
+
+# -- Main ---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    from doctest import testmod
+
+    testmod()
@@ -7,6 +7,19 @@ from datetime import date
 from semantic_version import Version
 
 from icotronic.can.node.eeprom.basic import EEPROM
+from icotronic.can.node.eeprom.snapshot import (
+    decode_date,
+    decode_int,
+    decode_status,
+    decode_text,
+    decode_version,
+    encode_date,
+    encode_int,
+    encode_status,
+    encode_text,
+    encode_version,
+    EEPROMField,
+)
 from icotronic.can.node.eeprom.status import EEPROMStatus
 
 
@@ -18,6 +31,35 @@ from icotronic.can.node.eeprom.status import EEPROMStatus
 class NodeEEPROM(EEPROM):
     """Read and write node specific EEPROM data (STU/sensor nodes)"""
 
+    FIELDS = {
+        **EEPROM.FIELDS,
+        # System Configuration
+        "status": EEPROMField(0, 0, 1, decode_status, encode_status),
+        "name": EEPROMField(0, 1, 8, decode_text, encode_text),
+        # Product Data
+        "gtin": EEPROMField(4, 0, 8, decode_int, encode_int),
+        "hardware_version": EEPROMField(
+            4, 13, 3, decode_version, encode_version
+        ),
+        "firmware_version": EEPROMField(
+            4, 21, 3, decode_version, encode_version
+        ),
+        "release_name": EEPROMField(4, 24, 8, decode_text, encode_text),
+        "serial_number": EEPROMField(4, 32, 32, decode_text, encode_text),
+        "product_name": EEPROMField(4, 64, 128, decode_text, encode_text),
+        "oem_data": EEPROMField(4, 192, 64),
+        # Statistics
+        "power_on_cycles": EEPROMField(5, 0, 4, decode_int, encode_int),
+        "power_off_cycles": EEPROMField(5, 4, 4, decode_int, encode_int),
+        "operating_time": EEPROMField(5, 8, 4, decode_int, encode_int),
+        "under_voltage_counter": EEPROMField(5, 12, 4, decode_int, encode_int),
+        "watchdog_reset_counter": EEPROMField(
+            5, 16, 4, decode_int, encode_int
+        ),
+        "production_date": EEPROMField(5, 20, 8, decode_date, encode_date),
+        "batch_number": EEPROMField(5, 28, 4, decode_int, encode_int),
+    }
+
     # ========================
     # = System Configuration =
     # ========================
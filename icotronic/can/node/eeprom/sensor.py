@@ -4,6 +4,66 @@
 
 from icotronic.can.constants import ADVERTISEMENT_TIME_EEPROM_TO_MS
 from icotronic.can.node.eeprom.node import NodeEEPROM
+from icotronic.can.node.eeprom.snapshot import (
+    decode_int,
+    encode_int,
+    EEPROMField,
+)
+
+# -- Functions ----------------------------------------------------------------
+
+
+def decode_advertisement_time(data: list[int]) -> float:
+    """Decode EEPROM data as advertisement time
+
+    Args:
+
+        data:
+            The EEPROM data of the advertisement time field
+
+    Returns:
+
+        The advertisement time in milliseconds
+
+    Examples:
+
+        Decode an advertisement time
+
+        >>> decode_advertisement_time([0x40, 0x06])
+        1000.0
+
+    """
+
+    return decode_int(data) * ADVERTISEMENT_TIME_EEPROM_TO_MS
+
+
+def encode_advertisement_time(milliseconds: float, length: int) -> list[int]:
+    """Encode an advertisement time as EEPROM data
+
+    Args:
+
+        milliseconds:
+            The advertisement time in milliseconds
+
+        length:
+            The length of the field in bytes
+
+    Returns:
+
+        The EEPROM data of the advertisement time
+
+    Examples:
+
+        Encode an advertisement time
+
+        >>> encode_advertisement_time(1000, 2)
+        [64, 6]
+
+    """
+
+    return encode_int(
+        round(milliseconds / ADVERTISEMENT_TIME_EEPROM_TO_MS), length
+    )
 
 
 # -- Sensor -------------------------------------------------------------------
@@ -12,6 +72,18 @@ from icotronic.can.node.eeprom.node import NodeEEPROM
 class SensorNodeEEPROM(NodeEEPROM):
     """Read and write EEPROM data of sensor nodes"""
 
+    FIELDS = {
+        **NodeEEPROM.FIELDS,
+        "sleep_time_1": EEPROMField(0, 9, 4, decode_int, encode_int),
+        "advertisement_time_1": EEPROMField(
+            0, 13, 2, decode_advertisement_time, encode_advertisement_time
+        ),
+        "sleep_time_2": EEPROMField(0, 15, 4, decode_int, encode_int),
+        "advertisement_time_2": EEPROMField(
+            0, 19, 2, decode_advertisement_time, encode_advertisement_time
+        ),
+    }
+
     # ========================
     # = System Configuration =
     # ========================
@@ -0,0 +1,746 @@
+"""Cache EEPROM pages and decode EEPROM fields from the cached data
+
+Reading EEPROM fields one at a time requires (at least) one request for
+every four bytes of every field. A :class:`EEPROMSnapshot` reads all known
+fields of a page at once using concurrent requests and then decodes the
+fields from the cached data. The encoding functions of this module convert
+field values back into EEPROM data (e.g. to apply a profile of field values
+using :meth:`EEPROM.apply_profile`).
+"""
+
+# -- Imports ------------------------------------------------------------------
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from datetime import date
+from struct import unpack
+from time import monotonic
+from typing import Any, NamedTuple, TYPE_CHECKING
+
+from semantic_version import Version
+
+from icotronic.can.node.eeprom.status import EEPROMStatus
+from icotronic.utility.data import convert_bytes_to_text
+
+if TYPE_CHECKING:
+    from icotronic.can.node.eeprom.basic import EEPROM
+
+# -- Functions ----------------------------------------------------------------
+
+
+def decode_raw(data: list[int]) -> list[int]:
+    """Decode EEPROM data as list of bytes
+
+    Args:
+
+        data:
+            The EEPROM data of a field
+
+    Returns:
+
+        A copy of the given data
+
+    Examples:
+
+        Decode some bytes
+
+        >>> decode_raw([1, 2, 3])
+        [1, 2, 3]
+
+    """
+
+    return list(data)
+
+
+def decode_int(data: list[int]) -> int:
+    """Decode EEPROM data as unsigned little endian number
+
+    Args:
+
+        data:
+            The EEPROM data of a field
+
+    Returns:
+
+        The number stored in the EEPROM data
+
+    Examples:
+
+        Decode some numbers
+
+        >>> decode_int([0x39, 0x05])
+        1337
+        >>> decode_int([0xff, 0xff, 0xff, 0xff])
+        4294967295
+
+    """
+
+    return int.from_bytes(data, "little")
+
+
+def decode_float(data: list[int]) -> float:
+    """Decode EEPROM data as (single precision) float
+
+    Args:
+
+        data:
+            The EEPROM data of a field
+
+    Returns:
+
+        The float number stored in the EEPROM data
+
+    Examples:
+
+        Decode a float number
+
+        >>> decode_float([0, 0, 0x2a, 0x42])
+        42.5
+
+    """
+
+    return unpack("<f", bytearray(data))[0]
+
+
+def decode_text(data: list[int]) -> str:
+    """Decode EEPROM data as ASCII text
+
+    Args:
+
+        data:
+            The EEPROM data of a field
+
+    Returns:
+
+        The text up to the first null byte
+
+    Examples:
+
+        Decode some text
+
+        >>> decode_text([ord(character) for character in "Test"] + [0, 65])
+        'Test'
+
+    """
+
+    return convert_bytes_to_text(data, until_null=True)
+
+
+def decode_version(data: list[int]) -> Version:
+    """Decode EEPROM data as version number
+
+    Args:
+
+        data:
+            The EEPROM data of a field (major, minor and patch version)
+
+    Returns:
+
+        The version stored in the EEPROM data
+
+    Examples:
+
+        Decode a version number
+
+        >>> decode_version([1, 2, 3])
+        Version('1.2.3')
+
+    """
+
+    major, minor, patch = data
+    return Version(major=major, minor=minor, patch=patch)
+
+
+def decode_date(data: list[int]) -> date:
+    """Decode EEPROM data as date
+
+    Args:
+
+        data:
+            The EEPROM data of a field (text in the format ``YYYYMMDD``)
+
+    Returns:
+
+        The date stored in the EEPROM data
+
+    Examples:
+
+        Decode a date
+
+        >>> decode_date([ord(character) for character in "20241231"])
+        datetime.date(2024, 12, 31)
+
+    """
+
+    text = decode_text(data)
+    return date(year=int(text[0:4]), month=int(text[4:6]), day=int(text[6:8]))
+
+
+def decode_status(data: list[int]) -> EEPROMStatus:
+    """Decode EEPROM data as status byte
+
+    Args:
+
+        data:
+            The EEPROM data of a field
+
+    Returns:
+
+        The EEPROM status stored in the EEPROM data
+
+    Examples:
+
+        Decode a status byte
+
+        >>> decode_status([0xac])
+        Initialized (0xac)
+
+    """
+
+    return EEPROMStatus(data[0])
+
+
+def _fit(data: list[int], length: int) -> list[int]:
+    """Cut off or fill up data to a certain length
+
+    Args:
+
+        data:
+            The bytes that should be adjusted
+
+        length:
+            The length of the returned data
+
+    Returns:
+
+        The given data cut off or filled up with null bytes
+
+    """
+
+    return [*data[:length], *([0] * (length - len(data)))]
+
+
+def encode_raw(data: Any, length: int) -> list[int]:
+    """Encode bytes as EEPROM data
+
+    Args:
+
+        data:
+            The bytes that should be stored in the EEPROM
+
+        length:
+            The length of the field in bytes
+
+    Returns:
+
+        The data cut off or filled up to the length of the field
+
+    Examples:
+
+        Encode some bytes
+
+        >>> encode_raw([1, 2, 3], 4)
+        [1, 2, 3, 0]
+
+    """
+
+    return _fit(list(data), length)
+
+
+def encode_int(value: Any, length: int) -> list[int]:
+    """Encode an unsigned number as little endian EEPROM data
+
+    Args:
+
+        value:
+            The number that should be stored in the EEPROM
+
+        length:
+            The length of the field in bytes
+
+    Returns:
+
+        The EEPROM data of the number
+
+    Examples:
+
+        Encode a number
+
+        >>> encode_int(1337, 2)
+        [57, 5]
+
+    """
+
+    return list(int(value).to_bytes(length, "little"))
+
+
+def encode_text(text: Any, length: int) -> list[int]:
+    """Encode ASCII text as EEPROM data
+
+    Args:
+
+        text:
+            The text that should be stored in the EEPROM
+
+        length:
+            The length of the field in bytes
+
+    Returns:
+
+        The EEPROM data of the text (filled up with null bytes)
+
+    Examples:
+
+        Encode some text
+
+        >>> encode_text("Test", 6)
+        [84, 101, 115, 116, 0, 0]
+
+    """
+
+    return _fit(list(map(ord, str(text))), length)
+
+
+def encode_version(version: Any, length: int) -> list[int]:
+    """Encode a version number as EEPROM data
+
+    Args:
+
+        version:
+            The version (or its textual representation) that should be
+            stored in the EEPROM
+
+        length:
+            The length of the field in bytes
+
+    Returns:
+
+        The EEPROM data of the version
+
+    Examples:
+
+        Encode a version number
+
+        >>> encode_version("1.2.3", 3)
+        [1, 2, 3]
+
+    """
+
+    if isinstance(version, str):
+        version = Version(version)
+
+    return _fit([version.major, version.minor, version.patch], length)
+
+
+def encode_date(value: Any, length: int) -> list[int]:
+    """Encode a date as EEPROM data
+
+    Args:
+
+        value:
+            The date (or its ISO format representation) that should be
+            stored in the EEPROM
+
+        length:
+            The length of the field in bytes
+
+    Returns:
+
+        The EEPROM data of the date (text in the format ``YYYYMMDD``)
+
+    Examples:
+
+        Encode a date
+
+        >>> bytes(encode_date("2024-12-31", 8))
+        b'20241231'
+
+    """
+
+    if isinstance(value, str):
+        try:
+            value = date.fromisoformat(value)
+        except ValueError as error:
+            raise ValueError(
+                f"Invalid value for date argument: “{value}”"
+            ) from error
+
+    return encode_text(str(value).replace("-", ""), length)
+
+
+def encode_status(status: Any, length: int) -> list[int]:
+    """Encode a status as EEPROM data
+
+    Args:
+
+        status:
+            The EEPROM status that should be stored in the EEPROM
+
+        length:
+            The length of the field in bytes
+
+    Returns:
+
+        The EEPROM data of the status
+
+    Examples:
+
+        Encode a status
+
+        >>> encode_status("Locked", 1)
+        [202]
+
+    """
+
+    return _fit([EEPROMStatus(status).value], length)
+
+
+# -- Classes ------------------------------------------------------------------
+
+
+class EEPROMField(NamedTuple):
+    """Location and data type of an EEPROM field"""
+
+    address: int
+    """The page number in the EEPROM"""
+
+    offset: int
+    """The offset to the base address in the page"""
+
+    length: int
+    """The number of bytes of the field"""
+
+    decode: Callable[[list[int]], Any] = decode_raw
+    """Function that converts the bytes of the field into a value"""
+
+    encode: Callable[[Any, int], list[int]] = encode_raw
+    """Function that converts a value (and field length) into bytes"""
+
+
+class EEPROMSnapshot:
+    """Read EEPROM fields once and decode them from cached data
+
+    The snapshot reads the data of all known fields (:attr:`EEPROM.FIELDS`)
+    of a page at once. Writing data with the EEPROM object removes the
+    affected page from the snapshot.
+
+    Args:
+
+        eeprom:
+            The EEPROM object used to read the EEPROM data
+
+    Examples:
+
+        Import required library code
+
+        >>> from asyncio import run
+        >>> from icotronic.can.connection import Connection
+
+        Read all known EEPROM fields of STU 1
+
+        >>> async def read_configuration():
+        ...     async with Connection() as stu:
+        ...         snapshot = stu.eeprom.snapshot
+        ...         await snapshot.update()
+        ...         return snapshot.values()
+        >>> configuration = run(read_configuration())
+        >>> 0 <= len(configuration["name"]) <= 8
+        True
+        >>> configuration["operating_time"] >= 0
+        True
+
+    """
+
+    def __init__(self, eeprom: EEPROM) -> None:
+
+        self.eeprom = eeprom
+
+        self.pages: dict[int, tuple[int, list[int]]] = {}
+        """Cached EEPROM data (start offset and bytes) for every page"""
+
+        self.read_time: dict[int, float] = {}
+        """Time (monotonic clock) when each page was read"""
+
+        self.write_counter: int | None = None
+        """EEPROM write request counter at the last check"""
+
+    def __repr__(self) -> str:
+        """Get the textual representation of the snapshot
+
+        Returns:
+
+            A string that contains the cached pages
+
+        """
+
+        pages = ", ".join(
+            f"{address} ({offset} – {offset + len(data) - 1})"
+            for address, (offset, data) in sorted(self.pages.items())
+        )
+        return f"EEPROM Snapshot: {pages if pages else 'Empty'}"
+
+    def _span(self, address: int) -> tuple[int, int]:
+        """Get the part of a page that contains known fields
+
+        Args:
+
+            address:
+                The page number in the EEPROM
+
+        Returns:
+
+            The offset of the first byte and the number of bytes that cover
+            all known fields of the page
+
+        """
+
+        fields = [
+            field
+            for field in self.eeprom.FIELDS.values()
+            if field.address == address
+        ]
+        start = min(field.offset for field in fields)
+        end = max(field.offset + field.length for field in fields)
+
+        return start, end - start
+
+    def _field(self, name: str) -> EEPROMField:
+        """Get information about a known EEPROM field
+
+        Args:
+
+            name:
+                The name of the field
+
+        Returns:
+
+            The location and data type of the field
+
+        """
+
+        try:
+            return self.eeprom.FIELDS[name]
+        except KeyError as error:
+            raise KeyError(f"Unknown EEPROM field “{name}”") from error
+
+    def age(self, address: int) -> float | None:
+        """Get the age of the cached data of a page
+
+        Args:
+
+            address:
+                The page number in the EEPROM
+
+        Returns:
+
+            The time in seconds since the page was read or ``None``, if the
+            snapshot does not contain the page
+
+        """
+
+        read_time = self.read_time.get(address)
+        return None if read_time is None else monotonic() - read_time
+
+    def invalidate(self, address: int | None = None) -> None:
+        """Remove cached EEPROM data
+
+        Args:
+
+            address:
+                The page number of the data that should be removed or
+                ``None`` to remove the data of all pages
+
+        """
+
+        if address is None:
+            self.pages.clear()
+            self.read_time.clear()
+            return
+
+        self.pages.pop(address, None)
+        self.read_time.pop(address, None)
+
+    def cached(
+        self, address: int, offset: int, length: int
+    ) -> list[int] | None:
+        """Get cached EEPROM data
+
+        Args:
+
+            address:
+                The page number in the EEPROM
+
+            offset:
+                The offset to the base address in the specified page
+
+            length:
+                The number of bytes
+
+        Returns:
+
+            The cached data or ``None``, if the snapshot does not contain
+            (all of) the requested data
+
+        """
+
+        if address not in self.pages:
+            return None
+
+        start, data = self.pages[address]
+        begin = offset - start
+        if begin < 0 or begin + length > len(data):
+            return None
+
+        return data[begin : begin + length]
+
+    def patch(self, address: int, offset: int, data: list[int]) -> None:
+        """Store data written to the EEPROM in the snapshot
+
+        If the snapshot does not contain the whole written part of the
+        page, then this method removes the page from the snapshot.
+
+        Args:
+
+            address:
+                The page number in the EEPROM
+
+            offset:
+                The offset to the base address in the specified page
+
+            data:
+                The data written to the EEPROM
+
+        """
+
+        if self.cached(address, offset, len(data)) is None:
+            self.invalidate(address)
+            return
+
+        start, page = self.pages[address]
+        begin = offset - start
+        page[begin : begin + len(data)] = data
+
+    async def update(
+        self,
+        names: Iterable[str] | None = None,
+        max_age: float | None = None,
+    ) -> None:
+        """Read the pages of the specified fields, if necessary
+
+        Args:
+
+            names:
+                The names of the fields that should be available in the
+                snapshot or ``None`` for all known fields
+
+            max_age:
+                The maximum age in seconds of cached data or ``None``, if
+                cached data never expires
+
+        """
+
+        fields = (
+            self.eeprom.FIELDS.values()
+            if names is None
+            else [self._field(name) for name in names]
+        )
+
+        for address in sorted({field.address for field in fields}):
+            age = self.age(address)
+            if age is not None and (max_age is None or age <= max_age):
+                continue
+
+            offset, length = self._span(address)
+            data = await self.eeprom.read_bulk(address, offset, length)
+            self.pages[address] = (offset, data)
+            self.read_time[address] = monotonic()
+
+    async def check(self) -> bool:
+        """Check if the EEPROM was written since the last check
+
+        If the EEPROM write request counter changed, then this coroutine
+        removes all cached data, since we do not know which pages changed.
+
+        Returns:
+
+            ``True``, if the cached data is still valid, ``False`` otherwise
+
+        """
+
+        counter = await self.eeprom.read_write_request_counter()
+        valid = counter == self.write_counter
+        if not valid:
+            self.invalidate()
+        self.write_counter = counter
+
+        return valid
+
+    def __getitem__(self, name: str) -> Any:
+        """Decode an EEPROM field from the cached data
+
+        Args:
+
+            name:
+                The name of the field
+
+        Returns:
+
+            The decoded value of the field
+
+        """
+
+        field = self._field(name)
+        try:
+            start, data = self.pages[field.address]
+        except KeyError as error:
+            raise KeyError(
+                f"EEPROM page {field.address} of field “{name}” not read"
+            ) from error
+
+        begin = field.offset - start
+        return field.decode(data[begin : begin + field.length])
+
+    async def get(self, name: str, max_age: float | None = None) -> Any:
+        """Read an EEPROM field, using cached data if possible
+
+        Args:
+
+            name:
+                The name of the field
+
+            max_age:
+                The maximum age in seconds of cached data or ``None``, if
+                cached data never expires
+
+        Returns:
+
+            The decoded value of the field
+
+        """
+
+        await self.update([name], max_age)
+        return self[name]
+
+    def values(self) -> dict[str, Any]:
+        """Decode all known fields of the cached pages
+
+        Returns:
+
+            A dictionary that maps the names of the fields to their values
+
+        """
+
+        return {
+            name: self[name]
+            for name, field in self.eeprom.FIELDS.items()
+            if field.address in self.pages
+        }
+
+
+# -- Main ---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    from doctest import testmod
+
+    testmod()
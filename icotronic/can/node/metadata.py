@@ -0,0 +1,302 @@
+"""Cache the product data of ICOtronic nodes
+
+The product data of a node (e.g. serial number or product name) only
+changes, if someone writes the EEPROM of the node or updates its firmware.
+Objects of the class :class:`ProductDataCache` store the product data of
+nodes using the MAC address of the node as key. Every entry also stores the
+firmware version and the number of EEPROM write requests of the node at the
+time the data was read. If one of these values changed, then the cached
+data is invalid.
+"""
+
+# -- Imports ------------------------------------------------------------------
+
+from __future__ import annotations
+
+from json import dump, load
+from logging import getLogger
+from pathlib import Path
+from typing import NamedTuple
+
+from netaddr import AddrFormatError, EUI
+from semantic_version import Version
+
+# -- Classes ------------------------------------------------------------------
+
+
+class ProductData(NamedTuple):
+    """Product data of a node"""
+
+    gtin: int
+    """The Global Trade Identification Number"""
+
+    hardware_version: Version
+    """The hardware version"""
+
+    firmware_version: Version
+    """The firmware version"""
+
+    release_name: str
+    """The firmware release name"""
+
+    serial_number: str
+    """The serial number"""
+
+    product_name: str
+    """The product name"""
+
+    oem_data: bytes
+    """The OEM (free use) data"""
+
+
+class ProductDataCache:
+    """Store the product data of nodes
+
+    Examples:
+
+        Store product data
+
+        >>> data = ProductData(gtin=0,
+        ...                    hardware_version=Version("1.4.0"),
+        ...                    firmware_version=Version("2.1.10"),
+        ...                    release_name="Valerie",
+        ...                    serial_number="",
+        ...                    product_name="STU",
+        ...                    oem_data=bytes(64))
+        >>> cache = ProductDataCache()
+        >>> mac_address = EUI("08-6B-D7-01-DE-81")
+        >>> cache.put(mac_address, data, write_counter=10)
+        >>> cache
+        Cached Product Data: 1 nodes
+
+        Retrieve the cached data
+
+        >>> cache.get(mac_address, Version("2.1.10"), 10).product_name
+        'STU'
+
+        The cached data is invalid after a firmware update or EEPROM write
+
+        >>> cache.get(mac_address, Version("2.1.11"), 10) is None
+        True
+        >>> cache.get(mac_address, Version("2.1.10"), 11) is None
+        True
+
+    """
+
+    def __init__(self) -> None:
+
+        self.logger = getLogger(__name__)
+
+        self.entries: dict[EUI, tuple[ProductData, int | None]] = {}
+        """Product data and EEPROM write request counter of nodes"""
+
+        self.filepath: Path | None = None
+        """File used to store the cached data"""
+
+    def __repr__(self) -> str:
+        """Get the textual representation of the cache
+
+        Returns:
+
+            A string that contains the number of cached entries
+
+        """
+
+        return f"Cached Product Data: {len(self.entries)} nodes"
+
+    def get(
+        self,
+        mac_address: EUI,
+        firmware_version: Version,
+        write_counter: int | None,
+    ) -> ProductData | None:
+        """Retrieve cached product data
+
+        Args:
+
+            mac_address:
+                The MAC address of the node
+
+            firmware_version:
+                The current firmware version of the node
+
+            write_counter:
+                The current number of EEPROM write requests of the node or
+                ``None``, if the node does not provide this value
+
+        Returns:
+
+            The product data of the node or ``None``, if the cache does not
+            contain valid data for the node
+
+        """
+
+        entry = self.entries.get(mac_address)
+        if entry is None:
+            return None
+
+        data, counter = entry
+        if (
+            data.firmware_version != firmware_version
+            or counter != write_counter
+        ):
+            self.invalidate(mac_address)
+            return None
+
+        return data
+
+    def put(
+        self, mac_address: EUI, data: ProductData, write_counter: int | None
+    ) -> None:
+        """Store product data
+
+        Args:
+
+            mac_address:
+                The MAC address of the node
+
+            data:
+                The product data of the node
+
+            write_counter:
+                The number of EEPROM write requests of the node at the time
+                the product data was read
+
+        """
+
+        self.entries[mac_address] = (data, write_counter)
+
+        if self.filepath is not None:
+            self.save()
+
+    def invalidate(self, mac_address: EUI | None = None) -> None:
+        """Remove cached product data
+
+        Args:
+
+            mac_address:
+                The MAC address of the node or ``None`` to remove the data
+                of all nodes
+
+        """
+
+        if mac_address is None:
+            self.entries.clear()
+        else:
+            self.entries.pop(mac_address, None)
+
+        if self.filepath is not None:
+            self.save()
+
+    def load(self, filepath: str | Path) -> None:
+        """Load cached product data from a file
+
+        The cache will also store its data in this file, after the cached
+        data changed. If the file does not exist or contains invalid data,
+        then the cache starts without stored data.
+
+        Args:
+
+            filepath:
+                The location of the (JSON) file
+
+        Examples:
+
+            Import required library code
+
+            >>> from tempfile import TemporaryDirectory
+
+            Store and load product data
+
+            >>> data = ProductData(gtin=1,
+            ...                    hardware_version=Version("1.4.0"),
+            ...                    firmware_version=Version("2.1.10"),
+            ...                    release_name="Valerie",
+            ...                    serial_number="1234",
+            ...                    product_name="STH",
+            ...                    oem_data=bytes([1, 2, 3]))
+            >>> mac_address = EUI("08-6B-D7-01-DE-81")
+            >>> with TemporaryDirectory() as directory:
+            ...     filepath = Path(directory) / "product-data.json"
+            ...     cache = ProductDataCache()
+            ...     cache.load(filepath)
+            ...     cache.put(mac_address, data, write_counter=None)
+            ...     other = ProductDataCache()
+            ...     other.load(filepath)
+            >>> other.get(mac_address, Version("2.1.10"), None) == data
+            True
+
+        """
+
+        self.filepath = Path(filepath)
+
+        try:
+            with open(self.filepath, encoding="utf-8") as file:
+                entries = load(file)
+            for mac, entry in entries.items():
+                data = ProductData(
+                    gtin=entry["gtin"],
+                    hardware_version=Version(entry["hardware_version"]),
+                    firmware_version=Version(entry["firmware_version"]),
+                    release_name=entry["release_name"],
+                    serial_number=entry["serial_number"],
+                    product_name=entry["product_name"],
+                    oem_data=bytes.fromhex(entry["oem_data"]),
+                )
+                self.entries[EUI(mac)] = (data, entry["write_counter"])
+        except FileNotFoundError:
+            pass
+        except (
+            AddrFormatError,
+            AttributeError,
+            KeyError,
+            TypeError,
+            ValueError,
+        ) as error:
+            self.logger.warning(
+                "Ignoring invalid product data in “%s”: %s",
+                self.filepath,
+                error,
+            )
+
+    def save(self) -> None:
+        """Store the cached data in the file specified with :meth:`load`"""
+
+        if self.filepath is None:
+            return
+
+        entries = {
+            str(mac_address): {
+                "gtin": data.gtin,
+                "hardware_version": str(data.hardware_version),
+                "firmware_version": str(data.firmware_version),
+                "release_name": data.release_name,
+                "serial_number": data.serial_number,
+                "product_name": data.product_name,
+                "oem_data": data.oem_data.hex(),
+                "write_counter": write_counter,
+            }
+            for mac_address, (data, write_counter) in self.entries.items()
+        }
+        try:
+            with open(self.filepath, "w", encoding="utf-8") as file:
+                dump(entries, file, indent=2)
+        except OSError as error:
+            self.logger.warning(
+                "Unable to store product data in “%s”: %s",
+                self.filepath,
+                error,
+            )
+
+
+# -- Attributes ---------------------------------------------------------------
+
+product_data_cache = ProductDataCache()
+"""Product data cache shared by all nodes"""
+
+# -- Main ---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    from doctest import testmod
+
+    testmod()
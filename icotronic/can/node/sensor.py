@@ -34,6 +34,7 @@ from icotronic.can.streaming import (
     StreamingFormatVoltage,
 )
 from icotronic.can.node.spu import SPU
+from icotronic.can.scheduler import Priority
 from icotronic.can.sensor import SensorConfiguration
 from icotronic.measurement.voltage import convert_raw_to_supply_voltage
 
@@ -57,6 +58,10 @@ class DataStreamContextManager:
             The amount of seconds between two consecutive messages, before
             a TimeoutError will be raised
 
+        stats:
+            Specifies if the stream buffer should calculate statistics for
+            the streaming values
+
     """
 
     def __init__(
@@ -64,11 +69,13 @@ class DataStreamContextManager:
         sensor_node: SensorNode,
         channels: StreamingConfiguration,
         timeout: float,
+        stats: bool = False,
     ) -> None:
 
         self.node = sensor_node
         self.channels = channels
         self.timeout = timeout
+        self.stats = stats
         self.reader: AsyncStreamBuffer | None = None
         self.logger = getLogger(__name__)
         self.logger.debug("Initialized data stream context manager")
@@ -88,6 +95,7 @@ class DataStreamContextManager:
         self.reader = AsyncStreamBuffer(
             self.timeout,
             max_buffer_size=round(adc_config.sample_rate()),
+            stats=self.stats,
         )
 
         self.node.spu.notifier.add_listener(self.reader)
@@ -875,7 +883,7 @@ class SensorNode(Node):
             if channel
         ]
         channels_text = "".join(
-            (f"{channel}, " for channel in measurement_channels[:-2])
+            f"{channel}, " for channel in measurement_channels[:-2]
         ) + " and ".join(measurement_channels[-2:])
 
         info = f"streaming of {channels_text} measurement channel"
@@ -916,10 +924,12 @@ class SensorNode(Node):
 
         try:
             info = "data streaming"
+            # Stopping the stream should not wait for other requests
             await self.spu.request(
                 message,
                 description=f"disable {info}",
                 retries=retries,
+                priority=Priority.CONTROL,
             )
             self.logger.info("Disabled %s", info)
 
@@ -934,6 +944,7 @@ class SensorNode(Node):
         self,
         channels: StreamingConfiguration,
         timeout: float = 5,
+        stats: bool = False,
     ) -> DataStreamContextManager:
         """Open measurement data stream
 
@@ -946,6 +957,10 @@ class SensorNode(Node):
                 The amount of seconds between two consecutive messages, before
                 a TimeoutError will be raised
 
+            stats:
+                Specifies if the stream should calculate statistics for the
+                streaming values (see :meth:`AsyncStreamBuffer.channel_stats`)
+
         Returns:
 
             A context manager object for managing stream data
@@ -985,7 +1000,7 @@ class SensorNode(Node):
 
         """
 
-        return DataStreamContextManager(self, channels, timeout)
+        return DataStreamContextManager(self, channels, timeout, stats)
 
     # -----------
     # - Voltage -
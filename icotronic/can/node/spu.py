@@ -4,8 +4,18 @@
 
 from __future__ import annotations
 
-from asyncio import wait_for
+from asyncio import (
+    create_task,
+    Future,
+    gather,
+    get_running_loop,
+    Semaphore,
+    wait_for,
+)
+from collections.abc import Iterable
 from logging import getLogger
+from time import monotonic
+from typing import NamedTuple
 
 from can import BusABC, Message as CANMessage, Notifier
 from netaddr import EUI
@@ -13,13 +23,41 @@ from netaddr import EUI
 from icotronic.can.constants import SENSOR_NODE_NUMBER_SELF_ADDRESSING
 from icotronic.can.protocol.message import Message
 from icotronic.can.error import ErrorResponseError, NoResponseError
-from icotronic.can.listener import ResponseListener
+from icotronic.can.latency import RoundTripTime
+from icotronic.can.listener import (
+    expected_data_overlaps,
+    ResponseListener,
+    ResponseRouter,
+)
 from icotronic.can.node.id import NodeId
+from icotronic.can.scheduler import Priority, request_priority, Scheduler
 from icotronic.utility.data import convert_bytes_to_text
 
 # -- Classes ------------------------------------------------------------------
 
 
+class Request(NamedTuple):
+    """Arguments of a single request (see :meth:`SPU.request`)"""
+
+    message: Message
+    """The message containing the request"""
+
+    description: str
+    """A description of the request used in error messages"""
+
+    response_data: bytearray | list[int | None] | None = None
+    """The expected data in the acknowledgment message"""
+
+    minimum_timeout: float = 0
+    """Minimum time in seconds before the request is sent again"""
+
+    retries: int = 10
+    """The number of times the request is sent again without response"""
+
+    priority: Priority | None = None
+    """The priority class of the request (default: based on the block)"""
+
+
 class SPU:
     """Communicate with the ICOtronic system acting as SPU
 
@@ -31,13 +69,54 @@ class SPU:
         notifier:
             A notifier class that listens to the communication of ``bus``
 
+        window:
+            The maximum number of requests to the same node that can wait
+            for a response at the same time. Concurrent requests (e.g.
+            started with ``asyncio.gather``) above this limit wait until
+            an earlier request completes.
+
+        rate:
+            The maximum (average) number of requests sent per second. If
+            requests exceed this limit, then they are sent later according
+            to their priority class.
+
     """
 
-    def __init__(self, bus: BusABC, notifier: Notifier) -> None:
+    def __init__(
+        self,
+        bus: BusABC,
+        notifier: Notifier,
+        window: int = 4,
+        rate: float = 1000,
+    ) -> None:
+
+        if window < 1:
+            raise ValueError(f"Invalid request window: {window}")
 
         self.bus = bus
         self.notifier = notifier
         self.id = NodeId("SPU 1")
+        # Use a single listener for the responses of all requests
+        self.responses = ResponseRouter()
+        notifier.add_listener(self.responses)
+        self.window = window
+        self.pending_requests: dict[int, Semaphore] = {}
+        # Expected response data of the requests that wait for a response
+        # (by acknowledgment identifier) and the requests that wait until
+        # they can send their request without ambiguous responses
+        self.expected_responses: dict[
+            int, list[bytearray | list[int | None] | None]
+        ] = {}
+        self.waiting_requests: dict[int, list[Future[None]]] = {}
+        self.round_trip_times: dict[tuple[int, int], RoundTripTime] = {}
+        """Round trip time statistics of the requests to each node
+
+        The keys contain the receiver and the command number (block and
+        block command) of the requests. This way fast local commands and
+        slow commands (e.g. relayed via Bluetooth) do not share a timeout.
+        """
+        # Send all requests via the scheduler
+        self.scheduler = Scheduler(bus, rate=rate)
 
     # pylint: disable=too-many-arguments, too-many-positional-arguments
 
@@ -48,6 +127,7 @@ class SPU:
         response_data: bytearray | list[int | None] | None = None,
         minimum_timeout: float = 0,
         retries: int = 10,
+        priority: Priority | None = None,
     ) -> CANMessage:
         """Send a request message and wait for the response
 
@@ -67,8 +147,15 @@ class SPU:
                in seconds
 
             retries:
-               The number of times the message is sent again, if no response
-               was sent back in a certain amount of time
+               The maximum number of times the message is sent, if no
+               response was sent back in a certain amount of time. Requests
+               stop earlier, if their attempts exceed the total timeout of
+               the round trip time statistics.
+
+            priority:
+               The priority class of the request. If you do not specify a
+               value, then the priority class depends on the block of the
+               request (e.g. EEPROM requests use the lowest priority).
 
         Returns:
 
@@ -85,57 +172,260 @@ class SPU:
 
         """
 
+        receiver = message.identifier().receiver()
+        pending_requests = self.pending_requests.get(receiver)
+        if pending_requests is None:
+            pending_requests = Semaphore(self.window)
+            self.pending_requests[receiver] = pending_requests
+
+        async with pending_requests:
+            return await self._request(
+                message,
+                description,
+                response_data,
+                minimum_timeout,
+                retries,
+                priority,
+            )
+
+    async def _request(
+        self,
+        message: Message,
+        description: str,
+        response_data: bytearray | list[int | None] | None,
+        minimum_timeout: float,
+        retries: int,
+        priority: Priority | None,
+    ) -> CANMessage:
+        """Send a request message and wait for the response
+
+        For a description of the arguments and return value, please take a
+        look at the method ``request``.
+
+        """
+
         logger = getLogger(__name__)
 
-        for attempt in range(1, retries + 1):
-            listener = ResponseListener(message, response_data)
-            self.notifier.add_listener(listener)
-            self.bus.send(message.to_python_can())
-            logger.info(
-                "Send request to %s (Attempt %d)", description, attempt
-            )
-            # This logger exists only for writing CAN messages. It specifically
-            # targets a namespace that is **not** part of the module library,
-            # i.e. there is no file `icotronic.can.messages.py`.
-            getLogger("icotronic.can.messages").debug("%s", message)
-
-            try:
-                # We increase the timeout after the first and second try.
-                # This way we reduce the chance of the warning:
-                #
-                # - “Bus error: an error counter reached the 'heavy'/'warning'
-                #   limit”
-                #
-                # happening. This warning might show up after
-                #
-                # - we flashed the STU,
-                # - sent a reset command to the STU, and then
-                # - wait for the response of the STU.
-                timeout = max(min(attempt * 0.1 + 0.5, 2), minimum_timeout)
-                response = await wait_for(
-                    listener.on_message(), timeout=timeout
-                )
-                assert response is not None
-            except TimeoutError:
-                logger.warning("Request to %s timed out", description)
-                continue
-            finally:
-                listener.stop()
-                self.notifier.remove_listener(listener)
-
-            if response.is_error:
-                raise ErrorResponseError(
-                    "Received unexpected response for request to "
-                    f"{description}:\n\n{response.error_message}\n"
-                    f"Response Message: {Message(response.message)}"
+        identifier = message.identifier()
+        command = (identifier.receiver(), identifier.command_number())
+        rtt = self.round_trip_times.get(command)
+        if rtt is None:
+            rtt = RoundTripTime()
+            self.round_trip_times[command] = rtt
+        if priority is None:
+            priority = request_priority(message.id())
+
+        # The router can not assign a response to a request, if multiple
+        # requests expect the same response (e.g. requests for the MAC
+        # addresses of different sensor nodes). Such requests wait until
+        # the other request received its response.
+        acknowledgment = identifier.acknowledge().value
+        await self._reserve_response(acknowledgment, response_data)
+        # We increase the timeout after the first try. This way we reduce
+        # the chance of the warning:
+        #
+        # - “Bus error: an error counter reached the 'heavy'/'warning' limit”
+        #
+        # happening. This warning might show up after
+        #
+        # - we flashed the STU,
+        # - sent a reset command to the STU, and then
+        # - wait for the response of the STU.
+        #
+        # All attempts together wait at most the total timeout of the round
+        # trip time statistics, i.e. slow requests use less attempts.
+        timeouts = rtt.schedule(retries, minimum_timeout)
+        attempt = 1
+        try:
+            for attempt, timeout in enumerate(timeouts, start=1):
+                listener = ResponseListener(message, response_data)
+                self.responses.add(listener)
+                try:
+                    # Requests might have to wait in the queue of the scheduler
+                    await self.scheduler.send(
+                        message.to_python_can(), priority
+                    )
+                    start = monotonic()
+                    logger.info(
+                        "Send request to %s (Attempt %d)", description, attempt
+                    )
+
+                    response = await wait_for(
+                        listener.on_message(), timeout=timeout
+                    )
+                    assert response is not None
+                    # Only use responses of the first attempt, since we do not
+                    # know to which attempt the response of a retry belongs
+                    if attempt == 1:
+                        rtt.add(monotonic() - start)
+                except TimeoutError:
+                    rtt.add_timeout()
+                    logger.warning("Request to %s timed out", description)
+                    continue
+                finally:
+                    listener.stop()
+                    self.responses.remove(listener)
+
+                if response.is_error:
+                    raise ErrorResponseError(
+                        "Received unexpected response for request to "
+                        f"{description}:\n\n{response.error_message}\n"
+                        f"Response Message: {Message(response.message)}"
+                    )
+
+                logger.info("Retrieved answer for request to %s", description)
+                return response.message
+
+            raise NoResponseError(f"Unable to {description}")
+        finally:
+            # Responses to earlier attempts might still arrive after a
+            # retry. Keep the reservation for a while, so that other
+            # requests do not receive these responses.
+            if attempt > 1:
+                get_running_loop().call_later(
+                    rtt.timeout(attempt),
+                    self._release_response,
+                    acknowledgment,
+                    response_data,
                 )
+            else:
+                self._release_response(acknowledgment, response_data)
 
-            logger.info("Retrieved answer for request to %s", description)
-            return response.message
+    async def _reserve_response(
+        self,
+        acknowledgment: int,
+        response_data: bytearray | list[int | None] | None,
+    ) -> None:
+        """Wait until no other request expects the same response
+
+        Args:
 
-        raise NoResponseError(f"Unable to {description}")
+            acknowledgment:
+                The identifier of the expected response
 
-    async def request_bluetooth(
+            response_data:
+                The expected data of the response
+
+        """
+
+        while True:
+            expected = self.expected_responses.setdefault(acknowledgment, [])
+            if not any(
+                expected_data_overlaps(response_data, other)
+                for other in expected
+            ):
+                expected.append(response_data)
+                return
+
+            waiter: Future[None] = get_running_loop().create_future()
+            self.waiting_requests.setdefault(acknowledgment, []).append(waiter)
+            await waiter
+
+    def _release_response(
+        self,
+        acknowledgment: int,
+        response_data: bytearray | list[int | None] | None,
+    ) -> None:
+        """Allow other requests to wait for a certain response
+
+        Args:
+
+            acknowledgment:
+                The identifier of the expected response
+
+            response_data:
+                The expected data of the response
+
+        """
+
+        expected = self.expected_responses[acknowledgment]
+        expected.remove(response_data)
+        if not expected:
+            del self.expected_responses[acknowledgment]
+
+        for waiter in self.waiting_requests.pop(acknowledgment, []):
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def latency_histogram(self) -> dict[float, int]:
+        """Get the distribution of the round trip times of all requests
+
+        Returns:
+
+            A dictionary that maps the upper bound of every non-empty bucket
+            (in seconds) to the number of measured round trip times in this
+            bucket
+
+        """
+
+        histogram: dict[float, int] = {}
+        for rtt in self.round_trip_times.values():
+            for bucket, count in rtt.histogram().items():
+                histogram[bucket] = histogram.get(bucket, 0) + count
+
+        return dict(sorted(histogram.items()))
+
+    async def gather_requests(
+        self, requests: Iterable[Request], window: int | None = None
+    ) -> list[CANMessage]:
+        """Send independent requests concurrently and wait for the responses
+
+        The coroutine starts the requests in the given order, but does not
+        wait for a response before sending the next request. The scheduler
+        of the SPU makes sure that the requests do not flood the CAN bus.
+        Every request uses the same retry handling as :meth:`request`. The
+        number of requests that wait for a response from the same node is
+        limited by the request window of the SPU, unless you specify a
+        different window.
+
+        Args:
+
+            requests:
+                The requests that should be sent
+
+            window:
+                The maximum number of the given requests that wait for a
+                response at the same time or ``None`` to use the request
+                window of the SPU for every receiver
+
+        Returns:
+
+            The response messages in the order of the given requests
+
+        Raises:
+
+            NoResponseError
+                If a receiver did not respond to a request
+
+            ErrorResponseError
+                If a receiver answered with an error message
+
+        """
+
+        if window is None:
+            tasks = [
+                create_task(self.request(*request)) for request in requests
+            ]
+        else:
+            if window < 1:
+                raise ValueError(f"Invalid request window: {window}")
+            pending_requests = Semaphore(window)
+
+            async def request(arguments: Request) -> CANMessage:
+                async with pending_requests:
+                    return await self._request(*arguments)
+
+            tasks = [create_task(request(arguments)) for arguments in requests]
+
+        try:
+            return list(await gather(*tasks))
+        finally:
+            # Stop remaining requests, if one of the requests failed
+            for task in tasks:
+                task.cancel()
+            await gather(*tasks, return_exceptions=True)
+
+    def bluetooth_request(
         self,
         node: str | NodeId,
         subcommand: int,
@@ -143,8 +433,8 @@ class SPU:
         sensor_node_number: int | None = None,
         data: list[int] | None = None,
         response_data: list[int | None] | None = None,
-    ) -> CANMessage:
-        """Send a request for a certain Bluetooth command
+    ) -> Request:
+        """Create a request for a certain Bluetooth command
 
         Args:
 
@@ -169,7 +459,7 @@ class SPU:
 
         Returns:
 
-            The response message for the given request
+            The request for the given Bluetooth command
 
         """
 
@@ -221,17 +511,46 @@ class SPU:
         if response_data is not None:
             expected_data.extend(response_data)
 
+        return Request(message, description, expected_data)
+
+    async def request_bluetooth(
+        self,
+        node: str | NodeId,
+        subcommand: int,
+        description: str,
+        sensor_node_number: int | None = None,
+        data: list[int] | None = None,
+        response_data: list[int | None] | None = None,
+    ) -> CANMessage:
+        """Send a request for a certain Bluetooth command
+
+        For a description of the arguments, please take a look at the method
+        :meth:`bluetooth_request`.
+
+        Returns:
+
+            The response message for the given request
+
+        """
+
         return await self.request(
-            message, description=description, response_data=expected_data
+            *self.bluetooth_request(
+                node,
+                subcommand,
+                description,
+                sensor_node_number,
+                data,
+                response_data,
+            )
         )
 
-    async def request_product_data(
+    def product_data_request(
         self,
         block_command: str | int,
         description: str,
         node: str | NodeId,
-    ) -> CANMessage:
-        """Send a request for product data
+    ) -> Request:
+        """Create a request for product data
 
         Args:
 
@@ -246,7 +565,7 @@ class SPU:
 
         Returns:
 
-            The response message for the given request
+            The request for the given product data
 
         """
 
@@ -259,7 +578,28 @@ class SPU:
             data=[0] * 8,
         )
 
-        return await self.request(message, description=description)
+        return Request(message, description)
+
+    async def request_product_data(
+        self,
+        block_command: str | int,
+        description: str,
+        node: str | NodeId,
+    ) -> CANMessage:
+        """Send a request for product data
+
+        For a description of the arguments, please take a look at the method
+        :meth:`product_data_request`.
+
+        Returns:
+
+            The response message for the given request
+
+        """
+
+        return await self.request(
+            *self.product_data_request(block_command, description, node)
+        )
 
     # pylint: enable=too-many-arguments, too-many-positional-arguments
 
@@ -303,23 +643,23 @@ class SPU:
 
         description = f"name of node “{sensor_node_number}” from “{node}”"
 
-        answer = await self.request_bluetooth(
-            node=node,
-            subcommand=5,
-            sensor_node_number=sensor_node_number,
-            description=f"get first part of {description}",
-        )
-
-        first_part = convert_bytes_to_text(answer.data[2:])
-
-        answer = await self.request_bluetooth(
-            node=node,
-            sensor_node_number=sensor_node_number,
-            subcommand=6,
-            description=f"get second part of {description}",
-        )
+        first_answer, second_answer = await self.gather_requests([
+            self.bluetooth_request(
+                node=node,
+                subcommand=5,
+                sensor_node_number=sensor_node_number,
+                description=f"get first part of {description}",
+            ),
+            self.bluetooth_request(
+                node=node,
+                sensor_node_number=sensor_node_number,
+                subcommand=6,
+                description=f"get second part of {description}",
+            ),
+        ])
 
-        second_part = convert_bytes_to_text(answer.data[2:])
+        first_part = convert_bytes_to_text(first_answer.data[2:])
+        second_part = convert_bytes_to_text(second_answer.data[2:])
 
         return first_part + second_part
 
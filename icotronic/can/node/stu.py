@@ -5,13 +5,17 @@
 from __future__ import annotations
 
 from argparse import ArgumentTypeError
-from asyncio import sleep
+from asyncio import CancelledError, create_task, Lock, sleep, Task
+from collections.abc import Mapping, Sequence
+from json import dump, load
 from logging import getLogger
-from time import monotonic
+from pathlib import Path
+from time import monotonic, time
 from types import TracebackType
 from typing import NamedTuple
 
-from netaddr import EUI
+from can import Message as CANMessage
+from netaddr import AddrFormatError, EUI
 
 from icotronic.cmdline.types import (
     node_name as check_name,
@@ -69,30 +73,108 @@ class AsyncSensorNodeManager:
         self.stu = stu
         self.identifier = identifier
         self.sensor_node_class = sensor_node_class
+        self.mac_address: EUI | None = None
+        self.sensor_node: SensorNode | None = None
+        self.sensor_node_info: SensorNodeInfo | None = None
+        """Information about the connected sensor node"""
+        self.restart_registry = False
+
+        self.cached_timeout = 3.0
+        """Time in seconds to wait for a connection via cached MAC address"""
 
     async def __aenter__(self) -> SensorNode:
         """Create the connection to the sensor node"""
 
-        def get_sensor_node(
-            nodes: list[SensorNodeInfo], identifier: int | str | EUI
-        ) -> SensorNodeInfo | None:
-            """Get the MAC address of a sensor node"""
-
-            for node in nodes:
-                if (  # pylint: disable=too-many-boolean-expressions
-                    isinstance(identifier, str)
-                    and node.name == identifier
-                    or isinstance(identifier, int)
-                    and node.sensor_node_number == identifier
-                    or isinstance(identifier, EUI)
-                    and node.mac_address == identifier
-                ):
-                    return node
+        # Requests of the background update would interfere with the
+        # connection attempt
+        registry = self.stu.registry
+        self.restart_registry = registry.running()
+        await registry.stop()
+
+        await self.stu.activate_bluetooth()
+
+        sensor_node = await self._connect_cached()
+        if sensor_node is None:
+            sensor_node = await self._connect_scan()
+
+        self.logger.info("Connected to sensor node: %s", sensor_node)
+        self.mac_address = sensor_node.mac_address
+        self.sensor_node_info = sensor_node
+        registry.add(sensor_node)
+        self.sensor_node = self.sensor_node_class(self.stu.spu)
+
+        return self.sensor_node
+
+    async def _connect_cached(self) -> SensorNodeInfo | None:
+        """Connect to the sensor node using data of the sensor node registry
+
+        The coroutine connects to the sensor node directly via its MAC
+        address, if the registry (see :attr:`STU.registry`) contains a
+        recent entry for the sensor node. This way we do not have to wait
+        for the information about all available sensor nodes.
 
+        Returns:
+
+            Information about the connected sensor node or ``None``, if
+            there was no recent entry or the connection attempt failed
+
+        """
+
+        # Node numbers change, if sensor nodes appear or disappear
+        if isinstance(self.identifier, int):
             return None
 
+        registry = self.stu.registry
+        sensor_node = registry.cached(self.identifier)
+        if sensor_node is None:
+            return None
+
+        self.logger.debug("Connect to cached sensor node: %s", sensor_node)
+        await self.stu.connect_with_mac_address(sensor_node.mac_address)
+        end_time = monotonic() + self.cached_timeout
+        connected = await self.stu.is_connected()
+        while not connected and monotonic() < end_time:
+            await sleep(0.1)
+            connected = await self.stu.is_connected()
+
+        # Another application might have renamed the sensor node
+        if connected and isinstance(self.identifier, str):
+            try:
+                name = await self.sensor_node_class(self.stu.spu).get_name()
+                connected = name == self.identifier
+            except (NoResponseError, ErrorResponseError):
+                connected = False
+
+        if connected:
+            return sensor_node
+
+        self.logger.info(
+            "Unable to connect to cached sensor node “%s”", sensor_node
+        )
+        registry.forget(sensor_node.mac_address)
+        # Stop the connection attempt
+        await self.stu.deactivate_bluetooth()
         await self.stu.activate_bluetooth()
 
+        return None
+
+    async def _connect_scan(self) -> SensorNodeInfo:
+        """Search for the sensor node and connect to it
+
+        Returns:
+
+            Information about the connected sensor node
+
+        Raises:
+
+            TimeoutError:
+                If the coroutine was unable to find or connect to the sensor
+                node
+
+        """
+
+        registry = self.stu.registry
+
         # We wait for a certain amount of time for the connection to the
         # node to take place
         timeout_in_s = 20
@@ -100,6 +182,7 @@ class AsyncSensorNodeManager:
 
         sensor_node = None
         sensor_nodes: list[SensorNodeInfo] = []
+        full = False
         while sensor_node is None:
             if monotonic() > end_time:
                 sensor_nodes_representation = "\n".join(
@@ -127,9 +210,11 @@ class AsyncSensorNodeManager:
                     f"{timeout_in_s} seconds\n\n{node_info}"
                 )
 
-            sensor_nodes = await self.stu.get_sensor_nodes()
-            sensor_node = get_sensor_node(sensor_nodes, self.identifier)
+            sensor_nodes = await registry.update(full=full)
+            sensor_node = registry.find(self.identifier)
             if sensor_node is None:
+                # Another application might have renamed a known node
+                full = True
                 await sleep(0.1)
 
         connection_attempt_time = monotonic()
@@ -153,9 +238,7 @@ class AsyncSensorNodeManager:
 
                 await sleep(0.1)
 
-        self.logger.info("Connected to sensor node: %s", sensor_node)
-
-        return self.sensor_node_class(self.stu.spu)
+        return sensor_node
 
     async def __aexit__(
         self,
@@ -178,11 +261,42 @@ class AsyncSensorNodeManager:
 
         """
 
+        registry = self.stu.registry
+        mac_address = self.mac_address
+        # The code might have changed data of the sensor node (e.g. the name)
+        if mac_address is not None and self.sensor_node is not None:
+            node = registry.nodes.get(mac_address)
+            try:
+                name = (
+                    await self.sensor_node.get_name()
+                    if exception_type is None and await self.stu.is_connected()
+                    else None
+                )
+            except (NoResponseError, ErrorResponseError):
+                name = None
+            if node is None or name is None:
+                registry.forget(mac_address)
+            elif node.name != name:
+                # Only store the new name, if it belongs to the MAC address
+                # (the node number might have pointed to another node)
+                try:
+                    same_node = (
+                        await self.sensor_node.get_mac_address() == mac_address
+                    )
+                except (NoResponseError, ErrorResponseError):
+                    same_node = False
+                if same_node:
+                    registry.add(node._replace(name=name))
+                else:
+                    registry.forget(mac_address)
+
         try:
             await self.stu.deactivate_bluetooth()
             self.logger.info("Disconnected from sensor node")
         except (NoResponseError, ErrorResponseError) as error:
             self.logger.warning("Error while disconnecting: %s", error)
+        if self.restart_registry:
+            registry.start(registry.interval)
 
 
 class SensorNodeInfo(NamedTuple):
@@ -308,6 +422,476 @@ class SensorNodeInfo(NamedTuple):
         return self.mac_address == other.mac_address
 
 
+# pylint: disable=too-many-instance-attributes
+
+
+class SensorNodeRegistry:
+    """Keep track of the sensor nodes available at the STU
+
+    The registry stores information about every sensor node it ever found
+    using the MAC address as key. Updating the registry only requests the
+    MAC address and RSSI of the available sensor nodes. It requests the
+    name of a node only, if the MAC address of the node is unknown (or on a
+    full update). The registry can update its data in the background (see
+    :meth:`start`) and store the data in a file (see :meth:`load`).
+
+    Args:
+
+        stu:
+            The STU used to retrieve information about sensor nodes
+
+    Examples:
+
+        Import required library code
+
+        >>> from asyncio import run
+        >>> from icotronic.can.connection import Connection
+
+        Update the registry of the STU
+
+        >>> async def update_registry():
+        ...     async with Connection() as stu:
+        ...         await stu.registry.update()
+        ...         # Only requests MAC address and RSSI
+        ...         return await stu.registry.update()
+        >>> nodes = run(update_registry())
+        >>> len(nodes) >= 1
+        True
+
+    """
+
+    def __init__(self, stu: STU) -> None:
+
+        self.stu = stu
+        self.logger = getLogger(__name__)
+
+        self.nodes: dict[EUI, SensorNodeInfo] = {}
+        """Information about all sensor nodes found by the registry"""
+
+        self.last_seen: dict[EUI, float] = {}
+        """Time (seconds since the epoch) each sensor node was found last"""
+
+        self.available: list[EUI] = []
+        """MAC addresses of the available sensor nodes (by node number)"""
+
+        self.filepath: Path | None = None
+        """File used to store the registry data"""
+
+        self.window: int | None = None
+        """Maximum number of requests waiting for a response at once
+
+        The value ``None`` uses the request window of the SPU.
+        """
+
+        self.interval = 1.0
+        """Time in seconds between two updates in the background"""
+
+        self.max_age = 24 * 60 * 60
+        """Maximum age in seconds of entries used to connect without scan"""
+
+        self.task: Task[None] | None = None
+        self.lock = Lock()
+
+    def __repr__(self) -> str:
+        """Get the textual representation of the registry
+
+        Returns:
+
+            A string that contains the available sensor nodes
+
+        """
+
+        nodes = "\n".join(repr(node) for node in self.available_nodes())
+        return nodes if nodes else "No sensor nodes available"
+
+    def available_nodes(self) -> list[SensorNodeInfo]:
+        """Get the sensor nodes available at the last update
+
+        Returns:
+
+            Information about the available sensor nodes
+
+        """
+
+        return [self.nodes[mac_address] for mac_address in self.available]
+
+    def add(self, node: SensorNodeInfo) -> None:
+        """Store information about a sensor node that is available right now
+
+        Args:
+
+            node:
+                Information about the sensor node
+
+        """
+
+        self.nodes[node.mac_address] = node
+        self.last_seen[node.mac_address] = time()
+
+        if self.filepath is not None:
+            self.save()
+
+    def cached(
+        self, identifier: str | EUI, max_age: float | None = None
+    ) -> SensorNodeInfo | None:
+        """Find a sensor node seen recently, even if it is not available
+
+        Args:
+
+            identifier:
+                The MAC address (`EUI`) or name (`str`) of the sensor node
+
+            max_age:
+                The maximum time in seconds since the registry found the
+                sensor node the last time; ``None`` uses :attr:`max_age`
+
+        Returns:
+
+            Information about the sensor node seen most recently or
+            ``None``, if the registry does not contain a recent entry for
+            the sensor node
+
+        Examples:
+
+            Import required library code
+
+            >>> from unittest.mock import MagicMock
+
+            Find a sensor node by name
+
+            >>> registry = SensorNodeRegistry(MagicMock())
+            >>> registry.add(SensorNodeInfo(name="Test-STH",
+            ...                             sensor_node_number=0,
+            ...                             mac_address=EUI(1),
+            ...                             rssi=-40))
+            >>> registry.cached("Test-STH").mac_address
+            EUI('00-00-00-00-00-01')
+            >>> registry.cached(EUI(1)).name
+            'Test-STH'
+
+            Old entries are ignored
+
+            >>> registry.last_seen[EUI(1)] -= 10
+            >>> registry.cached("Test-STH", max_age=5) is None
+            True
+
+        """
+
+        if max_age is None:
+            max_age = self.max_age
+
+        now = time()
+        candidates = [
+            node
+            for mac_address, node in self.nodes.items()
+            if (
+                node.name == identifier
+                if isinstance(identifier, str)
+                else mac_address == identifier
+            )
+            and now - self.last_seen.get(mac_address, 0) <= max_age
+        ]
+
+        return max(
+            candidates,
+            key=lambda node: self.last_seen[node.mac_address],
+            default=None,
+        )
+
+    def find(self, identifier: int | str | EUI) -> SensorNodeInfo | None:
+        """Find an available sensor node
+
+        Args:
+
+            identifier:
+                The MAC address (`EUI`), name (`str`), or node number (`int`)
+                of the sensor node
+
+        Returns:
+
+            Information about the sensor node or ``None``, if the sensor
+            node was not available at the last update
+
+        """
+
+        for node in self.available_nodes():
+            if (  # pylint: disable=too-many-boolean-expressions
+                isinstance(identifier, str)
+                and node.name == identifier
+                or isinstance(identifier, int)
+                and node.sensor_node_number == identifier
+                or isinstance(identifier, EUI)
+                and node.mac_address == identifier
+            ):
+                return node
+
+        return None
+
+    def forget(self, mac_address: EUI) -> None:
+        """Remove the information about a sensor node
+
+        Use this method, if the stored data of the sensor node (e.g. the
+        name) might be outdated. The next update will then request all data
+        of the sensor node again.
+
+        Args:
+
+            mac_address:
+                The MAC address of the sensor node
+
+        """
+
+        self.nodes.pop(mac_address, None)
+        self.last_seen.pop(mac_address, None)
+        if mac_address in self.available:
+            self.available.remove(mac_address)
+
+        if self.filepath is not None:
+            self.save()
+
+    async def update(self, full: bool = False) -> list[SensorNodeInfo]:
+        """Update the information about the available sensor nodes
+
+        The registry only uses a name, if the MAC address of the sensor node
+        (number) did not change while reading the name. Otherwise the next
+        update tries again.
+
+        Args:
+
+            full:
+                Request the name of every sensor node, even if the registry
+                already knows the name
+
+        Returns:
+
+            Information about the available sensor nodes
+
+        """
+
+        async with self.lock:
+            stu = self.stu
+            await stu.activate_bluetooth()
+            available_nodes = await stu.get_available_nodes()
+
+            responses = await stu.request_sensor_node_data(
+                range(available_nodes),
+                {17: "get MAC address", 12: "get RSSI"},
+                self.window,
+            )
+            mac_addresses = [
+                mac_address_from_response(mac_address)
+                for mac_address, _ in responses
+            ]
+
+            # Only request the names of unknown sensor nodes
+            unknown = [
+                node
+                for node, mac_address in enumerate(mac_addresses)
+                if full or mac_address not in self.nodes
+            ]
+            names = {
+                node: name_from_responses(first_name, second_name)
+                for node, (first_name, second_name) in zip(
+                    unknown,
+                    await stu.request_sensor_node_data(
+                        unknown,
+                        {
+                            5: "get first part of name",
+                            6: "get second part of name",
+                        },
+                        self.window,
+                    ),
+                )
+            }
+            if names:
+                # Node numbers change, if sensor nodes appear or disappear.
+                # We only use a name, if the node still has the same MAC
+                # address after we read the name.
+                confirmed = await stu.request_sensor_node_data(
+                    unknown, {17: "get MAC address"}, self.window
+                )
+                for node, (mac_address,) in zip(unknown, confirmed):
+                    if mac_address_from_response(mac_address) != (
+                        mac_addresses[node]
+                    ):
+                        del names[node]
+
+            now = time()
+            available = []
+            for node, (mac_address, (_, rssi)) in enumerate(
+                zip(mac_addresses, responses)
+            ):
+                known = self.nodes.get(mac_address)
+                name = names.get(node, None if known is None else known.name)
+                if name is None:
+                    continue
+                self.nodes[mac_address] = SensorNodeInfo(
+                    name=name,
+                    sensor_node_number=node,
+                    mac_address=mac_address,
+                    rssi=rssi_from_response(rssi),
+                )
+                self.last_seen[mac_address] = now
+                available.append(mac_address)
+            self.available = available
+
+            if names and self.filepath is not None:
+                self.save()
+
+        nodes = self.available_nodes()
+        self.logger.debug("Updated sensor node registry: %s", nodes)
+
+        return nodes
+
+    async def _update_periodically(self, interval: float) -> None:
+        """Update the registry periodically
+
+        Args:
+
+            interval:
+                The time in seconds between two updates
+
+        """
+
+        while True:
+            try:
+                await self.update()
+            except (ErrorResponseError, NoResponseError) as error:
+                self.logger.warning(
+                    "Unable to update sensor node registry: %s", error
+                )
+            await sleep(interval)
+
+    def running(self) -> bool:
+        """Check if the registry updates its data in the background
+
+        Returns:
+
+            ``True``, if the background update is active, ``False``
+            otherwise
+
+        """
+
+        return self.task is not None and not self.task.done()
+
+    def start(self, interval: float = 1.0) -> None:
+        """Start updating the registry in the background
+
+        Args:
+
+            interval:
+                The time in seconds between two updates
+
+        Raises:
+
+            ValueError:
+                If the interval is not positive
+
+        """
+
+        if interval <= 0:
+            raise ValueError(f"Invalid update interval: {interval}")
+
+        self.interval = interval
+        if not self.running():
+            self.task = create_task(self._update_periodically(interval))
+
+    async def stop(self) -> None:
+        """Stop updating the registry in the background"""
+
+        if self.task is None:
+            return
+
+        # Cancelling the task while it waits for responses would leave
+        # responses for the canceled requests on the bus
+        async with self.lock:
+            self.task.cancel()
+        try:
+            await self.task
+        except CancelledError:
+            pass
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            self.logger.error(
+                "Background update of sensor node registry failed: %s", error
+            )
+        self.task = None
+
+        if self.filepath is not None:
+            self.save()
+
+    def load(self, filepath: str | Path) -> None:
+        """Load registry data from a file
+
+        The registry will also store its data in this file, after it found
+        new sensor nodes and when the background update stops. If the file
+        does not exist or contains invalid data, then the registry starts
+        without stored data.
+
+        Args:
+
+            filepath:
+                The location of the (JSON) file
+
+        """
+
+        self.filepath = Path(filepath)
+
+        try:
+            with open(self.filepath, encoding="utf-8") as file:
+                data = load(file)
+            for mac, node in data.items():
+                mac_address = EUI(mac)
+                self.nodes[mac_address] = SensorNodeInfo(
+                    name=node["name"],
+                    sensor_node_number=node["sensor_node_number"],
+                    mac_address=mac_address,
+                    rssi=node["rssi"],
+                )
+                self.last_seen[mac_address] = node["last_seen"]
+        except FileNotFoundError:
+            pass
+        except (
+            AddrFormatError,
+            AttributeError,
+            KeyError,
+            TypeError,
+            ValueError,
+        ) as error:
+            self.logger.warning(
+                "Ignoring invalid sensor node registry data in “%s”: %s",
+                self.filepath,
+                error,
+            )
+
+    def save(self) -> None:
+        """Store the registry data in the file specified with :meth:`load`"""
+
+        if self.filepath is None:
+            return
+
+        data = {
+            str(mac_address): {
+                "name": node.name,
+                "sensor_node_number": node.sensor_node_number,
+                "rssi": node.rssi,
+                "last_seen": self.last_seen.get(mac_address, 0),
+            }
+            for mac_address, node in self.nodes.items()
+        }
+        try:
+            with open(self.filepath, "w", encoding="utf-8") as file:
+                dump(data, file, indent=2)
+        except OSError as error:
+            self.logger.warning(
+                "Unable to store sensor node registry in “%s”: %s",
+                self.filepath,
+                error,
+            )
+
+
+# pylint: enable=too-many-instance-attributes
+
+
 class STU(Node):
     """Communicate and control a connected STU
 
@@ -336,6 +920,8 @@ class STU(Node):
 
         super().__init__(spu, NodeEEPROM, NodeId("STU 1"))
         self.logger = getLogger(__name__)
+        self.registry = SensorNodeRegistry(self)
+        """Information about the sensor nodes available at the STU"""
 
     async def activate_bluetooth(self) -> None:
         """Activate Bluetooth on the STU
@@ -769,9 +1355,69 @@ class STU(Node):
 
         return mac_address
 
-    async def get_sensor_nodes(self) -> list[SensorNodeInfo]:
+    async def request_sensor_node_data(
+        self,
+        sensor_node_numbers: Sequence[int],
+        subcommands: Mapping[int, str],
+        window: int | None = None,
+    ) -> list[list[CANMessage]]:
+        """Request information about multiple sensor nodes concurrently
+
+        Args:
+
+            sensor_node_numbers:
+                The numbers of the sensor nodes
+
+            subcommands:
+                A mapping from Bluetooth subcommands to their description
+
+            window:
+                The maximum number of requests that wait for a response of
+                the STU at the same time or ``None`` to use the request
+                window of the SPU
+
+        Returns:
+
+            A list that contains the responses (in the order of the given
+            subcommands) for every sensor node
+
+        """
+
+        requests = [
+            self.spu.bluetooth_request(
+                node=self.id,
+                subcommand=subcommand,
+                sensor_node_number=node,
+                description=f"{description} of “{node}” from “{self.id}”",
+            )
+            for node in sensor_node_numbers
+            for subcommand, description in subcommands.items()
+        ]
+        responses = await self.spu.gather_requests(requests, window=window)
+
+        number = len(subcommands)
+        return [
+            responses[start : start + number]
+            for start in range(0, len(responses), number)
+        ]
+
+    async def get_sensor_nodes(
+        self, window: int | None = None
+    ) -> list[SensorNodeInfo]:
         """Retrieve a list of available sensor nodes
 
+        The coroutine requests the information about all sensor nodes
+        concurrently. Requests for the MAC addresses of different nodes
+        still wait for each other, since their responses do not show which
+        node they belong to.
+
+        Args:
+
+            window:
+                The maximum number of requests (four for every sensor node)
+                that wait for a response of the STU at the same time or
+                ``None`` to use the request window of the SPU
+
         Returns:
 
             A list of available nodes including node number, name, MAC address
@@ -819,20 +1465,33 @@ class STU(Node):
 
         await self.activate_bluetooth()
         available_nodes = await self.get_available_nodes()
-        nodes = []
-        for node in range(available_nodes):
-            mac_address = await self.get_mac_address(node)
-            rssi = await self.get_rssi(node)
-            name = await self.get_name(node)
-
-            nodes.append(
-                SensorNodeInfo(
-                    sensor_node_number=node,
-                    mac_address=mac_address,
-                    name=name,
-                    rssi=rssi,
-                )
+
+        # Request MAC address, RSSI and both parts of the name of every node
+        responses = await self.request_sensor_node_data(
+            range(available_nodes),
+            {
+                17: "get MAC address",
+                12: "get RSSI",
+                5: "get first part of name",
+                6: "get second part of name",
+            },
+            window,
+        )
+
+        nodes = [
+            SensorNodeInfo(
+                sensor_node_number=node,
+                mac_address=mac_address_from_response(mac_address),
+                name=name_from_responses(first_name, second_name),
+                rssi=rssi_from_response(rssi),
             )
+            for node, (
+                mac_address,
+                rssi,
+                first_name,
+                second_name,
+            ) in enumerate(responses)
+        ]
 
         self.logger.info("Found sensor nodes: %s", nodes)
 
@@ -891,7 +1550,7 @@ class STU(Node):
         ):
             sensor_nodes_before = set(sensor_nodes)
             sensor_nodes = (
-                set(await self.get_sensor_nodes()) | sensor_nodes_before
+                set(await self.registry.update()) | sensor_nodes_before
             )
             await sleep(0.5)
 
@@ -955,6 +1614,89 @@ class STU(Node):
         return AsyncSensorNodeManager(self, identifier, sensor_node_class)
 
 
+# -- Functions ----------------------------------------------------------------
+
+
+def mac_address_from_response(response: CANMessage) -> EUI:
+    """Get the MAC address from the response to a MAC address request
+
+    Args:
+
+        response:
+            The response to the Bluetooth subcommand “get MAC address”
+
+    Returns:
+
+        The MAC address contained in the response
+
+    Examples:
+
+        Get the MAC address of a response
+
+        >>> mac_address_from_response(CANMessage(
+        ...     data=[17, 1, 0x81, 0xde, 0x01, 0xd7, 0x6b, 0x08]))
+        EUI('08-6B-D7-01-DE-81')
+
+    """
+
+    return EUI(":".join(f"{byte:02x}" for byte in response.data[:1:-1]))
+
+
+def name_from_responses(first: CANMessage, second: CANMessage) -> str:
+    """Get the name from the responses to the name requests
+
+    Args:
+
+        first:
+            The response to the request for the first part of the name
+
+        second:
+            The response to the request for the second part of the name
+
+    Returns:
+
+        The name contained in the responses
+
+    Examples:
+
+        Get the name of the responses
+
+        >>> name_from_responses(
+        ...     CANMessage(data=[5, 1, *b"Test-S"]),
+        ...     CANMessage(data=[6, 1, *b"TH", 0, 0, 0, 0]))
+        'Test-STH'
+
+    """
+
+    return convert_bytes_to_text(first.data[2:]) + convert_bytes_to_text(
+        second.data[2:]
+    )
+
+
+def rssi_from_response(response: CANMessage) -> int:
+    """Get the RSSI from the response to a RSSI request
+
+    Args:
+
+        response:
+            The response to the Bluetooth subcommand “get RSSI”
+
+    Returns:
+
+        The RSSI contained in the response
+
+    Examples:
+
+        Get the RSSI of a response
+
+        >>> rssi_from_response(CANMessage(data=[12, 1, 198, 0, 0, 0, 0, 0]))
+        -58
+
+    """
+
+    return int.from_bytes(response.data[2:3], byteorder="little", signed=True)
+
+
 # -- Main ---------------------------------------------------------------------
 
 if __name__ == "__main__":
@@ -0,0 +1,343 @@
+"""Decode ICOtronic CAN frames without creating message objects
+
+Creating a :class:`Message` (and its :class:`Identifier` and
+:class:`Command`) for every frame is convenient, but slow, if you want to
+inspect a large amount of CAN traffic (e.g. a long log file). The functions
+in this module only extract the parts of the identifier using bit
+operations. To get a textual representation of the decoded parts use the
+(cached) functions :func:`node_name` and :func:`command_name`.
+"""
+
+# -- Imports ------------------------------------------------------------------
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from typing import NamedTuple
+
+from numpy import (
+    asarray,
+    bool_,
+    dtype,
+    float64,
+    frombuffer,
+    fromiter,
+    ndarray,
+    uint8,
+    uint32,
+    zeros,
+)
+from can import Message as CANMessage
+
+from icotronic.can.protocol.blocks import (
+    blocks,
+    UnknownBlockError,
+    UnknownBlockCommandError,
+)
+from icotronic.can.node.id import NodeId
+
+# -- Attributes ---------------------------------------------------------------
+
+FRAME_DTYPE = dtype([
+    ("timestamp", float64),
+    ("sender", uint8),
+    ("receiver", uint8),
+    ("block", uint8),
+    ("block_command", uint8),
+    ("request", bool_),
+    ("error", bool_),
+    ("length", uint8),
+    ("data", uint8, (8,)),
+])
+"""Data type of the records returned by :func:`decode_frames`"""
+
+# -- Classes ------------------------------------------------------------------
+
+
+class Frame(NamedTuple):
+    """Decoded parts of an ICOtronic CAN frame"""
+
+    sender: int
+    """Number of the sending node"""
+
+    receiver: int
+    """Number of the receiving node"""
+
+    block: int
+    """Number of the block"""
+
+    block_command: int
+    """Number of the block command"""
+
+    request: bool
+    """``True`` for a request, ``False`` for an acknowledgment"""
+
+    error: bool
+    """``True``, if the error bit is set"""
+
+    data: bytes
+    """Payload of the frame"""
+
+    def __str__(self) -> str:
+        """Get the textual representation of the frame
+
+        Returns:
+
+            A string that describes the various attributes of the frame in
+            the same format as an :class:`Identifier`
+
+        Examples:
+
+            Get the textual representation of a decoded frame
+
+            >>> print(decode_frame(0b0_000000_00000001_1_0_0_01111_0_00001))
+            [SPU 1 → STH 1, Block: System, Command: Reset, Request]
+
+        """
+
+        block, block_command = command_name(self.block, self.block_command)
+        attributes = [
+            f"{node_name(self.sender)} → {node_name(self.receiver)}",
+            f"Block: {block}",
+            f"Command: {block_command}",
+            "Request" if self.request else "Acknowledge",
+        ]
+        if self.error:
+            attributes.append("Error")
+
+        return f"[{', '.join(attributes)}]"
+
+
+# -- Functions ----------------------------------------------------------------
+
+
+@lru_cache(maxsize=32)
+def node_name(node: int) -> str:
+    """Get the name of a node
+
+    Args:
+
+        node:
+            The number of the node
+
+    Returns:
+
+        The textual representation of the node
+
+    Examples:
+
+        Get the names of some nodes
+
+        >>> node_name(15)
+        'SPU 1'
+        >>> node_name(31)
+        'Broadcast Without Acknowledgment'
+
+    """
+
+    return repr(NodeId(node))
+
+
+@lru_cache(maxsize=1024)
+def command_name(block: int, block_command: int) -> tuple[str, str]:
+    """Get the names of a block and block command
+
+    Args:
+
+        block:
+            The number of the block
+
+        block_command:
+            The number of the block command
+
+    Returns:
+
+        A tuple containing the name of the block and the block command
+
+    Examples:
+
+        Get the names of some commands
+
+        >>> command_name(0, 1)
+        ('System', 'Reset')
+        >>> command_name(0b010101, 1)
+        ('Unknown', 'Unknown')
+
+    """
+
+    try:
+        block_info = blocks[block]
+    except UnknownBlockError:
+        return ("Unknown", "Unknown")
+
+    try:
+        return (block_info.name, block_info[block_command].name)
+    except UnknownBlockCommandError:
+        return (block_info.name, "Unknown")
+
+
+def decode_frame(arbitration_id: int, data: bytes | bytearray = b"") -> Frame:
+    """Decode a single CAN frame
+
+    Args:
+
+        arbitration_id:
+            The 29 bit identifier of the CAN frame
+
+        data:
+            The payload of the CAN frame
+
+    Returns:
+
+        The decoded parts of the frame
+
+    Examples:
+
+        Decode an acknowledgment frame
+
+        >>> #                 V block  number   A E R send. R rec.
+        >>> decode_frame(0b0_000100_00000001_0_1_0_00001_0_01111,
+        ...              b"\\x01\\x02")
+        ... # doctest:+NORMALIZE_WHITESPACE
+        Frame(sender=1, receiver=15, block=4, block_command=1, request=False,
+              error=True, data=b'\\x01\\x02')
+
+    """
+
+    return Frame(
+        (arbitration_id >> 6) & 0x1F,
+        arbitration_id & 0x1F,
+        (arbitration_id >> 22) & 0x3F,
+        (arbitration_id >> 14) & 0xFF,
+        bool(arbitration_id >> 13 & 1),
+        bool(arbitration_id >> 12 & 1),
+        bytes(data),
+    )
+
+
+def decode_frames(
+    arbitration_ids: Sequence[int] | ndarray,
+    data: Sequence[bytes | bytearray] | None = None,
+    timestamps: Sequence[float] | ndarray | None = None,
+) -> ndarray:
+    """Decode a batch of CAN frames
+
+    Args:
+
+        arbitration_ids:
+            The 29 bit identifiers of the CAN frames
+
+        data:
+            The payload (at most 8 bytes) of each CAN frame
+
+        timestamps:
+            The time (in seconds) each CAN frame was received
+
+    Returns:
+
+        A structured NumPy array with the data type :data:`FRAME_DTYPE`
+        that contains one record for every frame
+
+    Examples:
+
+        Decode some frames
+
+        >>> records = decode_frames(
+        ...     [0b0_000000_00000001_1_0_0_01111_0_00001,
+        ...      0b0_000000_00000001_0_0_0_00001_0_01111,
+        ...      0b0_000100_00100000_0_0_0_00001_0_01111],
+        ...     data=[b"", b"", bytes(range(8))],
+        ...     timestamps=[1.0, 1.5, 2.0])
+        >>> records["sender"]
+        array([15,  1,  1], dtype=uint8)
+        >>> records["request"]
+        array([ True, False, False])
+        >>> records["block_command"][records["block"] == 4]
+        array([32], dtype=uint8)
+        >>> records[2]["data"]
+        array([0, 1, 2, 3, 4, 5, 6, 7], dtype=uint8)
+        >>> records["timestamp"]
+        array([1. , 1.5, 2. ])
+
+    """
+
+    ids = asarray(arbitration_ids, dtype=uint32)
+    records = zeros(len(ids), dtype=FRAME_DTYPE)
+
+    records["sender"] = (ids >> 6) & 0x1F
+    records["receiver"] = ids & 0x1F
+    records["block"] = (ids >> 22) & 0x3F
+    records["block_command"] = (ids >> 14) & 0xFF
+    records["request"] = (ids >> 13) & 1
+    records["error"] = (ids >> 12) & 1
+
+    if timestamps is not None:
+        records["timestamp"] = timestamps
+
+    if data is not None:
+        lengths = fromiter(map(len, data), dtype=uint8, count=len(ids))
+        records["length"] = lengths
+        if len(ids) > 0 and (lengths == 8).all():
+            # Convert full frames (e.g. streaming data) with a single copy
+            records["data"] = frombuffer(b"".join(data), dtype=uint8).reshape(
+                -1, 8
+            )
+        else:
+            payload = records["data"]
+            for index, frame_data in enumerate(data):
+                payload[index, : len(frame_data)] = memoryview(frame_data)
+
+    return records
+
+
+def decode_messages(messages: Iterable[CANMessage]) -> ndarray:
+    """Decode a batch of python-can messages
+
+    Args:
+
+        messages:
+            The python-can messages that should be decoded
+
+    Returns:
+
+        A structured NumPy array with the data type :data:`FRAME_DTYPE`
+        that contains one record for every message
+
+    Examples:
+
+        Decode some python-can messages
+
+        >>> from icotronic.can.protocol.message import Message
+        >>> messages = [
+        ...     Message(block="System", block_command="Reset",
+        ...             sender="SPU 1", receiver="STU 1",
+        ...             request=True).to_python_can(),
+        ...     Message(block="EEPROM", block_command="Read",
+        ...             sender="STU 1", receiver="SPU 1",
+        ...             request=False, data=[0] * 8).to_python_can(),
+        ... ]
+        >>> records = decode_messages(messages)
+        >>> [command_name(record["block"], record["block_command"])
+        ...  for record in records]
+        [('System', 'Reset'), ('EEPROM', 'Read')]
+        >>> records["length"]
+        array([0, 8], dtype=uint8)
+
+    """
+
+    frames = list(messages)
+
+    return decode_frames(
+        [message.arbitration_id for message in frames],
+        [message.data for message in frames],
+        [message.timestamp for message in frames],
+    )
+
+
+# -- Main ---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    from doctest import testmod
+
+    testmod()
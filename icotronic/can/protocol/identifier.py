@@ -9,6 +9,7 @@ for more information
 
 from __future__ import annotations
 
+from functools import lru_cache
 
 from icotronic.can.protocol.command import Command
 from icotronic.can.node.id import NodeId
@@ -124,46 +125,35 @@ class Identifier:
         receiver: NodeId | None | str | int = None,
     ) -> None:
 
-        def set_part(start, width, number):
-            """Store bit pattern number at bit start of the identifier"""
-
-            identifier_ones = 0b11111_11111111_11111111_11111111
-            mask = (1 << width) - 1
-
-            # Set all bits for targeted part to 0
-            self.value &= (mask << start) ^ identifier_ones
-            # Make sure we use the correct number of bits for number
-            number = number & mask
-            # Set command bits to given value
-            self.value |= number << start
-
-        self.value = identifier[0] if identifier else 0
-
-        if command is not None:
-            # A command can be a number or a `Command` object
-            command_as_number = (
-                command if isinstance(command, int) else command.value
-            )
-            set_part(start=12, width=16, number=command_as_number)
-
-        set_part(
-            start=12,
-            width=16,
-            number=Command(
-                (self.value >> 12) & 0xFFFF,
-                block=block,
-                block_command=block_command,
-                request=request,
-                error=error,
-            ).value,
+        value = identifier[0] if identifier else 0
+
+        if (
+            command is None
+            and block is None
+            and block_command is None
+            and error is None
+            and request is None
+            and sender is None
+            and receiver is None
+        ):
+            self.value = value
+            return
+
+        # Use hashable numbers for objects, so we can look up the value in
+        # the cache of precomputed identifiers
+        self.value = identifier_value(
+            value,
+            command=command.value if isinstance(command, Command) else command,
+            block=block,
+            block_command=block_command,
+            error=error,
+            request=request,
+            sender=sender.value if isinstance(sender, NodeId) else sender,
+            receiver=(
+                receiver.value if isinstance(receiver, NodeId) else receiver
+            ),
         )
 
-        # Sender and receiver can be either an integer or a string like object
-        if sender is not None:
-            set_part(start=6, width=5, number=NodeId(sender).value)
-        if receiver is not None:
-            set_part(start=0, width=5, number=NodeId(receiver).value)
-
     def __eq__(self, other: object) -> bool:
         """Compare this identifier to another object
 
@@ -265,13 +255,13 @@ class Identifier:
 
         """
 
-        return Identifier(
-            self.value,
-            sender=self.receiver(),
-            receiver=self.sender(),
-            request=False,
-            error=error,
-        )
+        value = self.value
+        sender = (value >> 6) & 0x1F
+        receiver = value & 0x1F
+        # Clear sender, receiver, request and error bits
+        value &= ~(0x1F << 6 | 0x1F | 1 << 13 | 1 << 12)
+
+        return Identifier(value | receiver << 6 | sender | int(error) << 12)
 
     def command(self) -> int:
         """Get the command part of the identifier
@@ -587,6 +577,97 @@ class Identifier:
         return repr(NodeId(self.receiver()))
 
 
+# -- Functions ----------------------------------------------------------------
+
+
+# pylint: disable=too-many-arguments
+
+
+@lru_cache(maxsize=1024)
+def identifier_value(
+    identifier: int = 0,
+    *,
+    command: int | None = None,
+    block: None | str | int = None,
+    block_command: None | str | int = None,
+    error: bool | None = None,
+    request: bool | None = None,
+    sender: None | str | int = None,
+    receiver: None | str | int = None,
+) -> int:
+    """Calculate the value of an identifier
+
+    Since the function caches its results, creating the identifiers of
+    frequently used messages (e.g. requests and their acknowledgments) only
+    requires the (relatively expensive) lookup of names once. For a
+    description of the arguments, please take a look at :class:`Identifier`.
+
+    Returns:
+
+        The 29 bit value of the specified identifier
+
+    Examples:
+
+        Calculate the value of an identifier
+
+        >>> value = identifier_value(block="System", block_command="Reset",
+        ...                          sender="SPU 1", receiver="STH 1",
+        ...                          request=True)
+        >>> Identifier(value)
+        [SPU 1 → STH 1, Block: System, Command: Reset, Request]
+
+        Calculating the value again uses the cached result
+
+        >>> identifier_value(block="System", block_command="Reset",
+        ...                  sender="SPU 1", receiver="STH 1",
+        ...                  request=True) == value
+        True
+
+    """
+
+    def set_part(start, width, number):
+        """Store bit pattern number at bit start of the identifier"""
+
+        nonlocal value
+
+        identifier_ones = 0b11111_11111111_11111111_11111111
+        mask = (1 << width) - 1
+
+        # Set all bits for targeted part to 0
+        value &= (mask << start) ^ identifier_ones
+        # Make sure we use the correct number of bits for number
+        number = number & mask
+        # Set command bits to given value
+        value |= number << start
+
+    value = identifier
+
+    if command is not None:
+        set_part(start=12, width=16, number=command)
+
+    set_part(
+        start=12,
+        width=16,
+        number=Command(
+            (value >> 12) & 0xFFFF,
+            block=block,
+            block_command=block_command,
+            request=request,
+            error=error,
+        ).value,
+    )
+
+    # Sender and receiver can be either an integer or a string like object
+    if sender is not None:
+        set_part(start=6, width=5, number=NodeId(sender).value)
+    if receiver is not None:
+        set_part(start=0, width=5, number=NodeId(receiver).value)
+
+    return value
+
+
+# pylint: enable=too-many-arguments
+
 # -- Main ---------------------------------------------------------------------
 
 if __name__ == "__main__":
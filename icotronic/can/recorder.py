@@ -0,0 +1,141 @@
+"""Support for recording CAN traffic in a compact binary format
+
+The recorder stores the raw CAN frames in the Binary Logging Format (BLF)
+supported by python-can. Compared to the text log (``can.log``) this format
+does not require decoding frames while recording. To get the human readable
+explanation of the recorded frames later, you can use the function
+:func:`render_recording` (or the ICOn subcommand ``log``).
+"""
+
+# -- Imports ------------------------------------------------------------------
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime
+from logging import getLogger
+from os import PathLike
+from queue import SimpleQueue
+from threading import Thread
+
+from can import BLFWriter, Listener, LogReader, Message as CANMessage
+
+from icotronic.can.protocol.message import Message
+
+# -- Classes ------------------------------------------------------------------
+
+
+class Recorder(Listener):
+    """Write CAN frames to a binary log file in a background thread
+
+    Args:
+
+        filepath:
+            The path of the binary log file
+
+    Examples:
+
+        Import required library code
+
+        >>> from tempfile import TemporaryDirectory
+        >>> from pathlib import Path
+
+        Record a frame and render it afterwards
+
+        >>> message = Message(block="System", block_command="Reset",
+        ...                   sender="SPU 1", receiver="STH 1",
+        ...                   request=True)
+        >>> with TemporaryDirectory() as directory:
+        ...     filepath = Path(directory) / "can.blf"
+        ...     recorder = Recorder(filepath)
+        ...     recorder(message.to_python_can())
+        ...     recorder.stop()
+        ...     lines = list(render_recording(filepath))
+        >>> len(lines)
+        1
+        >>> print(lines[0].split(" ", 2)[2]) # doctest:+NORMALIZE_WHITESPACE
+        0b00000000000000110001111000001 0 #
+        [SPU 1 → STH 1, Block: System, Command: Reset, Request]
+
+    """
+
+    def __init__(self, filepath: str | PathLike[str]) -> None:
+
+        self.writer = BLFWriter(filepath)
+        self.queue: SimpleQueue[CANMessage | None] = SimpleQueue()
+        self.thread = Thread(target=self._write, name="CAN Recorder")
+        self.thread.start()
+
+    def _write(self) -> None:
+        """Write queued messages until the recorder stops"""
+
+        queue = self.queue
+        write = self.writer.on_message_received
+        while (message := queue.get()) is not None:
+            write(message)
+
+    def on_message_received(self, msg: CANMessage) -> None:
+        """Record a message
+
+        Args:
+
+            msg:
+                The CAN message that should be recorded
+
+        """
+
+        self.queue.put(msg)
+
+    def on_error(self, exc: Exception) -> None:
+        """Handle any exception in the receive thread
+
+        Args:
+
+            exc:
+                The exception causing the thread to stop
+
+        """
+
+        getLogger().error("Error while monitoring CAN bus data: %s", exc)
+
+    def stop(self) -> None:
+        """Write all recorded messages and close the log file"""
+
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+            self.writer.stop()
+
+
+# -- Functions ----------------------------------------------------------------
+
+
+def render_recording(filepath: str | PathLike[str]) -> Iterator[str]:
+    """Convert recorded CAN frames into human readable text
+
+    The output uses the same format as the text log of the CAN messages.
+
+    Args:
+
+        filepath:
+            The path of a log file supported by python-can (e.g. BLF or ASC)
+
+    Returns:
+
+        An iterator over the textual representation of the recorded frames
+
+    """
+
+    for message in LogReader(filepath):
+        time = datetime.fromtimestamp(message.timestamp)
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        milliseconds = time.microsecond // 1000
+        yield f"{timestamp},{milliseconds:03d} {Message(message)}"
+
+
+# -- Main ---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    from doctest import testmod
+
+    testmod()
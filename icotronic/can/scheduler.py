@@ -0,0 +1,364 @@
+"""Schedule outbound CAN frames according to their priority
+
+The scheduler sends frames immediately, as long as the rate of sent frames
+stays below a certain limit. If frames exceed this limit, then the
+scheduler queues them and sends them later, frames of a higher priority
+class (e.g. the request to stop streaming) first.
+"""
+
+# -- Imports ------------------------------------------------------------------
+
+from __future__ import annotations
+
+from asyncio import Future, get_running_loop, sleep, Task
+from enum import IntEnum
+from heapq import heappop, heappush
+from itertools import count
+from time import monotonic, time
+
+from can import BusABC, CanError, Listener, Message as CANMessage
+
+# -- Attributes ---------------------------------------------------------------
+
+CONTROL_COMMANDS = {
+    (0x00, 0x01),  # System: Reset
+    (0x00, 0x02),  # System: Get/Set State
+    (0x00, 0x03),  # System: Mode
+    (0x00, 0x04),  # System: Alarm
+}
+"""Block and block command numbers of requests that control a node"""
+
+# -- Classes ------------------------------------------------------------------
+
+
+class Priority(IntEnum):
+    """Priority classes of outbound frames (lower values first)"""
+
+    CONTROL = 0
+    """Control commands (e.g. reset, state changes, stopping the stream)"""
+
+    STREAMING = 1
+    """Other requests of the streaming block (e.g. starting the stream)"""
+
+    METADATA = 2
+    """Requests for metadata (e.g. product data, names or MAC addresses)"""
+
+    BULK = 3
+    """Bulk data transfer (e.g. EEPROM access)"""
+
+
+# pylint: disable=too-many-instance-attributes
+
+
+class Scheduler:
+    """Send CAN frames using a token bucket rate limit and priority classes
+
+    Args:
+
+        bus:
+            The CAN bus used to send the frames
+
+        rate:
+            The maximum (average) number of frames sent per second
+
+        burst:
+            The maximum number of frames sent at once without delay
+
+    Examples:
+
+        Import required library code
+
+        >>> from asyncio import gather, run
+        >>> from can import Bus
+
+        Send frames with different priorities
+
+        >>> async def send_frames():
+        ...     with (Bus(interface="virtual", channel="scheduler") as bus,
+        ...           Bus(interface="virtual", channel="scheduler") as other):
+        ...         scheduler = Scheduler(bus, rate=1000, burst=2)
+        ...         await gather(*(
+        ...             scheduler.send(CANMessage(data=[number]), priority)
+        ...             for number, priority in enumerate((Priority.BULK,
+        ...                                                Priority.BULK,
+        ...                                                Priority.BULK,
+        ...                                                Priority.CONTROL))
+        ...         ))
+        ...         received = [other.recv(0).data[0] for _ in range(4)]
+        ...         return scheduler, received
+        >>> scheduler, received = run(send_frames())
+
+        The control frame overtakes the queued bulk frame
+
+        >>> received
+        [0, 1, 3, 2]
+        >>> scheduler # doctest:+ELLIPSIS
+        Sent: 4, Delayed: 2, Maximum Queue Depth: 2, Average Delay: ... ms
+
+    """
+
+    def __init__(
+        self, bus: BusABC, rate: float = 1000, burst: int = 10
+    ) -> None:
+
+        if rate <= 0:
+            raise ValueError(f"Invalid frame rate: {rate}")
+        if burst < 1:
+            raise ValueError(f"Invalid burst size: {burst}")
+
+        self.bus = bus
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last_update = monotonic()
+
+        self.queue: list[tuple[int, int, CANMessage, Future[None], float]] = []
+        self.sequence = count()
+        self.task: Task[None] | None = None
+
+        self.sent = [0] * len(Priority)
+        """Number of sent frames for every priority class"""
+
+        self.delayed = 0
+        """Number of frames that had to wait in the queue"""
+
+        self.delay = 0.0
+        """Total time in seconds frames waited in the queue"""
+
+        self.maximum_depth = 0
+        """Maximum number of frames stored in the queue at once"""
+
+        self.listeners: list[Listener] = []
+        """Listeners notified about every sent frame (e.g. to log it)"""
+
+    def __repr__(self) -> str:
+        """Get the textual representation of the scheduler statistics
+
+        Returns:
+
+            A string containing statistics about the sent frames
+
+        Examples:
+
+            Get the representation of a new scheduler
+
+            >>> from can import Bus
+            >>> with Bus(interface="virtual", channel="scheduler") as bus:
+            ...     Scheduler(bus)
+            Sent: 0, Delayed: 0, Maximum Queue Depth: 0
+
+        """
+
+        attributes = [
+            f"Sent: {sum(self.sent)}",
+            f"Delayed: {self.delayed}",
+            f"Maximum Queue Depth: {self.maximum_depth}",
+        ]
+        if self.delayed > 0:
+            attributes.append(
+                f"Average Delay: {self.delay / self.delayed * 1000:.2f} ms"
+            )
+
+        return ", ".join(attributes)
+
+    def _take_token(self) -> float:
+        """Take a token from the bucket, if possible
+
+        Returns:
+
+            ``0``, if the bucket contained a token or the time in seconds
+            until the next token is available
+
+        """
+
+        now = monotonic()
+        self.tokens = min(
+            self.burst, self.tokens + (now - self.last_update) * self.rate
+        )
+        self.last_update = now
+
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+
+        return (1 - self.tokens) / self.rate
+
+    def _send(self, message: CANMessage, priority: Priority) -> None:
+        """Send a frame on the CAN bus
+
+        Args:
+
+            message:
+                The frame that should be sent
+
+            priority:
+                The priority class of the frame
+
+        """
+
+        # Use the same clock as python-can for received frames, so that
+        # recorded sent and received frames use comparable timestamps
+        message.timestamp = time()
+        message.is_rx = False
+        self.bus.send(message)
+        self.sent[priority] += 1
+        for listener in self.listeners:
+            listener(message)
+
+    async def _process_queue(self) -> None:
+        """Send queued frames as soon as the rate limit allows it"""
+
+        queue = self.queue
+        try:
+            while queue:
+                if queue[0][3].cancelled():
+                    heappop(queue)
+                    continue
+
+                delay = self._take_token()
+                if delay > 0:
+                    await sleep(delay)
+                    continue
+
+                priority, _, message, future, queued = heappop(queue)
+                if future.cancelled():
+                    # Do not waste the token on a frame nobody waits for
+                    self.tokens += 1
+                    continue
+                # Report every problem to the sender of the frame. Otherwise
+                # the remaining senders would wait for the stopped task.
+                # pylint: disable=broad-exception-caught
+                try:
+                    self._send(message, Priority(priority))
+                except Exception as error:
+                    future.set_exception(error)
+                    continue
+                # pylint: enable=broad-exception-caught
+                self.delay += monotonic() - queued
+                future.set_result(None)
+        finally:
+            # Nobody sends the remaining frames (e.g. if the event loop
+            # cancelled the task)
+            while queue:
+                future = heappop(queue)[3]
+                if not future.done():
+                    future.set_exception(
+                        CanError("Scheduler stopped before sending frame")
+                    )
+
+    def depth(self) -> int:
+        """Get the number of frames waiting in the queue
+
+        Returns:
+
+            The current queue depth
+
+        """
+
+        return len(self.queue)
+
+    async def send(
+        self, message: CANMessage, priority: Priority = Priority.METADATA
+    ) -> None:
+        """Send a CAN frame
+
+        The coroutine returns after the frame was sent.
+
+        Args:
+
+            message:
+                The frame that should be sent
+
+            priority:
+                The priority class of the frame
+
+        """
+
+        if not self.queue and self._take_token() == 0:
+            self._send(message, priority)
+            return
+
+        future: Future[None] = get_running_loop().create_future()
+        heappush(
+            self.queue,
+            (priority, next(self.sequence), message, future, monotonic()),
+        )
+        self.delayed += 1
+        self.maximum_depth = max(self.maximum_depth, len(self.queue))
+
+        if self.task is None or self.task.done():
+            self.task = get_running_loop().create_task(self._process_queue())
+
+        await future
+
+
+# pylint: enable=too-many-instance-attributes
+
+# -- Functions ----------------------------------------------------------------
+
+
+def request_priority(identifier: int) -> Priority:
+    """Get the priority class of a request
+
+    Args:
+
+        identifier:
+            The 29 bit identifier of the request
+
+    Returns:
+
+        The priority class of the request based on its block and block
+        command
+
+    Examples:
+
+        Import required library code
+
+        >>> from icotronic.can.protocol.identifier import Identifier
+
+        Get the priority class of some requests
+
+        >>> request_priority(Identifier(block="System",
+        ...                             block_command="Reset").value)
+        <Priority.CONTROL: 0>
+        >>> request_priority(Identifier(block="System",
+        ...                             block_command="Get/Set State").value)
+        <Priority.CONTROL: 0>
+        >>> request_priority(Identifier(block="Streaming",
+        ...                             block_command="Data").value)
+        <Priority.STREAMING: 1>
+        >>> request_priority(Identifier(block="System",
+        ...                             block_command="Bluetooth").value)
+        <Priority.METADATA: 2>
+        >>> request_priority(Identifier(block="System",
+        ...                             block_command="Node Status").value)
+        <Priority.METADATA: 2>
+        >>> request_priority(Identifier(block="Product Data",
+        ...                             block_command="Serial Number 1").value)
+        <Priority.METADATA: 2>
+        >>> request_priority(Identifier(block="EEPROM",
+        ...                             block_command="Read").value)
+        <Priority.BULK: 3>
+
+    """
+
+    block = (identifier >> 22) & 0x3F
+    block_command = (identifier >> 14) & 0xFF
+    if (block, block_command) in CONTROL_COMMANDS:
+        return Priority.CONTROL
+    if block == 0x04:  # Streaming
+        return Priority.STREAMING
+    if block == 0x3D:  # EEPROM
+        return Priority.BULK
+
+    # Other commands (e.g. Bluetooth commands or status requests) only
+    # query or change metadata of the nodes
+    return Priority.METADATA
+
+
+# -- Main ---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    from doctest import testmod
+
+    testmod()
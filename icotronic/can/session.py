@@ -0,0 +1,237 @@
+"""Reuse the connection to the ICOtronic system for multiple sensor nodes"""
+
+# -- Imports ------------------------------------------------------------------
+
+from __future__ import annotations
+
+from logging import getLogger
+from types import TracebackType
+
+from netaddr import EUI
+
+from icotronic.can.connection import Connection
+from icotronic.can.error import ErrorResponseError, NoResponseError
+from icotronic.can.node.sensor import SensorNode
+from icotronic.can.node.stu import AsyncSensorNodeManager, STU
+
+# -- Classes ------------------------------------------------------------------
+
+
+class Session:
+    """Keep the CAN connection open while working with multiple sensor nodes
+
+    Opening a :class:`Connection` and connecting to a sensor node takes
+    some time. A session opens the CAN connection once and switches between
+    sensor nodes using :meth:`connect`. If you connect to the sensor node
+    that is already connected, then the session reuses the existing
+    Bluetooth connection.
+
+    To actually connect to the CAN bus you need to use the async context
+    manager, provided by this class.
+
+    Examples:
+
+        Import required library code
+
+        >>> from asyncio import run
+
+        Read the name of the same sensor node twice, while only connecting
+        to it once
+
+        >>> async def read_names():
+        ...     async with Session() as session:
+        ...         first = await session.connect("Test-STH")
+        ...         second = await session.connect("Test-STH")
+        ...         return first is second, await second.get_name()
+        >>> run(read_names())
+        (True, 'Test-STH')
+
+    """
+
+    def __init__(self) -> None:
+
+        self.logger = getLogger(__name__)
+        self.connection = Connection()
+        self._stu: STU | None = None
+        self.manager: AsyncSensorNodeManager | None = None
+
+    async def __aenter__(self) -> Session:
+        """Connect to the STU
+
+        Returns:
+
+            The session object
+
+        Raises:
+
+            CANInitError: if the CAN initialization fails
+
+        """
+
+        # pylint: disable=unnecessary-dunder-call
+        self._stu = await self.connection.__aenter__()
+        # pylint: enable=unnecessary-dunder-call
+
+        return self
+
+    async def __aexit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Disconnect the sensor node and the CAN connection
+
+        Args:
+
+            exception_type:
+                The type of the exception in case of an exception
+
+            exception_value:
+                The value of the exception in case of an exception
+
+            traceback:
+                The traceback in case of an exception
+
+        """
+
+        try:
+            await self.disconnect()
+        finally:
+            self._stu = None
+            await self.connection.__aexit__(
+                exception_type, exception_value, traceback
+            )
+
+    @property
+    def stu(self) -> STU:
+        """The STU of the session
+
+        Raises:
+
+            ValueError:
+                If the session is not connected to the STU
+
+        """
+
+        if self._stu is None:
+            raise ValueError("Session is not connected to the STU")
+
+        return self._stu
+
+    async def _is_connected(self, identifier: int | str | EUI) -> bool:
+        """Check if the session is connected to a certain sensor node
+
+        Args:
+
+            identifier:
+                The identifier of the sensor node
+
+        Returns:
+
+            ``True``, if the session is still connected to the sensor node,
+            ``False`` otherwise
+
+        """
+
+        manager = self.manager
+        if manager is None:
+            return False
+
+        info = manager.sensor_node_info
+        sensor_node = manager.sensor_node
+        if info is None or sensor_node is None:
+            return False
+
+        if isinstance(identifier, EUI):
+            same = identifier == info.mac_address
+        elif isinstance(identifier, int):
+            same = identifier == info.sensor_node_number
+        else:
+            same = identifier == info.name
+
+        try:
+            connected = same and await self.stu.is_connected()
+            # The code might have renamed the sensor node
+            if connected and isinstance(identifier, str):
+                connected = await sensor_node.get_name() == identifier
+        except (ErrorResponseError, NoResponseError):
+            connected = False
+
+        return connected
+
+    async def connect(
+        self,
+        identifier: int | str | EUI,
+        sensor_node_class: type[SensorNode] = SensorNode,
+    ) -> SensorNode:
+        """Connect to a sensor node
+
+        If the session is connected to another sensor node, then the
+        coroutine disconnects from this node first.
+
+        Args:
+
+            identifier:
+                The
+
+                - MAC address (`EUI`),
+                - name (`str`), or
+                - node number (`int`)
+
+                of the sensor node we want to connect to
+
+            sensor_node_class:
+                Sensor node subclass that should be returned
+
+        Returns:
+
+            A sensor node object for the connected node
+
+        Raises:
+
+            ValueError:
+                 If you use an invalid name or node number as identifier
+
+        """
+
+        manager = self.manager
+        if manager is not None and await self._is_connected(identifier):
+            sensor_node = manager.sensor_node
+            assert sensor_node is not None
+            if not isinstance(sensor_node, sensor_node_class):
+                sensor_node = sensor_node_class(self.stu.spu)
+                manager.sensor_node = sensor_node
+            self.logger.info(
+                "Reuse connection to sensor node: %s",
+                manager.sensor_node_info,
+            )
+            return sensor_node
+
+        await self.disconnect()
+
+        manager = self.stu.connect_sensor_node(identifier, sensor_node_class)
+        # pylint: disable=unnecessary-dunder-call
+        sensor_node = await manager.__aenter__()
+        # pylint: enable=unnecessary-dunder-call
+        self.manager = manager
+
+        return sensor_node
+
+    async def disconnect(self) -> None:
+        """Disconnect from the current sensor node"""
+
+        manager = self.manager
+        if manager is None:
+            return
+
+        self.manager = None
+        await manager.__aexit__(None, None, None)
+
+
+# -- Main ---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    from doctest import testmod
+
+    testmod()
@@ -9,7 +9,8 @@ from icotronic.can.streaming.error import (
 )
 from icotronic.can.streaming.buffer import AsyncStreamBuffer
 from icotronic.can.streaming.config import StreamingConfiguration
-from icotronic.can.streaming.data import StreamingData
+from icotronic.can.streaming.data import StreamingData, StreamingDataBlock
+from icotronic.can.streaming.stats import ChannelStats
 from icotronic.can.streaming.format import (
     StreamingFormat,
     StreamingFormatVoltage,
@@ -12,15 +12,20 @@ from can import Listener, Message
 
 from icotronic.can.protocol.identifier import Identifier
 from icotronic.can.dataloss import MessageStats
+from icotronic.can.streaming.config import StreamingConfiguration
 from icotronic.can.streaming.error import (
     StreamingBufferError,
     StreamingTimeoutError,
 )
 from icotronic.can.streaming.data import StreamingData
+from icotronic.can.streaming.stats import ChannelStats
 
 # -- Classes ------------------------------------------------------------------
 
 
+# pylint: disable=too-many-instance-attributes
+
+
 class AsyncStreamBuffer(Listener):
     """Buffer for streaming data
 
@@ -38,12 +43,17 @@ class AsyncStreamBuffer(Listener):
             retrieved messages and therefore the probability of losing
             messages is quite high.
 
+        stats:
+            Specifies if the buffer should calculate statistics (mean,
+            variance, minimum, maximum, …) for the received streaming values
+
     """
 
     def __init__(
         self,
         timeout: float,
         max_buffer_size: int,
+        stats: bool = False,
     ) -> None:
 
         # Expected identifier of received streaming messages
@@ -54,11 +64,18 @@ class AsyncStreamBuffer(Listener):
             receiver="SPU 1",
             request=False,
         )
+        # Compare received identifiers with a plain number
+        self.identifier_value = self.identifier.value
         self.queue: Queue[tuple[StreamingData, int]] = Queue()
         self.timeout = timeout
         self.last_counter = -1
         self.max_buffer_size = max_buffer_size
         self.stats = MessageStats()
+        # Statistics for the first, second and third value of the streaming
+        # messages
+        self.value_stats: list[ChannelStats] | None = (
+            [ChannelStats() for _ in range(3)] if stats else None
+        )
         self.timestamp_offset: float | None = None
 
     def __aiter__(self) -> AsyncIterator[tuple[StreamingData, int]]:
@@ -110,7 +127,7 @@ class AsyncStreamBuffer(Listener):
         """
 
         # Ignore messages with wrong id and “Stop Stream” messages
-        if msg.arbitration_id != self.identifier.value or len(msg.data) <= 1:
+        if msg.arbitration_id != self.identifier_value or len(msg.data) <= 1:
             return
 
         receive_time = time()
@@ -131,6 +148,11 @@ class AsyncStreamBuffer(Listener):
         ]
         assert len(values) == 2 or len(values) == 3
 
+        value_stats = self.value_stats
+        if value_stats is not None:
+            for stats, value in zip(value_stats, values):
+                stats.add(value)
+
         streaming_data = StreamingData(
             timestamp=timestamp,
             counter=counter,
@@ -169,11 +191,84 @@ class AsyncStreamBuffer(Listener):
         This method resets the amount of lost an retrieved messages used in
         the calculation of the method ``dataloss``. Using this method can be
         useful, if you want to calculate the amount of data loss since a
-        specific starting point.
+        specific starting point. If the buffer calculates statistics for the
+        streaming values, then this method also resets these statistics.
 
         """
 
         self.stats.reset()
+        if self.value_stats is not None:
+            for stats in self.value_stats:
+                stats.reset()
+
+    def channel_stats(
+        self, channels: StreamingConfiguration
+    ) -> list[ChannelStats]:
+        """Get statistics for the values of each enabled channel
+
+        Args:
+
+            channels:
+                The streaming configuration used to retrieve the data
+
+        Returns:
+
+            A list containing the statistics of each enabled channel
+
+        Raises:
+
+            ValueError:
+                if the buffer does not calculate statistics
+
+        Examples:
+
+            Import required library code
+
+            >>> from can import Message
+
+            Calculate statistics for a single channel
+
+            >>> buffer = AsyncStreamBuffer(timeout=1, max_buffer_size=10,
+            ...                            stats=True)
+            >>> identifier = buffer.identifier.value
+            >>> for counter in range(2):
+            ...     buffer.on_message_received(
+            ...         Message(arbitration_id=identifier,
+            ...                 data=[0, counter, 10, 0, 20, 0, 30, 0]))
+            >>> buffer.channel_stats(StreamingConfiguration(first=True))
+            ... # doctest:+NORMALIZE_WHITESPACE
+            [Values: 6, Mean: 20.00, Standard Deviation: 8.16, Minimum: 10,
+             Maximum: 30]
+
+            Statistics for two enabled channels
+
+            >>> channels = StreamingConfiguration(first=True, second=True)
+            >>> buffer = AsyncStreamBuffer(timeout=1, max_buffer_size=10,
+            ...                            stats=True)
+            >>> buffer.on_message_received(
+            ...     Message(arbitration_id=identifier,
+            ...             data=[0, 0, 10, 0, 20, 0]))
+            >>> [stats.mean for stats in buffer.channel_stats(channels)]
+            [10.0, 20.0]
+
+            Retrieving statistics fails if the buffer does not calculate them
+
+            >>> AsyncStreamBuffer(timeout=1, max_buffer_size=10
+            ...                  ).channel_stats(channels)
+            Traceback (most recent call last):
+            ...
+            ValueError: Statistics for streaming values are disabled
+
+        """
+
+        value_stats = self.value_stats
+        if value_stats is None:
+            raise ValueError("Statistics for streaming values are disabled")
+
+        if channels.enabled_channels() == 1:
+            return [value_stats[0] + value_stats[1] + value_stats[2]]
+
+        return value_stats[: channels.enabled_channels()]
 
     def dataloss(self) -> float:
         """Calculate the overall amount of data loss
@@ -188,6 +283,9 @@ class AsyncStreamBuffer(Listener):
         return self.stats.dataloss()
 
 
+# pylint: enable=too-many-instance-attributes
+
+
 # -- Main ---------------------------------------------------------------------
 
 if __name__ == "__main__":
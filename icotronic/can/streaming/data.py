@@ -4,7 +4,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+
+from numpy import float64, frombuffer
+from numpy.typing import NDArray
 
 # -- Classes ------------------------------------------------------------------
 
@@ -45,6 +49,11 @@ class StreamingData:
 
     """
 
+    # Streaming data objects are created for every single streaming message.
+    # Using slots instead of an instance dictionary reduces the memory usage
+    # and creation time of these objects considerably.
+    __slots__ = ("counter", "timestamp", "values")
+
     def __init__(
         self, counter: int, timestamp: float, values: list[float]
     ) -> None:
@@ -113,3 +122,287 @@ class StreamingData:
         """
 
         return f"{self.values}@{self.timestamp} #{self.counter}"
+
+
+class StreamingDataBlock:
+    """Store the data of multiple streaming messages in columnar format
+
+    Compared to a list of :class:`StreamingData` objects a block only uses
+    three arrays to store message counters, timestamps and (flattened)
+    values. This way the block requires only a fraction of the memory and
+    provides fast access to the values of a single channel.
+
+    Args:
+
+        values_per_message:
+            The number of values stored in a single streaming message
+
+    Examples:
+
+        Store some streaming data in a block
+
+        >>> block = StreamingDataBlock()
+        >>> block.append(StreamingData(values=[1, 2, 3], counter=21,
+        ...                            timestamp=1))
+        >>> block.append(StreamingData(values=[4, 5, 6], counter=22,
+        ...                            timestamp=2))
+        >>> block
+        [1.0, 2.0, 3.0]@1.0 #21
+        [4.0, 5.0, 6.0]@2.0 #22
+        >>> len(block)
+        2
+
+        Access single streaming messages
+
+        >>> block[-1]
+        [4.0, 5.0, 6.0]@2.0 #22
+
+        A block only stores messages with the same amount of values
+
+        >>> block.append(StreamingData(values=[1, 2], counter=23,
+        ...                            timestamp=3))
+        Traceback (most recent call last):
+        ...
+        ValueError: Incorrect number of streaming values: 2 (instead of 3)
+
+        A block only supports two or three values per message
+
+        >>> StreamingDataBlock(values_per_message=1) # doctest:+ELLIPSIS
+        Traceback (most recent call last):
+        ...
+        ValueError: Incorrect number of values ...: 1 (instead of 2 or 3)
+
+    """
+
+    __slots__ = ("counters", "timestamps", "values", "values_per_message")
+
+    def __init__(self, values_per_message: int = 3) -> None:
+
+        if not 2 <= values_per_message <= 3:
+            raise ValueError(
+                "Incorrect number of values per message: "
+                f"{values_per_message} (instead of 2 or 3)"
+            )
+
+        self.values_per_message = values_per_message
+        self.counters = array("B")
+        self.timestamps = array("d")
+        self.values = array("d")
+
+    def __len__(self) -> int:
+        """Get the number of streaming messages stored in the block
+
+        Returns:
+
+            The number of streaming messages in the block
+
+        """
+
+        return len(self.counters)
+
+    def __getitem__(self, index: int) -> StreamingData:
+        """Get the streaming data at the specified position
+
+        Args:
+
+            index:
+                The position of the streaming message in the block
+
+        Returns:
+
+            A streaming data object containing the data of the message
+
+        """
+
+        if index < 0:
+            index += len(self)
+        length = self.values_per_message
+        start = index * length
+
+        return StreamingData(
+            counter=self.counters[index],
+            timestamp=self.timestamps[index],
+            values=self.values[start : start + length].tolist(),
+        )
+
+    def __iter__(self) -> Iterator[StreamingData]:
+        """Iterate over the streaming messages stored in the block
+
+        Returns:
+
+            An iterator over the streaming data of the block
+
+        """
+
+        return (self[index] for index in range(len(self)))
+
+    def __repr__(self) -> str:
+        """Get the string representation of the block
+
+        Returns:
+
+            The textual representation of all messages in the block
+
+        """
+
+        return "\n".join(repr(streaming_data) for streaming_data in self)
+
+    def append(self, data: StreamingData) -> None:
+        """Append streaming data to the block
+
+        Args:
+
+            data:
+                The streaming data that should be added to the block
+
+        """
+
+        values = data.values
+        if len(values) != self.values_per_message:
+            raise ValueError(
+                f"Incorrect number of streaming values: {len(values)} "
+                f"(instead of {self.values_per_message})"
+            )
+
+        self.counters.append(data.counter)
+        self.timestamps.append(data.timestamp)
+        self.values.extend(values)
+
+    def extend(self, data: Iterable[StreamingData]) -> None:
+        """Append multiple streaming data objects to the block
+
+        Args:
+
+            data:
+                The streaming data that should be added to the block
+
+        Examples:
+
+            Extend a block with streaming data of two channels
+
+            >>> block = StreamingDataBlock(values_per_message=2)
+            >>> block.extend([
+            ...     StreamingData(values=[1, 2], counter=1, timestamp=1.5),
+            ...     StreamingData(values=[3, 4], counter=2, timestamp=2.5)])
+            >>> block
+            [1.0, 2.0]@1.5 #1
+            [3.0, 4.0]@2.5 #2
+
+        """
+
+        for streaming_data in data:
+            self.append(streaming_data)
+
+    def channel(self, index: int) -> array:
+        """Get all values stored at a certain position of each message
+
+        Args:
+
+            index:
+                The position of the value in the streaming messages
+
+        Returns:
+
+            An array containing the values at position ``index`` of all
+            messages in the block
+
+        Examples:
+
+            Get the values of the second channel
+
+            >>> block = StreamingDataBlock(values_per_message=2)
+            >>> block.extend([
+            ...     StreamingData(values=[1, 2], counter=1, timestamp=1),
+            ...     StreamingData(values=[3, 4], counter=2, timestamp=2)])
+            >>> block.channel(1)
+            array('d', [2.0, 4.0])
+
+        """
+
+        return self.values[index :: self.values_per_message]
+
+    def to_numpy(self) -> NDArray[float64]:
+        """Get the values of the block as NumPy array
+
+        The returned array contains a copy of the values. This way the
+        block still supports adding data, while the array exists.
+
+        Returns:
+
+            A two dimensional array with one row per streaming message and
+            one column per value position
+
+        Examples:
+
+            Get the values of a block as array
+
+            >>> block = StreamingDataBlock(values_per_message=2)
+            >>> block.extend([
+            ...     StreamingData(values=[1, 2], counter=1, timestamp=1),
+            ...     StreamingData(values=[3, 4], counter=2, timestamp=2),
+            ...     StreamingData(values=[5, 6], counter=3, timestamp=3)])
+            >>> values = block.to_numpy()
+            >>> values
+            array([[1., 2.],
+                   [3., 4.],
+                   [5., 6.]])
+
+            Adding data to the block does not change the array
+
+            >>> block.append(
+            ...     StreamingData(values=[7, 8], counter=4, timestamp=4))
+            >>> len(block), values.shape
+            (4, (3, 2))
+
+        """
+
+        # A view would lock the size of the array (`BufferError` on append)
+        return (
+            frombuffer(self.values, dtype=float64)
+            .reshape(-1, self.values_per_message)
+            .copy()
+        )
+
+    def apply(
+        self,
+        function: Callable[[float], float],
+    ) -> StreamingDataBlock:
+        """Apply a certain function to all values of the block
+
+        Note:
+
+            Just like :meth:`StreamingData.apply` this method changes the
+            stored values and also returns the modified block itself.
+
+        Args:
+
+            function:
+                The function that should be applied to the values
+
+        Returns:
+
+            The modified streaming data block
+
+        Examples:
+
+            Add the constant 10 to the values of an example block
+
+            >>> block = StreamingDataBlock(values_per_message=2)
+            >>> block.append(StreamingData(values=[1, 2], counter=1,
+            ...                            timestamp=1))
+            >>> block.apply(lambda value: value + 10)
+            [11.0, 12.0]@1.0 #1
+
+        """
+
+        self.values = array("d", map(function, self.values))
+
+        return self
+
+
+# -- Main ---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    from doctest import testmod
+
+    testmod()
@@ -0,0 +1,300 @@
+"""Support for calculating statistics of streaming values in a single pass"""
+
+# -- Imports ------------------------------------------------------------------
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from math import inf, sqrt
+
+# -- Classes ------------------------------------------------------------------
+
+
+class ChannelStats:
+    """Accumulate statistics of streaming values incrementally
+
+    The class uses Welford’s algorithm to update mean and variance for every
+    added value. This way you can calculate statistics for an arbitrary
+    amount of values using constant memory. Partial results (e.g. of
+    different value positions in the streaming data) can be combined with
+    the ``+`` operator.
+
+    Examples:
+
+        Calculate statistics for some values
+
+        >>> stats = ChannelStats().update([1, 2, 3, 4])
+        >>> stats # doctest:+NORMALIZE_WHITESPACE
+        Values: 4, Mean: 2.50, Standard Deviation: 1.12, Minimum: 1,
+        Maximum: 4
+        >>> stats.rms()
+        2.7386127875258306
+        >>> stats.peak()
+        4
+
+        Combine partial statistics
+
+        >>> combined = ChannelStats().update([1, 2]) + ChannelStats().update(
+        ...     [3, 4])
+        >>> combined.mean == stats.mean
+        True
+        >>> combined.variance() == stats.variance()
+        True
+
+    """
+
+    def __init__(self) -> None:
+
+        self.count = 0
+        """Number of added values"""
+
+        self.mean = 0.0
+        """Arithmetic mean of the added values"""
+
+        self.squared_deviations = 0.0
+        """Sum of squared deviations from the mean"""
+
+        self.sum_squares = 0.0
+        """Sum of the squares of the added values"""
+
+        self.minimum: float = inf
+        """Smallest added value"""
+
+        self.maximum: float = -inf
+        """Largest added value"""
+
+    def __repr__(self) -> str:
+        """Get the textual representation of the statistics
+
+        Returns:
+
+            A string representing the statistics
+
+        Examples:
+
+            Get the string representation of empty statistics
+
+            >>> ChannelStats()
+            Values: 0
+
+        """
+
+        if self.count <= 0:
+            return "Values: 0"
+
+        return ", ".join([
+            f"Values: {self.count}",
+            f"Mean: {self.mean:.2f}",
+            f"Standard Deviation: {self.standard_deviation():.2f}",
+            f"Minimum: {self.minimum}",
+            f"Maximum: {self.maximum}",
+        ])
+
+    def __add__(self, other: object) -> ChannelStats:
+        """Combine these statistics with other statistics
+
+        Args:
+
+            other:
+                The statistics that should be combined with these statistics
+
+        Returns:
+
+            New statistics for the values of both statistics objects
+
+        Examples:
+
+            Combine statistics with empty statistics
+
+            >>> stats = ChannelStats().update([10, 20]) + ChannelStats()
+            >>> stats # doctest:+NORMALIZE_WHITESPACE
+            Values: 2, Mean: 15.00, Standard Deviation: 5.00, Minimum: 10,
+            Maximum: 20
+
+        """
+
+        if not isinstance(other, ChannelStats):
+            return NotImplemented
+
+        combined = ChannelStats()
+        count = self.count + other.count
+        if count <= 0:
+            return combined
+
+        delta = other.mean - self.mean
+        combined.count = count
+        combined.mean = self.mean + delta * other.count / count
+        combined.squared_deviations = (
+            self.squared_deviations
+            + other.squared_deviations
+            + delta * delta * self.count * other.count / count
+        )
+        combined.sum_squares = self.sum_squares + other.sum_squares
+        combined.minimum = min(self.minimum, other.minimum)
+        combined.maximum = max(self.maximum, other.maximum)
+
+        return combined
+
+    def add(self, value: float) -> None:
+        """Add a single value to the statistics
+
+        Args:
+
+            value:
+                The value that should be added
+
+        Examples:
+
+            Add some values
+
+            >>> stats = ChannelStats()
+            >>> stats.add(5)
+            >>> stats.add(7)
+            >>> stats.mean
+            6.0
+
+        """
+
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.squared_deviations += delta * (value - self.mean)
+        self.sum_squares += value * value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def update(self, values: Iterable[float]) -> ChannelStats:
+        """Add multiple values to the statistics
+
+        Args:
+
+            values:
+                The values that should be added
+
+        Returns:
+
+            The updated statistics object
+
+        """
+
+        for value in values:
+            self.add(value)
+
+        return self
+
+    def reset(self) -> None:
+        """Remove all values from the statistics
+
+        Examples:
+
+            Reset some example statistics
+
+            >>> stats = ChannelStats().update([1, 2, 3])
+            >>> stats.reset()
+            >>> stats
+            Values: 0
+
+        """
+
+        self.count = 0
+        self.mean = 0.0
+        self.squared_deviations = 0.0
+        self.sum_squares = 0.0
+        self.minimum = inf
+        self.maximum = -inf
+
+    def _check_values(self) -> None:
+        """Make sure that the statistics contain at least one value
+
+        Raises:
+
+            ValueError:
+                if no values were added to the statistics
+
+        """
+
+        if self.count <= 0:
+            raise ValueError("Statistics require at least one value")
+
+    def variance(self) -> float:
+        """Get the population variance of the values
+
+        Returns:
+
+            The population variance of the added values
+
+        Examples:
+
+            Get the variance of some example values
+
+            >>> ChannelStats().update([1, 3]).variance()
+            1.0
+
+            Calculating the variance without values fails
+
+            >>> ChannelStats().variance()
+            Traceback (most recent call last):
+            ...
+            ValueError: Statistics require at least one value
+
+        """
+
+        self._check_values()
+        return self.squared_deviations / self.count
+
+    def standard_deviation(self) -> float:
+        """Get the population standard deviation of the values
+
+        Returns:
+
+            The population standard deviation of the added values
+
+        """
+
+        return sqrt(self.variance())
+
+    def rms(self) -> float:
+        """Get the root mean square of the values
+
+        Returns:
+
+            The root mean square of the added values
+
+        Examples:
+
+            Get the RMS of some example values
+
+            >>> ChannelStats().update([3, -3, 3, -3]).rms()
+            3.0
+
+        """
+
+        self._check_values()
+        return sqrt(self.sum_squares / self.count)
+
+    def peak(self) -> float:
+        """Get the largest absolute value
+
+        Returns:
+
+            The largest absolute value of the added values
+
+        Examples:
+
+            Get the peak of some example values
+
+            >>> ChannelStats().update([-5, 3, 1]).peak()
+            5
+
+        """
+
+        self._check_values()
+        return max(abs(self.minimum), abs(self.maximum))
+
+
+# -- Main ---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    from doctest import testmod
+
+    testmod()
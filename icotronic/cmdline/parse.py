@@ -11,13 +11,17 @@ from icotronic.cmdline.types import (
     mac_address,
     measurement_time,
     non_infinite_measurement_time,
+    non_negative_number,
+    positive_number,
     sensor_node_number,
 )
 
 # -- Functions ----------------------------------------------------------------
 
 
-def add_identifier_arguments(parser: ArgumentParser) -> None:
+def add_identifier_arguments(
+    parser: ArgumentParser, required: bool = True
+) -> None:
     """Add node identifier arguments to given argument parser
 
     Args:
@@ -25,6 +29,11 @@ def add_identifier_arguments(parser: ArgumentParser) -> None:
         parser:
             The parser which should include the node identifier arguments
 
+        required:
+            Specifies if the parser needs a sensor node identifier. If not,
+            then the identifier is ``None`` (instead of a default name)
+            unless specified.
+
     """
 
     identifier_arg_group = parser.add_argument_group(
@@ -32,7 +41,7 @@ def add_identifier_arguments(parser: ArgumentParser) -> None:
     )
 
     identifier_group = identifier_arg_group.add_mutually_exclusive_group(
-        required=True
+        required=required
     )
 
     identifier_group.add_argument(
@@ -41,7 +50,7 @@ def add_identifier_arguments(parser: ArgumentParser) -> None:
         dest="identifier",
         metavar="NAME",
         help="Name of sensor node",
-        default="Test-STH",
+        default="Test-STH" if required else None,
         type=node_name,
     )
     identifier_group.add_argument(
@@ -183,6 +192,26 @@ def create_icon_parser() -> ArgumentParser:
         required=True, title="Subcommands", dest="subcommand"
     )
 
+    # ===========
+    # = Analyze =
+    # ===========
+
+    analyze_parser = subparsers.add_parser(
+        "analyze", help="Print statistics about recorded CAN messages"
+    )
+    analyze_parser.add_argument(
+        "filepath",
+        nargs="?",
+        help="Recorded CAN log file (default: recorded file of ICOn)",
+    )
+    analyze_parser.add_argument(
+        "-i",
+        "--interval",
+        type=positive_number,
+        default=1,
+        help="Time interval in seconds used to calculate the bus load",
+    )
+
     # ==========
     # = Config =
     # ==========
@@ -191,6 +220,14 @@ def create_icon_parser() -> ArgumentParser:
         "config", help="Open config file in default application"
     )
 
+    # ==========
+    # = Daemon =
+    # ==========
+
+    subparsers.add_parser(
+        "daemon", help="Share CAN connection with other processes"
+    )
+
     # =============
     # = Data Loss =
     # =============
@@ -208,12 +245,50 @@ def create_icon_parser() -> ArgumentParser:
     )
     add_identifier_arguments(dataloss_parser)
 
+    # ==========
+    # = EEPROM =
+    # ==========
+
+    eeprom_parser = subparsers.add_parser(
+        "eeprom", help="Backup or restore EEPROM content"
+    )
+    eeprom_subparsers = eeprom_parser.add_subparsers(
+        required=True, title="Subcommands", dest="eeprom_subcommand"
+    )
+    for eeprom_subparser in (
+        eeprom_subparsers.add_parser(
+            "backup",
+            help="Store EEPROM content of STU (and sensor node) in file",
+        ),
+        eeprom_subparsers.add_parser(
+            "restore",
+            help="Write EEPROM content of STU (and sensor node) from file",
+        ),
+    ):
+        eeprom_subparser.add_argument(
+            "filepath", help="EEPROM image file (JSON format)"
+        )
+        add_identifier_arguments(eeprom_subparser, required=False)
+
     # ========
     # = List =
     # ========
 
     subparsers.add_parser("list", help="List sensor nodes")
 
+    # =======
+    # = Log =
+    # =======
+
+    log_parser = subparsers.add_parser(
+        "log", help="Print recorded CAN messages in human readable format"
+    )
+    log_parser.add_argument(
+        "filepath",
+        nargs="?",
+        help="Recorded CAN log file (default: recorded file of ICOn)",
+    )
+
     # ===========
     # = Measure =
     # ===========
@@ -235,6 +310,37 @@ def create_icon_parser() -> ArgumentParser:
     )
 
     add_channel_arguments(measurement_group)
+
+    trigger_group = measurement_parser.add_argument_group(title="Trigger")
+    trigger_group.add_argument(
+        "--trigger",
+        choices=("threshold", "rms", "rate"),
+        required=False,
+        help=(
+            "Only store data around events where the deviation from the ADC "
+            "center (threshold), its RMS over 0.1 s (rms) or the difference "
+            "of consecutive values (rate) reaches the trigger level"
+        ),
+    )
+    trigger_group.add_argument(
+        "--trigger-level",
+        type=non_negative_number,
+        default=1000,
+        help="Trigger level in raw ADC units",
+    )
+    trigger_group.add_argument(
+        "--pre-trigger",
+        type=non_negative_number,
+        default=1,
+        help="Time in seconds stored before a trigger event",
+    )
+    trigger_group.add_argument(
+        "--hold",
+        type=non_negative_number,
+        default=1,
+        help="Time in seconds stored after the last trigger event",
+    )
+
     add_identifier_arguments(measurement_parser)
     add_adc_arguments(measurement_parser)
 
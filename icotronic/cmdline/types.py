@@ -282,6 +282,86 @@ def non_infinite_measurement_time(value: str) -> float:
     return runtime
 
 
+def non_negative_number(value: str) -> float:
+    """Check if the given text represents a number larger or equal to zero
+
+    Returns:
+
+        A float value representing the given number on success
+
+    Raises:
+
+        ArgumentTypeError:
+             If the given text is not a valid non-negative number
+
+    Examples:
+
+        Parse correct numbers
+
+        >>> non_negative_number("0")
+        0.0
+        >>> non_negative_number("1.5")
+        1.5
+
+        Parsing a negative number fails
+
+        >>> non_negative_number("-1")
+        Traceback (most recent call last):
+           ...
+        argparse.ArgumentTypeError: “-1” is not a valid non-negative number
+
+    """
+
+    try:
+        number = float(value)
+        if not 0 <= number < inf:
+            raise ValueError()
+        return number
+    except ValueError as error:
+        raise ArgumentTypeError(
+            f"“{value}” is not a valid non-negative number"
+        ) from error
+
+
+def positive_number(value: str) -> float:
+    """Check if the given text represents a number larger than zero
+
+    Returns:
+
+        A float value representing the given number on success
+
+    Raises:
+
+        ArgumentTypeError:
+             If the given text is not a valid positive number
+
+    Examples:
+
+        Parse a correct number
+
+        >>> positive_number("0.5")
+        0.5
+
+        Parsing zero fails
+
+        >>> positive_number("0")
+        Traceback (most recent call last):
+           ...
+        argparse.ArgumentTypeError: “0” is not a valid positive number
+
+    """
+
+    try:
+        number = float(value)
+        if not 0 < number < inf:
+            raise ValueError()
+        return number
+    except ValueError as error:
+        raise ArgumentTypeError(
+            f"“{value}” is not a valid positive number"
+        ) from error
+
+
 def sensor_node_number(value: str) -> int:
     """Check if the given number is valid Bluetooth node number
 
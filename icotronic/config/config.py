@@ -189,6 +189,10 @@ class Settings(Dynaconf):
                 is_type_of=str,
             ),
         ]
+        daemon_validators = [
+            must_exist("daemon.host", is_type_of=str),
+            must_exist("daemon.port", is_type_of=int, gte=1, lte=65535),
+        ]
         logger_validators = [
             must_exist(
                 "logger.can.level",
@@ -201,7 +205,10 @@ class Settings(Dynaconf):
                     "DEBUG",
                     "NOTSET",
                 ),
-            )
+            ),
+            must_exist(
+                "logger.can.format", is_type_of=str, is_in=("text", "binary")
+            ),
         ]
         measurement_validators = [
             must_exist(
@@ -211,7 +218,10 @@ class Settings(Dynaconf):
             ),
         ]
         self.validators.register(
-            *can_validators, *logger_validators, *measurement_validators
+            *can_validators,
+            *daemon_validators,
+            *logger_validators,
+            *measurement_validators,
         )
 
         try:
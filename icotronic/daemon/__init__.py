@@ -0,0 +1,7 @@
+"""Share the connection to the ICOtronic system with multiple processes"""
+
+# -- Exports ------------------------------------------------------------------
+
+from icotronic.daemon.client import DaemonClient, DaemonError, DaemonStream
+from icotronic.daemon.ringbuffer import SharedRingBuffer
+from icotronic.daemon.server import Daemon
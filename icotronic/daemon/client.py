@@ -0,0 +1,384 @@
+"""Access the ICOtronic system using the ICOtronic daemon"""
+
+# -- Imports ------------------------------------------------------------------
+
+from __future__ import annotations
+
+from asyncio import (
+    create_task,
+    Future,
+    get_running_loop,
+    IncompleteReadError,
+    open_connection,
+    sleep,
+    StreamReader,
+    StreamWriter,
+    Task,
+)
+from collections.abc import AsyncIterator
+from itertools import count
+from logging import getLogger
+from types import TracebackType
+
+from numpy import ndarray
+from can import Message as CANMessage
+from netaddr import EUI
+
+from icotronic.can.streaming import StreamingConfiguration, StreamingError
+from icotronic.config import settings
+from icotronic.daemon.protocol import (
+    decode_can_frame,
+    decode_stream_info,
+    encode_can_frame,
+    encode_channels,
+    encode_identifier,
+    encode_packet,
+    MessageType,
+    Packet,
+    read_packet,
+    read_token,
+)
+from icotronic.daemon.ringbuffer import SharedRingBuffer
+
+# -- Classes ------------------------------------------------------------------
+
+
+class DaemonError(Exception):
+    """The daemon was unable to execute a request"""
+
+
+class DaemonStream:
+    """Read streaming data from the shared memory of the daemon
+
+    Args:
+
+        client:
+            The client that subscribed to the data stream
+
+        ring_buffer:
+            The ring buffer that contains the streaming data
+
+        interval:
+            The time in seconds between two checks for new data
+
+    """
+
+    def __init__(
+        self,
+        client: DaemonClient,
+        ring_buffer: SharedRingBuffer,
+        interval: float = 0.01,
+    ) -> None:
+
+        self.client = client
+        self.ring_buffer = ring_buffer
+        self.interval = interval
+
+        # Only read data written after the subscription
+        self.position = ring_buffer.written()
+
+        self.lost = 0
+        """Number of records overwritten before this client read them"""
+
+    def __aiter__(self) -> AsyncIterator[ndarray]:
+        """Iterate over blocks of streaming data
+
+        Returns:
+
+            An iterator over the streaming data
+
+        """
+
+        return self
+
+    async def __anext__(self) -> ndarray:
+        """Wait for new streaming data
+
+        Returns:
+
+            The records (see
+            :data:`icotronic.daemon.ringbuffer.RECORD_DTYPE`) written since
+            the last call
+
+        Raises:
+
+            StreamingError:
+                If the daemon stopped the data stream
+
+        """
+
+        while True:
+            error = self.client.stream_error
+            if error is not None:
+                raise StreamingError(f"Data stream stopped: {error}")
+
+            records, self.position, lost = self.ring_buffer.read(self.position)
+            self.lost += lost
+            if len(records) > 0:
+                return records
+            await sleep(self.interval)
+
+    async def close(self) -> None:
+        """Unsubscribe from the data stream"""
+
+        self.ring_buffer.close()
+        await self.client.unsubscribe()
+
+
+# pylint: disable=too-many-instance-attributes
+
+
+class DaemonClient:
+    """Communicate with the ICOtronic daemon
+
+    Args:
+
+        host:
+            The address of the daemon; ``None`` uses the value from the
+            configuration
+
+        port:
+            The port of the daemon; ``None`` uses the value from the
+            configuration
+
+    Examples:
+
+        Import required library code
+
+        >>> from asyncio import run
+
+        Read streaming data using the daemon (which must be running)
+
+        >>> async def read_streaming_data():
+        ...     async with DaemonClient() as client:
+        ...         await client.connect("Test-STH")
+        ...         stream = await client.subscribe(StreamingConfiguration())
+        ...         records = await anext(stream)
+        ...         await stream.close()
+        ...         return len(records) >= 1
+        >>> run(read_streaming_data())
+        True
+
+    """
+
+    def __init__(self, host: str | None = None, port: int | None = None):
+
+        self.logger = getLogger(__name__)
+        self.host = settings.daemon.host if host is None else host
+        self.port = settings.daemon.port if port is None else port
+
+        self.reader: StreamReader | None = None
+        self.writer: StreamWriter | None = None
+        self.task: Task[None] | None = None
+        self.responses: dict[int, Future[Packet]] = {}
+        self.request_ids = count(1)
+
+        self.stream_error: str | None = None
+        """Reason why the daemon stopped the data stream"""
+
+    async def __aenter__(self) -> DaemonClient:
+        """Connect to the daemon
+
+        Returns:
+
+            The connected client
+
+        Raises:
+
+            DaemonError:
+                If the client is unable to read the token of the daemon or
+                the daemon rejected the token
+
+        """
+
+        try:
+            token = read_token(self.port)
+        except (OSError, ValueError) as error:
+            raise DaemonError(
+                f"Unable to read token of daemon (is it running?): {error}"
+            ) from error
+
+        self.reader, self.writer = await open_connection(self.host, self.port)
+        self.task = create_task(self._receive())
+        try:
+            await self._request(MessageType.AUTH, token)
+        except DaemonError:
+            await self.__aexit__(None, None, None)
+            raise
+
+        return self
+
+    async def __aexit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Disconnect from the daemon
+
+        Args:
+
+            exception_type:
+                The type of the exception in case of an exception
+
+            exception_value:
+                The value of the exception in case of an exception
+
+            traceback:
+                The traceback in case of an exception
+
+        """
+
+        if self.writer is not None:
+            self.writer.close()
+            await self.writer.wait_closed()
+        if self.task is not None:
+            self.task.cancel()
+
+    async def _receive(self) -> None:
+        """Forward received packets to the waiting requests"""
+
+        assert self.reader is not None
+        try:
+            while True:
+                packet = await read_packet(self.reader)
+                future = self.responses.pop(packet.request_id, None)
+                if future is not None and not future.done():
+                    future.set_result(packet)
+                elif packet.type == MessageType.ERROR:
+                    self.stream_error = packet.payload.decode()
+                    self.logger.error(
+                        "Daemon stopped stream: %s", self.stream_error
+                    )
+        except (ConnectionError, IncompleteReadError, ValueError) as error:
+            for future in self.responses.values():
+                if not future.done():
+                    future.set_exception(
+                        DaemonError(f"Connection to daemon closed: {error}")
+                    )
+            self.responses.clear()
+
+    async def _request(
+        self, message_type: MessageType, payload: bytes = b""
+    ) -> Packet:
+        """Send a request to the daemon and wait for the response
+
+        Args:
+
+            message_type:
+                The type of the request
+
+            payload:
+                The data of the request
+
+        Returns:
+
+            The response of the daemon
+
+        Raises:
+
+            DaemonError:
+                If the daemon was unable to execute the request
+
+        """
+
+        if self.writer is None:
+            raise DaemonError("Not connected to daemon")
+        # Nobody would answer the request after the receive task stopped
+        if self.task is None or self.task.done():
+            raise DaemonError("Connection to daemon closed")
+
+        # Request identifier 0 is reserved for packets without request
+        request_id = next(self.request_ids) % (2**16 - 1) + 1
+        future: Future[Packet] = get_running_loop().create_future()
+        self.responses[request_id] = future
+        self.writer.write(
+            encode_packet(Packet(message_type, request_id, payload))
+        )
+        await self.writer.drain()
+
+        response = await future
+        if response.type == MessageType.ERROR:
+            raise DaemonError(response.payload.decode())
+
+        return response
+
+    async def request(self, message: CANMessage) -> CANMessage:
+        """Send a CAN request using the daemon
+
+        Args:
+
+            message:
+                The CAN request
+
+        Returns:
+
+            The response to the CAN request
+
+        """
+
+        response = await self._request(
+            MessageType.REQUEST, encode_can_frame(message)
+        )
+        return decode_can_frame(response.payload)
+
+    async def connect(self, identifier: int | str | EUI) -> None:
+        """Connect the daemon to a sensor node
+
+        Args:
+
+            identifier:
+                The MAC address (`EUI`), name (`str`), or node number (`int`)
+                of the sensor node
+
+        """
+
+        await self._request(MessageType.CONNECT, encode_identifier(identifier))
+
+    async def disconnect(self) -> None:
+        """Disconnect the daemon from the sensor node"""
+
+        await self._request(MessageType.DISCONNECT)
+
+    async def subscribe(
+        self, channels: StreamingConfiguration
+    ) -> DaemonStream:
+        """Subscribe to the data stream of the connected sensor node
+
+        If the data stream is not open already, then the daemon opens it.
+        Otherwise the streaming configuration has to match the
+        configuration of the open stream.
+
+        Args:
+
+            channels:
+                The streaming configuration
+
+        Returns:
+
+            An object that can be used to read the streaming data
+
+        """
+
+        response = await self._request(
+            MessageType.SUBSCRIBE, encode_channels(channels)
+        )
+        name, _ = decode_stream_info(response.payload)
+        self.stream_error = None
+
+        return DaemonStream(self, SharedRingBuffer(name))
+
+    async def unsubscribe(self) -> None:
+        """Unsubscribe from the data stream"""
+
+        await self._request(MessageType.UNSUBSCRIBE)
+
+
+# pylint: enable=too-many-instance-attributes
+
+# -- Main ---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    from doctest import testmod
+
+    testmod()
@@ -0,0 +1,565 @@
+"""Binary protocol used for the communication with the ICOtronic daemon
+
+Every packet starts with a header of 7 bytes:
+
+- message type (1 byte),
+- request identifier (2 bytes) and
+- length of the payload (4 bytes)
+
+followed by the payload. All numbers use little endian byte order. A
+response uses the same request identifier as the request it belongs to.
+Packets the daemon sends without a request (e.g. errors of the data stream)
+use the request identifier ``0``.
+
+The daemon only listens on loopback addresses. The first packet of every
+client has to authenticate the client using the random token the daemon
+stores in a file only readable by the current user (see
+:func:`token_filepath`).
+"""
+
+# -- Imports ------------------------------------------------------------------
+
+from __future__ import annotations
+
+from asyncio import StreamReader
+from enum import IntEnum
+from ipaddress import ip_address
+from os import (
+    chmod,
+    close,
+    open as open_file,
+    O_CREAT,
+    O_TRUNC,
+    O_WRONLY,
+    write,
+)
+from pathlib import Path
+from secrets import token_bytes
+from struct import error as StructError, Struct
+from typing import NamedTuple
+
+from can import Message as CANMessage
+from netaddr import EUI
+
+from icotronic.can.streaming import StreamingConfiguration
+from icotronic.utility.cache import get_cache_filepath
+
+# -- Attributes ---------------------------------------------------------------
+
+HEADER = Struct("<BHI")
+"""Format of the packet header"""
+
+CAN_FRAME = Struct("<IB8s")
+"""Format of a CAN frame (identifier, data length and data)"""
+
+STREAM_INFO = Struct("<Q")
+"""Format of the stream information (capacity), followed by the name"""
+
+MAXIMUM_PAYLOAD_SIZE = 2**16
+"""Maximum number of bytes in the payload of a packet"""
+
+TOKEN_SIZE = 32
+"""Number of bytes in the authentication token of the daemon"""
+
+# -- Classes ------------------------------------------------------------------
+
+
+class MessageType(IntEnum):
+    """Types of packets exchanged between client and daemon"""
+
+    REQUEST = 1
+    """Send a CAN request (client → daemon)"""
+
+    RESPONSE = 2
+    """Response to a CAN request (daemon → client)"""
+
+    CONNECT = 3
+    """Connect to a sensor node (client → daemon)"""
+
+    DISCONNECT = 4
+    """Disconnect from the sensor node (client → daemon)"""
+
+    SUBSCRIBE = 5
+    """Subscribe to the data stream (client → daemon)"""
+
+    UNSUBSCRIBE = 6
+    """Unsubscribe from the data stream (client → daemon)"""
+
+    OK = 7
+    """Successful execution of a request (daemon → client)"""
+
+    STREAM = 8
+    """Location of the shared memory of the data stream (daemon → client)"""
+
+    ERROR = 9
+    """Unsuccessful execution of a request (daemon → client)"""
+
+    AUTH = 10
+    """Authenticate using the token of the daemon (client → daemon)"""
+
+
+class Packet(NamedTuple):
+    """A packet exchanged between client and daemon"""
+
+    type: MessageType
+    """The type of the packet"""
+
+    request_id: int
+    """The identifier of the request the packet belongs to"""
+
+    payload: bytes = b""
+    """The data of the packet"""
+
+
+# -- Functions ----------------------------------------------------------------
+
+
+def is_loopback_address(host: str) -> bool:
+    """Check if a host address only allows connections of the local machine
+
+    Args:
+
+        host:
+            The host name or IP address
+
+    Returns:
+
+        ``True``, if the address is a loopback address, ``False`` otherwise
+
+    Examples:
+
+        Check some host addresses
+
+        >>> is_loopback_address("127.0.0.1")
+        True
+        >>> is_loopback_address("::1")
+        True
+        >>> is_loopback_address("localhost")
+        True
+        >>> is_loopback_address("0.0.0.0")
+        False
+        >>> is_loopback_address("example.com")
+        False
+
+    """
+
+    if host == "localhost":
+        return True
+
+    try:
+        return ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def token_filepath(port: int) -> Path:
+    """Get the path of the file that stores the token of a daemon
+
+    Args:
+
+        port:
+            The port the daemon listens on
+
+    Returns:
+
+        The path of the token file
+
+    Examples:
+
+        Get the name of the token file for port 50500
+
+        >>> token_filepath(50500).name
+        'daemon-50500.token'
+
+    """
+
+    return get_cache_filepath(f"daemon-{port}.token")
+
+
+def create_token(port: int) -> bytes:
+    """Create a new authentication token for a daemon
+
+    The function stores the token in a file only the current user can
+    access.
+
+    Args:
+
+        port:
+            The port the daemon listens on
+
+    Returns:
+
+        The new token
+
+    Examples:
+
+        Create a token and read it again
+
+        >>> token = create_token(1)
+        >>> read_token(1) == token
+        True
+        >>> token_filepath(1).unlink()
+
+    """
+
+    token = token_bytes(TOKEN_SIZE)
+    filepath = token_filepath(port)
+    descriptor = open_file(filepath, O_WRONLY | O_CREAT | O_TRUNC, 0o600)
+    try:
+        # Restrict access, even if the file existed before
+        chmod(filepath, 0o600)
+        write(descriptor, token.hex().encode())
+    finally:
+        close(descriptor)
+
+    return token
+
+
+def read_token(port: int) -> bytes:
+    """Read the authentication token of a daemon
+
+    Args:
+
+        port:
+            The port the daemon listens on
+
+    Returns:
+
+        The token of the daemon
+
+    Raises:
+
+        OSError:
+            If the token file does not exist or is not readable
+
+        ValueError:
+            If the token file does not contain a valid token
+
+    """
+
+    return bytes.fromhex(token_filepath(port).read_text(encoding="utf-8"))
+
+
+def encode_packet(packet: Packet) -> bytes:
+    """Convert a packet into its binary representation
+
+    Args:
+
+        packet:
+            The packet that should be converted
+
+    Returns:
+
+        The binary representation of the packet
+
+    Raises:
+
+        ValueError:
+            If the payload of the packet is too large
+
+    Examples:
+
+        Encode a packet
+
+        >>> encode_packet(Packet(MessageType.OK, 1, b"Hi")).hex()
+        '070100020000004869'
+
+    """
+
+    if len(packet.payload) > MAXIMUM_PAYLOAD_SIZE:
+        raise ValueError(
+            f"Payload size of {len(packet.payload)} bytes exceeds maximum of "
+            f"{MAXIMUM_PAYLOAD_SIZE} bytes"
+        )
+
+    return (
+        HEADER.pack(packet.type, packet.request_id, len(packet.payload))
+        + packet.payload
+    )
+
+
+async def read_packet(reader: StreamReader) -> Packet:
+    """Read a packet from a stream
+
+    Args:
+
+        reader:
+            The stream that should be used to read the packet
+
+    Returns:
+
+        The packet read from the stream
+
+    Raises:
+
+        IncompleteReadError:
+            If the stream ended before the end of the packet
+
+        ValueError:
+            If the stream contains invalid data
+
+    Examples:
+
+        Import required library code
+
+        >>> from asyncio import run
+
+        Read a packet from a stream
+
+        >>> async def read(data):
+        ...     reader = StreamReader()
+        ...     reader.feed_data(data)
+        ...     reader.feed_eof()
+        ...     return await read_packet(reader)
+        >>> run(read(encode_packet(Packet(MessageType.ERROR, 2, b"Oops"))))
+        Packet(type=<MessageType.ERROR: 9>, request_id=2, payload=b'Oops')
+
+    """
+
+    message_type, request_id, length = HEADER.unpack(
+        await reader.readexactly(HEADER.size)
+    )
+    if length > MAXIMUM_PAYLOAD_SIZE:
+        raise ValueError(
+            f"Payload size of {length} bytes exceeds maximum of "
+            f"{MAXIMUM_PAYLOAD_SIZE} bytes"
+        )
+
+    return Packet(
+        MessageType(message_type),
+        request_id,
+        await reader.readexactly(length),
+    )
+
+
+def encode_can_frame(message: CANMessage) -> bytes:
+    """Convert a CAN message into its binary representation
+
+    Args:
+
+        message:
+            The CAN message that should be converted
+
+    Returns:
+
+        The binary representation of the CAN message
+
+    Examples:
+
+        Encode and decode a CAN message
+
+        >>> message = CANMessage(arbitration_id=0x1234, data=[1, 2, 3])
+        >>> decoded = decode_can_frame(encode_can_frame(message))
+        >>> hex(decoded.arbitration_id), list(decoded.data)
+        ('0x1234', [1, 2, 3])
+
+    """
+
+    return CAN_FRAME.pack(
+        message.arbitration_id, message.dlc, bytes(message.data)
+    )
+
+
+def decode_can_frame(payload: bytes) -> CANMessage:
+    """Create a CAN message from its binary representation
+
+    Args:
+
+        payload:
+            The binary representation of the CAN message
+
+    Returns:
+
+        The CAN message
+
+    Raises:
+
+        ValueError:
+            If the payload does not contain a valid CAN message
+
+    """
+
+    try:
+        identifier, length, data = CAN_FRAME.unpack(payload)
+    except StructError as error:
+        raise ValueError(f"Invalid CAN frame data: {error}") from error
+
+    if length > 8:
+        raise ValueError(f"Invalid CAN data length: {length}")
+
+    return CANMessage(
+        arbitration_id=identifier,
+        data=data[:length],
+        is_extended_id=True,
+    )
+
+
+def encode_identifier(identifier: int | str | EUI) -> bytes:
+    """Convert a sensor node identifier into its binary representation
+
+    Args:
+
+        identifier:
+            The MAC address (`EUI`), name (`str`), or node number (`int`)
+            of a sensor node
+
+    Returns:
+
+        The binary representation of the identifier
+
+    Examples:
+
+        Encode and decode sensor node identifiers
+
+        >>> decode_identifier(encode_identifier(1))
+        1
+        >>> decode_identifier(encode_identifier("Test-STH"))
+        'Test-STH'
+        >>> decode_identifier(encode_identifier(EUI("08-6B-D7-01-DE-81")))
+        EUI('08-6B-D7-01-DE-81')
+
+    """
+
+    if isinstance(identifier, EUI):
+        return b"M" + identifier.packed
+    if isinstance(identifier, int):
+        return b"N" + bytes([identifier])
+
+    return b"S" + identifier.encode()
+
+
+def decode_identifier(payload: bytes) -> int | str | EUI:
+    """Create a sensor node identifier from its binary representation
+
+    Args:
+
+        payload:
+            The binary representation of the identifier
+
+    Returns:
+
+        The MAC address (`EUI`), name (`str`), or node number (`int`)
+
+    Raises:
+
+        ValueError:
+            If the payload does not contain a valid identifier
+
+    """
+
+    kind, data = payload[:1], payload[1:]
+    if kind == b"M" and len(data) == 6:
+        return EUI(int.from_bytes(data, byteorder="big"))
+    if kind == b"N" and len(data) == 1:
+        return data[0]
+    if kind == b"S":
+        return data.decode()
+
+    raise ValueError(f"Invalid sensor node identifier: {payload!r}")
+
+
+def encode_channels(channels: StreamingConfiguration) -> bytes:
+    """Convert a streaming configuration into its binary representation
+
+    Args:
+
+        channels:
+            The streaming configuration
+
+    Returns:
+
+        The binary representation of the streaming configuration
+
+    Examples:
+
+        Encode and decode a streaming configuration
+
+        >>> decode_channels(encode_channels(
+        ...     StreamingConfiguration(first=True, third=True)))
+        Channel 1 enabled, Channel 2 disabled, Channel 3 enabled
+
+    """
+
+    return bytes([channels.first | channels.second << 1 | channels.third << 2])
+
+
+def decode_channels(payload: bytes) -> StreamingConfiguration:
+    """Create a streaming configuration from its binary representation
+
+    Args:
+
+        payload:
+            The binary representation of the streaming configuration
+
+    Returns:
+
+        The streaming configuration
+
+    Raises:
+
+        ValueError:
+            If the payload does not contain a valid streaming configuration
+
+    """
+
+    if len(payload) != 1:
+        raise ValueError(f"Invalid streaming configuration: {payload!r}")
+
+    bits = payload[0]
+    return StreamingConfiguration(
+        first=bool(bits & 1), second=bool(bits & 2), third=bool(bits & 4)
+    )
+
+
+def encode_stream_info(name: str, capacity: int) -> bytes:
+    """Convert information about a shared memory stream into bytes
+
+    Args:
+
+        name:
+            The name of the shared memory
+
+        capacity:
+            The number of records the shared memory can store
+
+    Returns:
+
+        The binary representation of the stream information
+
+    Examples:
+
+        Encode and decode stream information
+
+        >>> decode_stream_info(encode_stream_info("icotronic", 1024))
+        ('icotronic', 1024)
+
+    """
+
+    return STREAM_INFO.pack(capacity) + name.encode()
+
+
+def decode_stream_info(payload: bytes) -> tuple[str, int]:
+    """Create stream information from its binary representation
+
+    Args:
+
+        payload:
+            The binary representation of the stream information
+
+    Returns:
+
+        A tuple containing the name of the shared memory and the number of
+        records the shared memory can store
+
+    """
+
+    (capacity,) = STREAM_INFO.unpack(payload[: STREAM_INFO.size])
+    return payload[STREAM_INFO.size :].decode(), capacity
+
+
+# -- Main ---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    from doctest import testmod
+
+    testmod()
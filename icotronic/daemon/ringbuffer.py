@@ -0,0 +1,275 @@
+"""Share streaming data between processes using a ring buffer
+
+The ring buffer stores streaming data in shared memory. A single process
+(the daemon) writes the data, while any number of processes read it. Every
+reader keeps track of its own read position. If a reader is too slow, then
+the writer overwrites data the reader did not read yet. The reader detects
+this condition and reports the number of lost records.
+
+The shared memory starts with a header that stores the total number of
+written records and the capacity of the buffer, followed by the records.
+"""
+
+# -- Imports ------------------------------------------------------------------
+
+from __future__ import annotations
+
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from sys import platform
+from types import TracebackType
+
+from numpy import (
+    concatenate,
+    dtype,
+    float32,
+    float64,
+    iinfo,
+    ndarray,
+    uint8,
+    uint16,
+    uint64,
+)
+
+from icotronic.can.streaming import StreamingData
+
+# -- Attributes ---------------------------------------------------------------
+
+HEADER_DTYPE = dtype([("written", uint64), ("capacity", uint64)])
+"""Structure of the ring buffer header"""
+
+RECORD_DTYPE = dtype([
+    ("timestamp", float64),
+    ("counter", uint8),
+    ("lost", uint16),
+    ("length", uint8),
+    ("values", float32, 3),
+])
+"""Structure of a single streaming message in the ring buffer"""
+
+_created: set[str] = set()
+"""Names of the shared memory blocks created by this process"""
+
+# -- Classes ------------------------------------------------------------------
+
+
+class SharedRingBuffer:
+    """Store streaming data in shared memory
+
+    Args:
+
+        name:
+            The name of existing shared memory or ``None`` to create new
+            shared memory
+
+        capacity:
+            The number of records the ring buffer can store, if the buffer
+            creates new shared memory
+
+    Examples:
+
+        Create a ring buffer and attach to it from the reader side
+
+        >>> with SharedRingBuffer(capacity=4) as writer:
+        ...     with SharedRingBuffer(writer.name) as reader:
+        ...         for counter in range(3):
+        ...             writer.append(StreamingData(values=[1, 2, counter],
+        ...                                         counter=counter,
+        ...                                         timestamp=counter))
+        ...         records, position, lost = reader.read(0)
+        ...         writer.unlink()
+        >>> records["counter"].tolist(), position, lost
+        ([0, 1, 2], 3, 0)
+        >>> records["values"][-1].tolist()
+        [1.0, 2.0, 2.0]
+
+        A reader detects overwritten data
+
+        >>> with SharedRingBuffer(capacity=4) as buffer:
+        ...     for counter in range(10):
+        ...         buffer.append(StreamingData(values=[1, 2], counter=counter,
+        ...                                     timestamp=counter))
+        ...     records, position, lost = buffer.read(0)
+        ...     buffer.unlink()
+        >>> records["counter"].tolist(), position, lost
+        ([6, 7, 8, 9], 10, 6)
+
+    """
+
+    def __init__(self, name: str | None = None, capacity: int = 2**16) -> None:
+
+        if name is None:
+            if capacity < 1:
+                raise ValueError(f"Invalid capacity: {capacity}")
+            self.memory = SharedMemory(
+                create=True,
+                size=HEADER_DTYPE.itemsize + capacity * RECORD_DTYPE.itemsize,
+            )
+            _created.add(self.memory.name)
+        else:
+            self.memory = SharedMemory(name=name)
+            # Otherwise the resource tracker of this (reading) process
+            # removes the shared memory when the process ends
+            if platform != "win32" and name not in _created:
+                resource_tracker.unregister(
+                    self.memory._name,  # type: ignore[attr-defined]
+                    "shared_memory",
+                )
+
+        self.header = ndarray((), dtype=HEADER_DTYPE, buffer=self.memory.buf)
+        if name is None:
+            self.header["written"] = 0
+            self.header["capacity"] = capacity
+        self.capacity = int(self.header["capacity"])
+        self.records = ndarray(
+            (self.capacity,),
+            dtype=RECORD_DTYPE,
+            buffer=self.memory.buf,
+            offset=HEADER_DTYPE.itemsize,
+        )
+
+    def __enter__(self) -> SharedRingBuffer:
+        """Use the ring buffer in a context manager
+
+        Returns:
+
+            The ring buffer
+
+        """
+
+        return self
+
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the shared memory
+
+        Args:
+
+            exception_type:
+                The type of the exception in case of an exception
+
+            exception_value:
+                The value of the exception in case of an exception
+
+            traceback:
+                The traceback in case of an exception
+
+        """
+
+        self.close()
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory"""
+
+        return self.memory.name
+
+    def written(self) -> int:
+        """Get the number of records written since the creation of the buffer
+
+        Returns:
+
+            The total number of written records
+
+        """
+
+        return int(self.header["written"])
+
+    def append(self, data: StreamingData, lost: int = 0) -> None:
+        """Add a streaming message to the ring buffer
+
+        Only a single process should write data into the ring buffer.
+
+        Args:
+
+            data:
+                The streaming data that should be stored
+
+            lost:
+                The number of lost streaming messages right before this
+                message
+
+        """
+
+        written = int(self.header["written"])
+        record = self.records[written % self.capacity]
+        values = data.values
+        record["timestamp"] = data.timestamp
+        record["counter"] = data.counter
+        record["lost"] = min(lost, iinfo(uint16).max)
+        record["length"] = len(values)
+        record["values"][: len(values)] = values
+        # Update the counter after the record, so readers never see
+        # incomplete data
+        self.header["written"] = written + 1
+
+    def read(self, position: int) -> tuple[ndarray, int, int]:
+        """Read records from the ring buffer
+
+        Args:
+
+            position:
+                The number of records read before (usually the position
+                returned by the last call of this method)
+
+        Returns:
+
+            A tuple containing
+
+            - a copy of the records written since the given position,
+            - the new read position and
+            - the number of records that were overwritten before they could
+              be read
+
+        """
+
+        written = int(self.header["written"])
+        start = max(position, written - self.capacity)
+        lost = start - position
+
+        first, last = start % self.capacity, written % self.capacity
+        if written - start <= 0:
+            records = self.records[:0].copy()
+        elif first < last:
+            records = self.records[first:last].copy()
+        else:
+            records = concatenate((self.records[first:], self.records[:last]))
+
+        # The writer might have overwritten data, while we copied it
+        overwritten = int(self.header["written"]) - self.capacity - start
+        if overwritten > 0:
+            records = records[overwritten:]
+            lost += overwritten
+
+        return records, written, lost
+
+    def close(self) -> None:
+        """Close the shared memory of this process"""
+
+        # Numpy arrays must not reference the buffer when closing it
+        del self.header
+        del self.records
+        self.memory.close()
+
+    def unlink(self) -> None:
+        """Remove the shared memory
+
+        Only the process that created the shared memory should call this
+        method.
+
+        """
+
+        self.memory.unlink()
+        _created.discard(self.memory.name)
+
+
+# -- Main ---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    from doctest import testmod
+
+    testmod()
@@ -0,0 +1,445 @@
+"""Share the connection to the ICOtronic system with multiple processes
+
+Only a single process can use the CAN adapter at a time. The daemon owns
+the connection to the STU and provides access to it over a local socket
+using the protocol described in :mod:`icotronic.daemon.protocol`. Only
+processes of the same user, which can read the authentication token of the
+daemon, are able to use the daemon. Clients (see
+:class:`icotronic.daemon.client.DaemonClient`) can
+
+- send CAN requests,
+- connect to sensor nodes and
+- subscribe to the data stream of the connected sensor node.
+
+The daemon stores streaming data in a single shared memory ring buffer
+(:class:`icotronic.daemon.ringbuffer.SharedRingBuffer`) that all
+subscribed clients read. This way the amount of work the daemon does for
+streaming data does not depend on the number of clients.
+"""
+
+# -- Imports ------------------------------------------------------------------
+
+from __future__ import annotations
+
+from asyncio import (
+    CancelledError,
+    create_task,
+    get_running_loop,
+    IncompleteReadError,
+    Lock,
+    start_server,
+    StreamReader,
+    StreamWriter,
+    Task,
+)
+from hmac import compare_digest
+from logging import getLogger
+
+from icotronic.can.error import CANConnectionError
+from icotronic.can.node.sensor import SensorNode
+from icotronic.can.protocol.message import Message
+from icotronic.can.session import Session
+from icotronic.can.streaming import (
+    StreamingConfiguration,
+    StreamingError,
+)
+from icotronic.config import settings
+from icotronic.daemon.protocol import (
+    create_token,
+    decode_can_frame,
+    decode_channels,
+    decode_identifier,
+    encode_can_frame,
+    encode_channels,
+    encode_packet,
+    encode_stream_info,
+    is_loopback_address,
+    MessageType,
+    Packet,
+    read_packet,
+    token_filepath,
+)
+from icotronic.daemon.ringbuffer import SharedRingBuffer
+
+# -- Classes ------------------------------------------------------------------
+
+# pylint: disable=too-few-public-methods, too-many-instance-attributes
+
+
+class Daemon:
+    """Provide access to the ICOtronic system for multiple processes
+
+    Args:
+
+        host:
+            The (loopback) address the daemon listens on; ``None`` uses the
+            value from the configuration
+
+        port:
+            The port the daemon listens on; ``None`` uses the value from the
+            configuration
+
+        capacity:
+            The number of streaming messages stored in the ring buffer
+
+    Raises:
+
+        ValueError:
+            If the host address is not a loopback address
+
+    Examples:
+
+        Import required library code
+
+        >>> from asyncio import run, wait_for
+
+        Run the daemon for one second
+
+        >>> async def run_daemon():
+        ...     try:
+        ...         await wait_for(Daemon().serve(), timeout=1)
+        ...     except TimeoutError:
+        ...         pass
+        >>> run(run_daemon())
+
+    """
+
+    def __init__(
+        self,
+        host: str | None = None,
+        port: int | None = None,
+        capacity: int = 2**16,
+    ) -> None:
+
+        self.logger = getLogger(__name__)
+        self.host = settings.daemon.host if host is None else host
+        self.port = settings.daemon.port if port is None else port
+        self.capacity = capacity
+
+        if not is_loopback_address(self.host):
+            raise ValueError(
+                f"Daemon host “{self.host}” is not a loopback address"
+            )
+        self.token = b""
+        """Token clients have to send to use the daemon"""
+
+        self.session: Session | None = None
+        self.sensor_node: SensorNode | None = None
+        self.lock = Lock()
+
+        self.channels: StreamingConfiguration | None = None
+        self.ring_buffer: SharedRingBuffer | None = None
+        self.stream_task: Task[None] | None = None
+        self.subscribers: set[StreamWriter] = set()
+        self.clients: set[StreamWriter] = set()
+
+    async def serve(self, session: Session | None = None) -> None:
+        """Handle client requests until cancelled
+
+        Args:
+
+            session:
+                The session used to communicate with the ICOtronic system;
+                ``None`` opens a new session
+
+        """
+
+        if session is None:
+            async with Session() as new_session:
+                await self.serve(new_session)
+            return
+
+        self.session = session
+        self.token = create_token(self.port)
+        try:
+            server = await start_server(
+                self._handle_client, self.host, self.port
+            )
+            self.logger.info("Listening on %s:%s", self.host, self.port)
+            async with server:
+                try:
+                    # The server already accepts clients, wait until the
+                    # coroutine is cancelled
+                    await get_running_loop().create_future()
+                finally:
+                    # Otherwise closing the server waits for all clients
+                    for writer in self.clients:
+                        writer.close()
+        finally:
+            await self._stop_stream()
+            self.session = None
+            token_filepath(self.port).unlink(missing_ok=True)
+
+    async def _handle_client(
+        self, reader: StreamReader, writer: StreamWriter
+    ) -> None:
+        """Handle the requests of a single client
+
+        Args:
+
+            reader:
+                The stream used to read requests of the client
+
+            writer:
+                The stream used to send responses to the client
+
+        """
+
+        client = writer.get_extra_info("peername")
+        self.logger.info("Client connected: %s", client)
+        self.clients.add(writer)
+        try:
+            packet = await read_packet(reader)
+            if packet.type != MessageType.AUTH or not compare_digest(
+                packet.payload, self.token
+            ):
+                self.logger.warning("Rejected client: %s", client)
+                writer.write(
+                    encode_packet(
+                        Packet(
+                            MessageType.ERROR,
+                            packet.request_id,
+                            b"Invalid authentication token",
+                        )
+                    )
+                )
+                await writer.drain()
+                return
+            writer.write(
+                encode_packet(Packet(MessageType.OK, packet.request_id))
+            )
+            await writer.drain()
+
+            while True:
+                packet = await read_packet(reader)
+                try:
+                    response = await self._handle_packet(packet, writer)
+                except (
+                    CANConnectionError,
+                    StreamingError,
+                    TimeoutError,
+                    ValueError,
+                ) as error:
+                    response = Packet(
+                        MessageType.ERROR,
+                        packet.request_id,
+                        str(error).encode(),
+                    )
+                writer.write(encode_packet(response))
+                await writer.drain()
+        except (ConnectionError, IncompleteReadError, ValueError):
+            pass
+        finally:
+            self.logger.info("Client disconnected: %s", client)
+            self.clients.discard(writer)
+            await self._unsubscribe(writer)
+            writer.close()
+
+    async def _handle_packet(
+        self, packet: Packet, writer: StreamWriter
+    ) -> Packet:
+        """Execute a client request
+
+        Args:
+
+            packet:
+                The request of the client
+
+            writer:
+                The stream used to send responses to the client
+
+        Returns:
+
+            The response to the request
+
+        Raises:
+
+            ValueError:
+                If the request is invalid or can not be executed right now
+
+        """
+
+        session = self.session
+        assert session is not None
+        request_id = packet.request_id
+
+        if packet.type == MessageType.REQUEST:
+            response = await session.stu.spu.request(
+                Message(decode_can_frame(packet.payload)),
+                description="execute request of daemon client",
+            )
+            return Packet(
+                MessageType.RESPONSE, request_id, encode_can_frame(response)
+            )
+
+        if packet.type == MessageType.CONNECT:
+            identifier = decode_identifier(packet.payload)
+            async with self.lock:
+                if self.stream_task is not None:
+                    raise ValueError(
+                        "Unable to switch sensor node while streaming"
+                    )
+                self.sensor_node = await session.connect(identifier)
+            return Packet(MessageType.OK, request_id)
+
+        if packet.type == MessageType.DISCONNECT:
+            async with self.lock:
+                if self.stream_task is not None:
+                    raise ValueError("Unable to disconnect while streaming")
+                await session.disconnect()
+                self.sensor_node = None
+            return Packet(MessageType.OK, request_id)
+
+        if packet.type == MessageType.SUBSCRIBE:
+            ring_buffer = await self._subscribe(
+                writer, decode_channels(packet.payload)
+            )
+            return Packet(
+                MessageType.STREAM,
+                request_id,
+                encode_stream_info(ring_buffer.name, ring_buffer.capacity),
+            )
+
+        if packet.type == MessageType.UNSUBSCRIBE:
+            await self._unsubscribe(writer)
+            return Packet(MessageType.OK, request_id)
+
+        raise ValueError(f"Unsupported request type: {packet.type.name}")
+
+    async def _subscribe(
+        self, writer: StreamWriter, channels: StreamingConfiguration
+    ) -> SharedRingBuffer:
+        """Add a subscriber to the data stream
+
+        Args:
+
+            writer:
+                The stream used to send data to the client
+
+            channels:
+                The requested streaming configuration
+
+        Returns:
+
+            The ring buffer that stores the streaming data
+
+        Raises:
+
+            ValueError:
+                If there is no connected sensor node or the stream uses a
+                different configuration
+
+        """
+
+        async with self.lock:
+            if self.sensor_node is None:
+                raise ValueError("Not connected to sensor node")
+
+            if self.stream_task is None:
+                self.ring_buffer = SharedRingBuffer(capacity=self.capacity)
+                self.channels = channels
+                self.stream_task = create_task(
+                    self._stream(self.sensor_node, channels, self.ring_buffer)
+                )
+                self.logger.info("Started stream: %s", channels)
+            elif self.channels is None or encode_channels(
+                self.channels
+            ) != encode_channels(channels):
+                raise ValueError(
+                    f"Stream already open with configuration “{self.channels}”"
+                )
+
+            self.subscribers.add(writer)
+            assert self.ring_buffer is not None
+
+            return self.ring_buffer
+
+    async def _unsubscribe(self, writer: StreamWriter) -> None:
+        """Remove a subscriber from the data stream
+
+        The daemon closes the data stream after the last client
+        unsubscribed.
+
+        Args:
+
+            writer:
+                The stream used to send data to the client
+
+        """
+
+        async with self.lock:
+            self.subscribers.discard(writer)
+            if not self.subscribers:
+                await self._stop_stream()
+
+    async def _stream(
+        self,
+        sensor_node: SensorNode,
+        channels: StreamingConfiguration,
+        ring_buffer: SharedRingBuffer,
+    ) -> None:
+        """Store streaming data in the ring buffer
+
+        Args:
+
+            sensor_node:
+                The sensor node that should be used to read streaming data
+
+            channels:
+                The streaming configuration
+
+            ring_buffer:
+                The ring buffer that stores the streaming data
+
+        """
+
+        append = ring_buffer.append
+        try:
+            async with sensor_node.open_data_stream(channels) as stream:
+                async for data, lost in stream:
+                    append(data, lost)
+        except (CANConnectionError, StreamingError) as error:
+            self.logger.error("Streaming failed: %s", error)
+            # Inform all subscribers about the problem
+            packet = encode_packet(
+                Packet(MessageType.ERROR, 0, str(error).encode())
+            )
+            for writer in self.subscribers:
+                writer.write(packet)
+            self.subscribers.clear()
+            self.stream_task = None
+            ring_buffer.close()
+            ring_buffer.unlink()
+            self.ring_buffer = None
+
+    async def _stop_stream(self) -> None:
+        """Stop the data stream and remove the ring buffer"""
+
+        task = self.stream_task
+        if task is None:
+            return
+
+        self.stream_task = None
+        task.cancel()
+        try:
+            await task
+        except CancelledError:
+            pass
+
+        ring_buffer = self.ring_buffer
+        if ring_buffer is not None:
+            ring_buffer.close()
+            ring_buffer.unlink()
+            self.ring_buffer = None
+        self.channels = None
+        self.logger.info("Stopped stream")
+
+
+# pylint: enable=too-few-public-methods, too-many-instance-attributes
+
+# -- Main ---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    from doctest import testmod
+
+    testmod()
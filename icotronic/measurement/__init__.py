@@ -2,5 +2,12 @@
 
 # -- Exports ------------------------------------------------------------------
 
-from .acceleration import ratio_noise_max
-from .data import ChannelData, Conversion, DataPoint, MeasurementData
+from .acceleration import ratio_noise_max, ratio_noise_max_channels
+from .data import (
+    ChannelData,
+    Conversion,
+    DataPoint,
+    DataPointView,
+    MeasurementData,
+)
+from .spectrum import Spectrum, SpectrumAnalyzer
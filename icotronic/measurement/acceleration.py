@@ -6,31 +6,126 @@ from collections.abc import Iterable
 from math import log, sqrt
 from statistics import pvariance
 
+from numpy import asarray, float64, log10, ndarray
+from numpy.typing import ArrayLike, NDArray
+
+from icotronic.can.streaming.data import StreamingDataBlock
+from icotronic.can.streaming.stats import ChannelStats
 from icotronic.measurement.constants import ADC_MAX_VALUE
 
 # -- Functions ----------------------------------------------------------------
 
 
-def ratio_noise_max(values: Iterable[int]) -> float:
+def ratio_noise_max(values: Iterable[int] | ChannelStats | ndarray) -> float:
     """Calculate the ratio noise to max ADC amplitude in dB
 
     Args:
 
         values:
             An iterable object that stores a series of measured 16 bit raw ADC
-            (acceleration) values
+            (acceleration) values or statistics calculated from these values.
+            For NumPy arrays the function calculates the result vectorized.
 
     Returns:
 
         The ratio of the average noise to the highest possible measured value
 
+    Examples:
+
+        Import required library code
+
+        >>> from numpy import array
+
+        Calculate the ratio for some raw values
+
+        >>> values = [32000, 32100, 32050, 31950]
+        >>> round(ratio_noise_max(values), 2)
+        -55.36
+
+        Calculate the ratio based on statistics collected while streaming
+
+        >>> round(ratio_noise_max(ChannelStats().update(values)), 2)
+        -55.36
+
+        Calculate the ratio for a NumPy array
+
+        >>> round(ratio_noise_max(array(values, dtype="uint16")), 2)
+        -55.36
+
     """
 
     max_value = ADC_MAX_VALUE / 2
-    standard_deviation = sqrt(pvariance(values))
+
+    if isinstance(values, ndarray):
+        return float(20 * log10(values.std() / max_value))
+
+    standard_deviation = (
+        values.standard_deviation()
+        if isinstance(values, ChannelStats)
+        else sqrt(pvariance(values))
+    )
     return 20 * log(standard_deviation / max_value, 10)
 
 
+def ratio_noise_max_channels(
+    values: ArrayLike | StreamingDataBlock,
+) -> NDArray[float64]:
+    """Calculate the ratio noise to max ADC amplitude for multiple channels
+
+    Args:
+
+        values:
+            A two dimensional array that stores the raw 16 bit ADC values of
+            one channel per row, or a streaming data block that stores the
+            values of one channel per value position
+
+    Returns:
+
+        An array containing the ratio of the average noise to the highest
+        possible measured value for each channel in dB
+
+    Examples:
+
+        Import required library code
+
+        >>> from icotronic.can.streaming.data import StreamingData
+
+        Calculate the ratio for three channels at once
+
+        >>> ratio_noise_max_channels([
+        ...     [32000, 32100, 32050, 31950],
+        ...     [32000, 32200, 32100, 31900],
+        ...     [32000, 32000, 32000, 32001],
+        ... ]).round(2)
+        array([-55.36, -49.34, -97.58])
+
+        Calculate the ratio for the channels of a streaming data block
+
+        >>> block = StreamingDataBlock()
+        >>> block.extend([
+        ...     StreamingData(values=[32000, 32000, 32000], counter=1,
+        ...                   timestamp=1),
+        ...     StreamingData(values=[32100, 32200, 32000], counter=2,
+        ...                   timestamp=2),
+        ...     StreamingData(values=[32050, 32100, 32000], counter=3,
+        ...                   timestamp=3),
+        ...     StreamingData(values=[31950, 31900, 32001], counter=4,
+        ...                   timestamp=4)])
+        >>> ratio_noise_max_channels(block).round(2)
+        array([-55.36, -49.34, -97.58])
+
+    """
+
+    channels = (
+        values.to_numpy().T
+        if isinstance(values, StreamingDataBlock)
+        else asarray(values)
+    )
+    max_value = ADC_MAX_VALUE / 2
+
+    return 20 * log10(channels.std(axis=-1) / max_value)
+
+
 # -- Main ---------------------------------------------------------------------
 
 if __name__ == "__main__":
@@ -1,10 +1,14 @@
 """Measurement support code"""
 
+# pylint: disable=too-many-lines
+
 # -- Imports ------------------------------------------------------------------
 
 from __future__ import annotations
 
-from typing import Callable, Iterator, NamedTuple
+from collections.abc import Iterable
+from itertools import starmap
+from typing import Callable, Iterator, NamedTuple, overload
 
 from icotronic.can.streaming.config import StreamingConfiguration
 from icotronic.can.streaming.data import StreamingData
@@ -42,11 +46,295 @@ class DataPoint(NamedTuple):
         return f"{self.value}@{self.timestamp} #{self.counter}"
 
 
+class DataPointView:
+    """Access the data points of channel data like a list
+
+    Changes to the view (e.g. appending a data point) change the underlying
+    channel data.
+
+    Args:
+
+        channel_data:
+            The channel data that stores the data points
+
+    Examples:
+
+        Change the data points of channel data using the view
+
+        >>> data = ChannelData()
+        >>> data.data.append(DataPoint(counter=1, timestamp=1, value=4))
+        >>> data.data.extend([DataPoint(counter=2, timestamp=2, value=5)])
+        >>> data.data[0] = DataPoint(counter=1, timestamp=1, value=3)
+        >>> data
+        3@1 #1
+        5@2 #2
+        >>> data.data[-1]
+        5@2 #2
+        >>> len(data.data)
+        2
+
+    """
+
+    def __init__(self, channel_data: ChannelData) -> None:
+
+        self.channel_data = channel_data
+
+    def __len__(self) -> int:
+        """Get the number of data points
+
+        Returns:
+
+            The number of data points of the channel data
+
+        """
+
+        return len(self.channel_data)
+
+    def __iter__(self) -> Iterator[DataPoint]:
+        """Iterate over the data points
+
+        Returns:
+
+            An iterator over the data points of the channel data
+
+        """
+
+        return iter(self.channel_data)
+
+    @overload
+    def __getitem__(self, index: int) -> DataPoint:
+        pass
+
+    @overload
+    def __getitem__(self, index: slice) -> list[DataPoint]:
+        pass
+
+    def __getitem__(self, index: int | slice) -> DataPoint | list[DataPoint]:
+        """Get a single data point or a list of data points
+
+        Args:
+
+            index:
+                The index of the requested data point or a slice that
+                specifies multiple data points
+
+        Returns:
+
+            The requested data point(s)
+
+        Examples:
+
+            Get some of the data points of example data
+
+            >>> data = ChannelData()
+            >>> data.data = [DataPoint(counter=counter, timestamp=counter,
+            ...                        value=counter * 10)
+            ...              for counter in range(1, 5)]
+            >>> data.data[1]
+            20@2 #2
+            >>> data.data[1:3]
+            [20@2 #2, 30@3 #3]
+            >>> data.data[::-2]
+            [40@4 #4, 20@2 #2]
+
+        """
+
+        data = self.channel_data
+        if isinstance(index, slice):
+            return list(
+                starmap(
+                    DataPoint,
+                    zip(
+                        data.counters[index],
+                        data.timestamps[index],
+                        data.measured_values[index],
+                    ),
+                )
+            )
+
+        return DataPoint(
+            data.counters[index],
+            data.timestamps[index],
+            data.measured_values[index],
+        )
+
+    @overload
+    def __setitem__(self, index: int, value: DataPoint) -> None:
+        pass
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[DataPoint]) -> None:
+        pass
+
+    def __setitem__(
+        self, index: int | slice, value: DataPoint | Iterable[DataPoint]
+    ) -> None:
+        """Replace a single data point or multiple data points
+
+        Args:
+
+            index:
+                The index of the data point or a slice that specifies the
+                data points that should be replaced
+
+            value:
+                The new data point(s)
+
+        Examples:
+
+            Replace some data points of example data
+
+            >>> data = ChannelData()
+            >>> data.data = [DataPoint(counter=counter, timestamp=counter,
+            ...                        value=counter * 10)
+            ...              for counter in range(1, 4)]
+            >>> data.data[:2] = [DataPoint(counter=5, timestamp=5, value=1)]
+            >>> data
+            1@5 #5
+            30@3 #3
+
+        """
+
+        data = self.channel_data
+        if isinstance(index, slice):
+            assert not isinstance(value, DataPoint)
+            points = list(value)
+            data.counters[index] = [point.counter for point in points]
+            data.timestamps[index] = [point.timestamp for point in points]
+            data.measured_values[index] = [point.value for point in points]
+            return
+
+        assert isinstance(value, DataPoint)
+        data.counters[index] = value.counter
+        data.timestamps[index] = value.timestamp
+        data.measured_values[index] = value.value
+
+    def __repr__(self) -> str:
+        """Get the textual representation of the data points
+
+        Returns:
+
+            A string that contains the list of data points
+
+        """
+
+        return repr(list(self))
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the data points with another sequence
+
+        Args:
+
+            other:
+                The object that should be compared with the data points
+
+        Returns:
+
+            ``True``, if the other object contains the same data points,
+            ``False`` otherwise
+
+        Examples:
+
+            Compare the data points of some channel data with a list
+
+            >>> data = ChannelData()
+            >>> point = DataPoint(counter=1, timestamp=1.5, value=4)
+            >>> data.append(point)
+            >>> data.data == [point]
+            True
+
+        """
+
+        if isinstance(other, (DataPointView, list, tuple)):
+            return list(self) == list(other)
+
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def append(self, value: DataPoint) -> None:
+        """Append a data point
+
+        Args:
+
+            value:
+                The data point that should be added
+
+        """
+
+        self.channel_data.append(value)
+
+    def extend(self, values: Iterable[DataPoint]) -> None:
+        """Append multiple data points
+
+        Args:
+
+            values:
+                The data points that should be added
+
+        """
+
+        for value in values:
+            self.channel_data.append(value)
+
+
 class ChannelData:
     """Store measurement data for a single channel"""
 
     def __init__(self) -> None:
-        self.data: list[DataPoint] = []
+        # We store the data column-wise and only create data point objects on
+        # demand, since a measurement usually contains millions of values.
+        self.counters: list[int] = []
+        self.timestamps: list[float] = []
+        self.measured_values: list[float] = []
+
+    @property
+    def data(self) -> DataPointView:
+        """Get all data points of the channel
+
+        Returns:
+
+            A (mutable) list like view of the data points of the channel
+            data
+
+        Examples:
+
+            Get the data points of some example data
+
+            >>> data = ChannelData()
+            >>> data.append(DataPoint(counter=1, timestamp=1.5, value=4))
+            >>> data.data
+            [4@1.5 #1]
+
+        """
+
+        return DataPointView(self)
+
+    @data.setter
+    def data(self, data: Iterable[DataPoint]) -> None:
+        """Replace all data points of the channel
+
+        Args:
+
+            data:
+                The new data points of the channel
+
+        Examples:
+
+            Replace the data points of some example data
+
+            >>> data = ChannelData()
+            >>> data.append(DataPoint(counter=1, timestamp=1.5, value=4))
+            >>> data.data = [DataPoint(counter=2, timestamp=2, value=5)]
+            >>> data
+            5@2 #2
+
+        """
+
+        points = list(data)
+        self.counters = [point.counter for point in points]
+        self.timestamps = [point.timestamp for point in points]
+        self.measured_values = [point.value for point in points]
 
     def __repr__(self) -> str:
         """Get the string representation of the data
@@ -75,7 +363,7 @@ class ChannelData:
 
         """
 
-        return "\n".join([repr(datapoint) for datapoint in self.data])
+        return "\n".join([repr(datapoint) for datapoint in self])
 
     def __add__(self, other: object) -> ChannelData:
         """Concatenate channel data with other channel data
@@ -131,7 +419,11 @@ class ChannelData:
             return NotImplemented
 
         channel_data = ChannelData()
-        channel_data.data = list(self.data) + list(other.data)
+        channel_data.counters = self.counters + other.counters
+        channel_data.timestamps = self.timestamps + other.timestamps
+        channel_data.measured_values = (
+            self.measured_values + other.measured_values
+        )
         return channel_data
 
     def __iter__(self) -> Iterator:
@@ -159,7 +451,32 @@ class ChannelData:
 
         """
 
-        return iter(self.data)
+        return starmap(
+            DataPoint,
+            zip(self.counters, self.timestamps, self.measured_values),
+        )
+
+    def __len__(self) -> int:
+        """Get the number of data points stored in the channel data
+
+        Returns:
+
+            The number of values of the channel
+
+        Examples:
+
+            Get the length of some example channel data
+
+            >>> data = ChannelData()
+            >>> len(data)
+            0
+            >>> data.append(DataPoint(counter=1, timestamp=1, value=4))
+            >>> len(data)
+            1
+
+        """
+
+        return len(self.measured_values)
 
     def append(self, data: DataPoint) -> None:
         """Append a value to the channel data
@@ -186,7 +503,46 @@ class ChannelData:
 
         """
 
-        self.data.append(data)
+        self.counters.append(data.counter)
+        self.timestamps.append(data.timestamp)
+        self.measured_values.append(data.value)
+
+    def append_values(
+        self, counter: int, timestamp: float, values: Iterable[float]
+    ) -> None:
+        """Add multiple values that share message counter and timestamp
+
+        Args:
+
+            counter:
+
+                The message counter of the values
+
+            timestamp:
+
+                The timestamp of the values
+
+            values:
+
+                The values that should be added to the channel data
+
+        Examples:
+
+            Add the values of a single streaming message
+
+            >>> data = ChannelData()
+            >>> data.append_values(counter=3, timestamp=1.5, values=[1, 2])
+            >>> data
+            1@1.5 #3
+            2@1.5 #3
+
+        """
+
+        start = len(self.measured_values)
+        self.measured_values.extend(values)
+        number_values = len(self.measured_values) - start
+        self.counters.extend([counter] * number_values)
+        self.timestamps.extend([timestamp] * number_values)
 
     def values(self) -> list[float]:
         """Return a list of all the values of the channel data
@@ -210,7 +566,7 @@ class ChannelData:
 
         """
 
-        return [data.value for data in self]
+        return list(self.measured_values)
 
 
 # pylint: disable=too-few-public-methods
@@ -376,6 +732,49 @@ class MeasurementData:
 
         return len(self.streaming_data_list)
 
+    def _channel_data(self, index: int | None) -> ChannelData:
+        """Get the data of a single measurement channel
+
+        Args:
+
+            index:
+
+                The position of the channel value in the streaming data or
+                ``None``, if all values of the streaming data belong to the
+                channel
+
+        Returns:
+
+            Data values for the specified measurement channel
+
+        """
+
+        channel_data = ChannelData()
+
+        if index is None:
+            for streaming_data in self.streaming_data_list:
+                channel_data.append_values(
+                    counter=streaming_data.counter,
+                    timestamp=streaming_data.timestamp,
+                    values=streaming_data.values,
+                )
+        else:
+            streaming_data_list = self.streaming_data_list
+            channel_data.counters = [
+                streaming_data.counter
+                for streaming_data in streaming_data_list
+            ]
+            channel_data.timestamps = [
+                streaming_data.timestamp
+                for streaming_data in streaming_data_list
+            ]
+            channel_data.measured_values = [
+                streaming_data.values[index]
+                for streaming_data in streaming_data_list
+            ]
+
+        return channel_data
+
     def first(self) -> ChannelData:
         """Get all data of the first measurement channel
 
@@ -430,35 +829,14 @@ class MeasurementData:
 
         """
 
-        channel_data = ChannelData()
         configuration = self.configuration
 
-        if configuration.first:
-            if not configuration.second and not configuration.third:
-                # Three values
-                for streaming_data in self.streaming_data_list:
-                    counter = streaming_data.counter
-                    timestamp = streaming_data.timestamp
-                    for value in streaming_data.values:
-                        channel_data.append(
-                            DataPoint(
-                                counter=counter,
-                                timestamp=timestamp,
-                                value=value,
-                            )
-                        )
-            else:
-                # One value
-                for streaming_data in self.streaming_data_list:
-                    channel_data.append(
-                        DataPoint(
-                            counter=streaming_data.counter,
-                            timestamp=streaming_data.timestamp,
-                            value=streaming_data.values[0],
-                        )
-                    )
+        if not configuration.first:
+            return ChannelData()
 
-        return channel_data
+        return self._channel_data(
+            None if configuration.enabled_channels() == 1 else 0
+        )
 
     def second(self) -> ChannelData:
         """Get all data of the second measurement channel
@@ -514,39 +892,16 @@ class MeasurementData:
 
         """
 
-        channel_data = ChannelData()
         configuration = self.configuration
 
-        if configuration.second:
-            if not configuration.first and not configuration.third:
-                # Three values
-                for streaming_data in self.streaming_data_list:
-                    counter = streaming_data.counter
-                    timestamp = streaming_data.timestamp
-                    for value in streaming_data.values:
-                        channel_data.append(
-                            DataPoint(
-                                counter=counter,
-                                timestamp=timestamp,
-                                value=value,
-                            )
-                        )
-            else:
-                # One value
-                for streaming_data in self.streaming_data_list:
-                    channel_data.append(
-                        DataPoint(
-                            counter=streaming_data.counter,
-                            timestamp=streaming_data.timestamp,
-                            value=(
-                                streaming_data.values[0]
-                                if not configuration.first
-                                else streaming_data.values[1]
-                            ),
-                        )
-                    )
+        if not configuration.second:
+            return ChannelData()
 
-        return channel_data
+        return self._channel_data(
+            None
+            if configuration.enabled_channels() == 1
+            else (1 if configuration.first else 0)
+        )
 
     def third(self) -> ChannelData:
         """Get all data of the third measurement channel
@@ -602,35 +957,14 @@ class MeasurementData:
 
         """
 
-        channel_data = ChannelData()
         configuration = self.configuration
 
-        if configuration.third:
-            if not configuration.first and not configuration.second:
-                # Three values
-                for streaming_data in self.streaming_data_list:
-                    counter = streaming_data.counter
-                    timestamp = streaming_data.timestamp
-                    for value in streaming_data.values:
-                        channel_data.append(
-                            DataPoint(
-                                counter=counter,
-                                timestamp=timestamp,
-                                value=value,
-                            )
-                        )
-            else:
-                # One value
-                for streaming_data in self.streaming_data_list:
-                    channel_data.append(
-                        DataPoint(
-                            counter=streaming_data.counter,
-                            timestamp=streaming_data.timestamp,
-                            value=streaming_data.values[-1],
-                        )
-                    )
+        if not configuration.third:
+            return ChannelData()
 
-        return channel_data
+        return self._channel_data(
+            None if configuration.enabled_channels() == 1 else -1
+        )
 
     def values(self) -> list[float]:
         """Return all the values stored in the measurement
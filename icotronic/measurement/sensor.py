@@ -7,6 +7,12 @@ from enum import auto, Enum
 from statistics import mean
 from typing import NamedTuple
 
+from numpy import asarray, ndarray
+from numpy.typing import ArrayLike
+
+from icotronic.can.streaming.data import StreamingDataBlock
+from icotronic.can.streaming.stats import ChannelStats
+
 # -- Classes ------------------------------------------------------------------
 
 
@@ -75,13 +81,55 @@ class Sensor(NamedTuple):
 # -- Functions ----------------------------------------------------------------
 
 
-def guess_sensor(values: Iterable[int]) -> Sensor:
+def sensor_from_mean(mean_raw: float) -> Sensor:
+    """Guess the sensor type from the mean of raw 16 bit ADC values
+
+    Args:
+
+        mean_raw:
+            The mean value of multiple raw 16 bit ADC measurement values
+
+    Returns:
+
+        An object representing the guessed sensor type
+
+    Examples:
+
+        Guess sensor types based on mean ADC values
+
+        >>> sensor_from_mean(10600)
+        Temperature Sensor
+
+        >>> sensor_from_mean(0)
+        Broken Sensor (Mean: 0)
+
+    """
+
+    half = 2**15
+
+    tolerance_acceleration = 1000
+    min_acceleration = half - tolerance_acceleration
+    max_acceleration = half + tolerance_acceleration
+
+    if 10000 <= mean_raw <= 11000:
+        return Sensor(SensorType.TEMPERATURE, mean_raw)
+    if min_acceleration <= mean_raw <= max_acceleration:
+        return Sensor(SensorType.ACCELERATION, mean_raw)
+    if 37500 <= mean_raw <= 38500:
+        return Sensor(SensorType.PIEZO, mean_raw)
+
+    return Sensor(SensorType.BROKEN, mean_raw)
+
+
+def guess_sensor(values: Iterable[int] | ChannelStats | ndarray) -> Sensor:
     """Guess the sensor type from raw 16 bit ADC values
 
     Args:
 
         values:
-            Multiple raw 16 bit ADC measurement values
+            Multiple raw 16 bit ADC measurement values or statistics
+            calculated from these values. For NumPy arrays the function
+            calculates the mean vectorized.
 
     Returns:
 
@@ -89,6 +137,10 @@ def guess_sensor(values: Iterable[int]) -> Sensor:
 
     Examples:
 
+        Import required library code
+
+        >>> from numpy import array
+
         Guess sensor types based on raw ADC values
 
         >>> guess_sensor([38024, 38000, 37950])
@@ -103,23 +155,76 @@ def guess_sensor(values: Iterable[int]) -> Sensor:
         >>> guess_sensor([123, 10, 50])
         Broken Sensor (Mean: 61)
 
+        Guess sensor type based on statistics collected while streaming
+
+        >>> guess_sensor(ChannelStats().update([32500, 32571, 32499]))
+        Acceleration Sensor
+
+        Guess sensor type based on a NumPy array
+
+        >>> guess_sensor(array([123, 10, 50], dtype="uint16"))
+        Broken Sensor (Mean: 61.0)
+
     """
 
-    mean_raw = mean(values)
-    half = 2**15
+    if isinstance(values, ChannelStats):
+        return sensor_from_mean(values.mean)
+    if isinstance(values, ndarray):
+        return sensor_from_mean(float(values.mean()))
 
-    tolerance_acceleration = 1000
-    min_acceleration = half - tolerance_acceleration
-    max_acceleration = half + tolerance_acceleration
+    return sensor_from_mean(mean(values))
 
-    if 10000 <= mean_raw <= 11000:
-        return Sensor(SensorType.TEMPERATURE, mean_raw)
-    if min_acceleration <= mean_raw <= max_acceleration:
-        return Sensor(SensorType.ACCELERATION, mean_raw)
-    if 37500 <= mean_raw <= 38500:
-        return Sensor(SensorType.PIEZO, mean_raw)
 
-    return Sensor(SensorType.BROKEN, mean_raw)
+def guess_sensors(values: ArrayLike | StreamingDataBlock) -> list[Sensor]:
+    """Guess the sensor types of multiple channels at once
+
+    Args:
+
+        values:
+            A two dimensional array that stores the raw 16 bit ADC values of
+            one channel per row, or a streaming data block that stores the
+            values of one channel per value position
+
+    Returns:
+
+        A list containing the guessed sensor type for each channel
+
+    Examples:
+
+        Import required library code
+
+        >>> from icotronic.can.streaming.data import StreamingData
+
+        Guess the sensor types of three channels
+
+        >>> guess_sensors([
+        ...     [38024, 38000, 37950],
+        ...     [32500, 32571, 32499],
+        ...     [10650, 10500, 10780],
+        ... ])
+        [Piezo Sensor, Acceleration Sensor, Temperature Sensor]
+
+        Guess the sensor types for the channels of a streaming data block
+
+        >>> block = StreamingDataBlock(values_per_message=2)
+        >>> block.extend([
+        ...     StreamingData(values=[32500, 10650], counter=1, timestamp=1),
+        ...     StreamingData(values=[32571, 10500], counter=2, timestamp=2)])
+        >>> guess_sensors(block)
+        [Acceleration Sensor, Temperature Sensor]
+
+    """
+
+    channels = (
+        values.to_numpy().T
+        if isinstance(values, StreamingDataBlock)
+        else asarray(values)
+    )
+
+    return [
+        sensor_from_mean(mean_raw)
+        for mean_raw in channels.mean(axis=-1).tolist()
+    ]
 
 
 # -- Main ---------------------------------------------------------------------
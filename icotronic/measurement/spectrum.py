@@ -0,0 +1,264 @@
+"""Support for calculating spectra of streaming data incrementally"""
+
+# -- Imports ------------------------------------------------------------------
+
+from __future__ import annotations
+
+from asyncio import Queue
+from typing import NamedTuple
+
+from numpy import arange, cos, empty, float64, pi, zeros
+from numpy.fft import rfft, rfftfreq
+from numpy.typing import NDArray
+
+from icotronic.can.adc import ADCConfiguration
+from icotronic.can.streaming.config import StreamingConfiguration
+from icotronic.can.streaming.data import StreamingData
+
+# -- Classes ------------------------------------------------------------------
+
+
+class Spectrum(NamedTuple):
+    """Power spectral density of the measurement channels"""
+
+    timestamp: float
+    """Timestamp of the last value used to calculate the spectrum"""
+
+    frequencies: NDArray[float64]
+    """Frequencies of the spectrum bins in Hz"""
+
+    psd: NDArray[float64]
+    """Power spectral density (one row per channel) in unit²/Hz"""
+
+
+# pylint: disable=too-many-instance-attributes
+
+
+class SpectrumAnalyzer:
+    """Calculate power spectral densities of streaming data incrementally
+
+    The analyzer uses Welch’s method: It splits the values of each channel
+    into overlapping segments, applies a Hann window to each segment and
+    averages the periodograms of multiple segments. All buffers are
+    allocated once, when you create the analyzer.
+
+    Args:
+
+        channels:
+            The streaming configuration used to retrieve the data
+
+        adc_configuration:
+            The ADC configuration of the sensor node. The analyzer uses the
+            ADC sample rate to calculate the sample rate of a single channel.
+
+        window_size:
+            The number of values (of a single channel) in a segment
+
+        overlap:
+            The fraction of values shared by two consecutive segments
+            (``0`` ≤ ``overlap`` < ``1``)
+
+        averages:
+            The number of segments averaged to calculate a single spectrum
+
+        queue:
+            An optional queue the analyzer adds calculated spectra to
+
+    Examples:
+
+        Import required library code
+
+        >>> from math import sin, tau
+
+        Calculate the spectrum of a 125 Hz sine wave
+
+        >>> channels = StreamingConfiguration(first=True)
+        >>> adc_configuration = ADCConfiguration(prescaler=2,
+        ...                                      acquisition_time=8,
+        ...                                      oversampling_rate=64)
+        >>> analyzer = SpectrumAnalyzer(channels, adc_configuration,
+        ...                             window_size=256)
+        >>> sample_rate = analyzer.sample_rate
+        >>> spectra = []
+        >>> for counter in range(200):
+        ...     values = [sin(tau * 125 * (counter * 3 + offset) / sample_rate)
+        ...               for offset in range(3)]
+        ...     data = StreamingData(counter=counter % 256,
+        ...                          timestamp=counter, values=values)
+        ...     spectra.extend(analyzer.add(data))
+        >>> len(spectra)
+        3
+        >>> spectrum = spectra[-1]
+        >>> peak = float(spectrum.frequencies[spectrum.psd[0].argmax()])
+        >>> abs(peak - 125) < analyzer.resolution()
+        True
+
+        The power of the spectrum matches the variance of the sine wave
+
+        >>> power = spectrum.psd[0].sum() * analyzer.resolution()
+        >>> round(float(power), 1)
+        0.5
+
+    """
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+    def __init__(
+        self,
+        channels: StreamingConfiguration,
+        adc_configuration: ADCConfiguration,
+        window_size: int = 1024,
+        overlap: float = 0.5,
+        averages: int = 1,
+        queue: Queue[Spectrum] | None = None,
+    ) -> None:
+
+        if window_size < 2:
+            raise ValueError(f"Window size too small: {window_size}")
+        if not 0 <= overlap < 1:
+            raise ValueError(f"Invalid overlap: {overlap}")
+        if averages < 1:
+            raise ValueError(f"Invalid number of averages: {averages}")
+
+        enabled_channels = channels.enabled_channels()
+        self.number_channels = enabled_channels
+        # The ADC sample rate is shared by all enabled channels
+        self.sample_rate = adc_configuration.sample_rate() / enabled_channels
+        self.window_size = window_size
+        self.step = max(1, round(window_size * (1 - overlap)))
+        self.averages = averages
+        self.queue = queue
+
+        samples = arange(window_size)
+        self.window = 0.5 - 0.5 * cos(2 * pi * samples / window_size)
+        # Scale periodograms to power spectral density (one sided)
+        self.scale = zeros(window_size // 2 + 1)
+        self.scale[:] = 2 / (self.sample_rate * (self.window**2).sum())
+        self.scale[0] /= 2
+        if window_size % 2 == 0:
+            self.scale[-1] /= 2
+        self.frequencies: NDArray[float64] = rfftfreq(
+            window_size, d=1 / self.sample_rate
+        ).astype(float64)
+
+        self.segment = zeros((self.number_channels, window_size))
+        self.windowed = empty((self.number_channels, window_size))
+        self.sum = zeros((self.number_channels, window_size // 2 + 1))
+        self.filled = 0
+        self.segments = 0
+
+    # pylint: enable=too-many-arguments, too-many-positional-arguments
+
+    def resolution(self) -> float:
+        """Get the frequency resolution of the calculated spectra
+
+        Returns:
+
+            The distance between two frequency bins in Hz
+
+        """
+
+        return self.sample_rate / self.window_size
+
+    def reset(self) -> None:
+        """Discard all buffered values and partially averaged spectra"""
+
+        self.filled = 0
+        self.segments = 0
+        self.sum[:] = 0
+
+    def _process_segment(self, timestamp: float) -> Spectrum | None:
+        """Calculate the periodogram of the current segment
+
+        Args:
+
+            timestamp:
+                The timestamp of the last value of the segment
+
+        Returns:
+
+            The averaged spectrum, if enough segments were processed or
+            ``None`` otherwise
+
+        """
+
+        self.windowed[:] = self.segment
+        self.windowed *= self.window
+        transformed = rfft(self.windowed)
+        self.sum += transformed.real**2 + transformed.imag**2
+        self.segments += 1
+
+        # Keep overlapping values for the next segment
+        keep = self.window_size - self.step
+        self.segment[:, :keep] = self.segment[:, self.step :]
+        self.filled = keep
+
+        if self.segments < self.averages:
+            return None
+
+        spectrum = Spectrum(
+            timestamp=timestamp,
+            frequencies=self.frequencies,
+            psd=self.sum * self.scale / self.segments,
+        )
+        self.sum[:] = 0
+        self.segments = 0
+
+        if self.queue is not None:
+            self.queue.put_nowait(spectrum)
+
+        return spectrum
+
+    def add(
+        self, data: StreamingData, lost_messages: int = 0
+    ) -> list[Spectrum]:
+        """Add streaming data to the analyzer
+
+        Args:
+
+            data:
+                The streaming data that should be analyzed
+
+            lost_messages:
+                The number of messages lost right before ``data``. If there
+                were lost messages, then the analyzer discards all buffered
+                values, since they are not contiguous anymore.
+
+        Returns:
+
+            A list of spectra completed by the added data
+
+        """
+
+        if lost_messages > 0:
+            self.reset()
+
+        spectra: list[Spectrum] = []
+        values = data.values
+        # One channel: all values belong to the same channel
+        # Multiple channels: every value belongs to a different channel
+        columns = (
+            [[value] for value in values]
+            if self.number_channels == 1
+            else [values]
+        )
+
+        for column in columns:
+            self.segment[:, self.filled] = column
+            self.filled += 1
+            if self.filled >= self.window_size:
+                spectrum = self._process_segment(data.timestamp)
+                if spectrum is not None:
+                    spectra.append(spectrum)
+
+        return spectra
+
+
+# pylint: enable=too-many-instance-attributes
+
+# -- Main ---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    from doctest import testmod
+
+    testmod()
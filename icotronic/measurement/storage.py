@@ -17,6 +17,7 @@ from tables import (
     MetaIsDescription,
     NoSuchNodeError,
     open_file,
+    Table,
     UInt8Col,
     UInt64Col,
 )
@@ -27,6 +28,7 @@ from icotronic.can.dataloss import calculate_dataloss_stats, MessageStats
 from icotronic.can.streaming import StreamingConfiguration, StreamingData
 
 from icotronic.measurement.data import MeasurementData
+from icotronic.measurement.spectrum import Spectrum
 
 # -- Functions ----------------------------------------------------------------
 
@@ -236,6 +238,10 @@ class StorageData:
 
         self.hdf = file_handle
         self.start_time: float | None = None
+        self.spectrum: Table | None = None
+        # The spectrum table uses its own reference time, since it might
+        # store data before the acceleration table (and vice versa)
+        self.spectrum_start_time: float | None = None
 
         name = "acceleration"
         if channels:
@@ -457,6 +463,84 @@ class StorageData:
         for streaming_data in measurement_data:
             self.add_streaming_data(streaming_data)
 
+    def add_spectrum(self, spectrum: Spectrum) -> None:
+        """Add a power spectral density to the storage object
+
+        The method stores spectra in a separate table called ``spectrum``,
+        which contains one row (the values of all frequency bins) per
+        spectrum and axis.
+
+        Args:
+
+            spectrum:
+                The spectrum that should be added to the storage
+
+        Examples:
+
+            Import required library code
+
+            >>> from numpy import array
+
+            Store two spectra for a single channel
+
+            >>> spectrum = Spectrum(timestamp=1,
+            ...                     frequencies=array([0.0, 10.0, 20.0]),
+            ...                     psd=array([[1.0, 2.0, 3.0]]))
+            >>> filepath = Path("test.hdf5")
+            >>> with Storage(filepath,
+            ...              StreamingConfiguration(first=True)) as storage:
+            ...     storage.add_spectrum(spectrum)
+            ...     storage.add_spectrum(spectrum._replace(timestamp=2))
+            ...     assert storage.spectrum is not None
+            ...     storage.spectrum.flush()
+            ...     print(storage.spectrum.nrows)
+            ...     print(storage.spectrum.attrs["Frequency_Resolution"])
+            ...     print(storage.spectrum[-1]["x"])
+            2
+            10.0 Hz
+            [1. 2. 3.]
+            >>> filepath.unlink()
+
+        """
+
+        timestamp = spectrum.timestamp
+
+        if self.spectrum_start_time is None:
+            self.spectrum_start_time = timestamp
+
+        if self.spectrum is None:
+            bins = len(spectrum.frequencies)
+            self.spectrum = self.hdf.create_table(
+                self.hdf.root,
+                name="spectrum",
+                description=type(
+                    "SpectrumDescription",
+                    (IsDescription,),
+                    {
+                        "timestamp": UInt64Col(),
+                        **{
+                            axis: Float32Col(shape=(bins,))
+                            for axis in self.axes
+                        },
+                    },
+                ),
+                title="Power Spectral Density",
+            )
+            resolution = (
+                spectrum.frequencies[1] - spectrum.frequencies[0]
+                if bins > 1
+                else 0
+            )
+            self.spectrum.attrs["Frequency_Resolution"] = (
+                f"{resolution:.1f} Hz"
+            )
+
+        row = self.spectrum.row
+        row["timestamp"] = (timestamp - self.spectrum_start_time) * 1_000_000
+        for axis, psd in zip(self.axes, spectrum.psd):
+            row[axis] = psd
+        row.append()
+
     def write_sample_rate(self, adc_configuration: ADCConfiguration) -> None:
         """Store the sample rate of the ADC
 
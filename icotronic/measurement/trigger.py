@@ -0,0 +1,379 @@
+"""Support for storing streaming data only after a trigger condition is met"""
+
+# -- Imports ------------------------------------------------------------------
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Sequence
+from math import sqrt
+
+from icotronic.can.dataloss import MessageStats
+from icotronic.can.streaming import StreamingData
+from icotronic.measurement.storage import StorageData
+
+# -- Classes ------------------------------------------------------------------
+
+
+class TriggerCondition(ABC):
+    """Base class for conditions that start a triggered capture"""
+
+    @abstractmethod
+    def check(self, values: Sequence[float]) -> bool:
+        """Check if the given values fulfill the trigger condition
+
+        Args:
+
+            values:
+                The (next) streaming values in the order they were measured
+
+        Returns:
+
+            ``True``, if the condition is met or ``False`` otherwise
+
+        """
+
+    def reset(self) -> None:
+        """Forget all values checked before"""
+
+
+class ThresholdTrigger(TriggerCondition):
+    """Trigger if a value deviates from an offset by a certain level
+
+    Args:
+
+        level:
+            The minimum (absolute) deviation from ``offset`` that triggers
+
+        offset:
+            The value that represents the idle state (e.g. 0 g)
+
+    Examples:
+
+        Check some values against a threshold
+
+        >>> trigger = ThresholdTrigger(level=100, offset=32768)
+        >>> trigger
+        Threshold: 100 (Offset: 32768)
+        >>> trigger.check([32768, 32800, 32700])
+        False
+        >>> trigger.check([32768, 32900, 32700])
+        True
+
+    """
+
+    def __init__(self, level: float, offset: float = 0) -> None:
+
+        self.level = level
+        self.offset = offset
+
+    def __repr__(self) -> str:
+        """Get the textual representation of the trigger condition
+
+        Returns:
+
+            A string representing the trigger condition
+
+        """
+
+        return f"Threshold: {self.level} (Offset: {self.offset})"
+
+    def check(self, values: Sequence[float]) -> bool:
+
+        return any(abs(value - self.offset) >= self.level for value in values)
+
+
+class RMSTrigger(TriggerCondition):
+    """Trigger if the RMS of the latest values exceeds a certain level
+
+    For more than one enabled channel the RMS is calculated over the values
+    of all channels.
+
+    Args:
+
+        level:
+            The minimum RMS of the deviations from ``offset`` that triggers
+
+        window:
+            The number of (latest) values used to calculate the RMS
+
+        offset:
+            The value that represents the idle state (e.g. 0 g)
+
+    Examples:
+
+        Check the RMS of some values
+
+        >>> trigger = RMSTrigger(level=2, window=4)
+        >>> trigger
+        RMS: 2 (Window: 4, Offset: 0)
+        >>> trigger.check([3, -3, 3])
+        False
+        >>> trigger.check([-3])
+        True
+        >>> trigger.check([0, 0, 0])
+        False
+
+    """
+
+    def __init__(self, level: float, window: int, offset: float = 0) -> None:
+
+        if window < 1:
+            raise ValueError(f"Invalid RMS window size: {window}")
+
+        self.level = level
+        self.window = window
+        self.offset = offset
+        self.squares: deque[float] = deque(maxlen=window)
+        self.sum_squares = 0.0
+
+    def __repr__(self) -> str:
+        """Get the textual representation of the trigger condition
+
+        Returns:
+
+            A string representing the trigger condition
+
+        """
+
+        return (
+            f"RMS: {self.level} (Window: {self.window}, Offset: {self.offset})"
+        )
+
+    def check(self, values: Sequence[float]) -> bool:
+
+        squares = self.squares
+        for value in values:
+            if len(squares) >= self.window:
+                self.sum_squares -= squares[0]
+            square = (value - self.offset) ** 2
+            squares.append(square)
+            self.sum_squares += square
+
+        if len(squares) < self.window:
+            return False
+
+        return sqrt(max(self.sum_squares, 0) / self.window) >= self.level
+
+    def reset(self) -> None:
+
+        self.squares.clear()
+        self.sum_squares = 0.0
+
+
+class RateOfChangeTrigger(TriggerCondition):
+    """Trigger if a value differs from the previous value of the same channel
+
+    Args:
+
+        level:
+            The minimum (absolute) difference between two consecutive values
+            of a channel that triggers
+
+        channels:
+            The number of enabled measurement channels
+
+    Examples:
+
+        Check the difference of consecutive values of a single channel
+
+        >>> trigger = RateOfChangeTrigger(level=50)
+        >>> trigger
+        Rate of Change: 50 (Channels: 1)
+        >>> trigger.check([100, 120, 140])
+        False
+        >>> trigger.check([200, 210, 220])
+        True
+
+        Check the difference of consecutive values of two channels
+
+        >>> trigger = RateOfChangeTrigger(level=50, channels=2)
+        >>> trigger.check([100, 500])
+        False
+        >>> trigger.check([120, 520])
+        False
+        >>> trigger.check([130, 400])
+        True
+
+    """
+
+    def __init__(self, level: float, channels: int = 1) -> None:
+
+        self.level = level
+        self.channels = channels
+        self.previous: deque[float] = deque(maxlen=channels)
+
+    def __repr__(self) -> str:
+        """Get the textual representation of the trigger condition
+
+        Returns:
+
+            A string representing the trigger condition
+
+        """
+
+        return f"Rate of Change: {self.level} (Channels: {self.channels})"
+
+    def check(self, values: Sequence[float]) -> bool:
+
+        triggered = False
+        previous = self.previous
+        for value in values:
+            if (
+                len(previous) >= self.channels
+                and abs(value - previous[0]) >= self.level
+            ):
+                triggered = True
+            previous.append(value)
+
+        return triggered
+
+    def reset(self) -> None:
+
+        self.previous.clear()
+
+
+# pylint: disable=too-many-instance-attributes
+
+
+class TriggeredCapture:
+    """Store streaming data only around trigger events
+
+    Until the trigger condition is met, the class only keeps the data of the
+    last ``pre_trigger`` seconds in memory. After a trigger event it writes
+    this data and all following data to the storage, until the trigger
+    condition was not met for ``hold`` seconds.
+
+    Args:
+
+        storage:
+            The storage object that should store the captured data
+
+        condition:
+            The condition that starts (and extends) a capture
+
+        pre_trigger:
+            The amount of time in seconds stored before a trigger event
+
+        hold:
+            The amount of time in seconds stored after the last trigger event
+
+    Examples:
+
+        Import required library code
+
+        >>> from pathlib import Path
+        >>> from icotronic.can.streaming import StreamingConfiguration
+        >>> from icotronic.measurement.storage import Storage
+
+        Capture data around a single spike
+
+        >>> values = [0] * 20 + [500] + [0] * 20
+        >>> filepath = Path("test.hdf5")
+        >>> with Storage(filepath,
+        ...              StreamingConfiguration(first=True)) as storage:
+        ...     capture = TriggeredCapture(storage,
+        ...                                ThresholdTrigger(level=100),
+        ...                                pre_trigger=0.0025, hold=0.0025)
+        ...     for counter, value in enumerate(values):
+        ...         capture.add(StreamingData(counter=counter,
+        ...                                   timestamp=counter / 1000,
+        ...                                   values=[value] * 3))
+        ...     storage.acceleration.flush()
+        ...     print(storage.acceleration.nrows // 3)
+        ...     print(capture)
+        7
+        Trigger Events: 1, Retrieved: 41, Lost: 0, Dataloss: 0.0
+
+        >>> filepath.unlink()
+
+    """
+
+    def __init__(
+        self,
+        storage: StorageData,
+        condition: TriggerCondition,
+        pre_trigger: float = 1,
+        hold: float = 1,
+    ) -> None:
+
+        self.storage = storage
+        self.condition = condition
+        self.pre_trigger = pre_trigger
+        self.hold = hold
+
+        self.buffer: deque[StreamingData] = deque()
+        self.capturing = False
+        self.last_trigger = 0.0
+        self.events = 0
+        """Number of trigger events"""
+        self.message_stats = MessageStats()
+        """Statistics about the messages of the whole stream"""
+
+        storage["Trigger"] = (
+            f"{condition}, Pre-Trigger: {pre_trigger} s, Hold: {hold} s"
+        )
+
+    def __repr__(self) -> str:
+        """Get the textual representation of the capture
+
+        Returns:
+
+            A string representing the capture
+
+        """
+
+        return f"Trigger Events: {self.events}, {self.message_stats}"
+
+    def add(self, data: StreamingData, lost_messages: int = 0) -> None:
+        """Add streaming data to the capture
+
+        Args:
+
+            data:
+                The streaming data that should be checked and possibly stored
+
+            lost_messages:
+                The number of messages lost right before ``data``
+
+        """
+
+        self.message_stats.retrieved += 1
+        self.message_stats.lost += lost_messages
+
+        timestamp = data.timestamp
+        triggered = self.condition.check(data.values)
+
+        if self.capturing:
+            self.storage.add_streaming_data(data)
+            if triggered:
+                self.last_trigger = timestamp
+            elif timestamp - self.last_trigger > self.hold:
+                self.capturing = False
+            return
+
+        if not triggered:
+            buffer = self.buffer
+            buffer.append(data)
+            while buffer[0].timestamp < timestamp - self.pre_trigger:
+                buffer.popleft()
+            return
+
+        self.events += 1
+        self.capturing = True
+        self.last_trigger = timestamp
+        for buffered in self.buffer:
+            self.storage.add_streaming_data(buffered)
+        self.buffer.clear()
+        self.storage.add_streaming_data(data)
+
+
+# pylint: enable=too-many-instance-attributes
+
+# -- Main ---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    from doctest import testmod
+
+    testmod()
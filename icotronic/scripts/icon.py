@@ -8,7 +8,7 @@ for more information
 # -- Imports ------------------------------------------------------------------
 
 from argparse import Namespace
-from asyncio import run
+from asyncio import gather, run
 from logging import basicConfig, getLogger
 from sys import exit as sys_exit, stderr
 from tempfile import NamedTemporaryFile
@@ -20,24 +20,102 @@ from tqdm import tqdm
 
 from icotronic.can import Connection
 from icotronic.can.adc import ADCConfiguration
+from icotronic.can.analyzer import analyze_trace
 from icotronic.can.error import CANConnectionError, UnsupportedFeatureException
+from icotronic.can.node.eeprom.image import (
+    backup,
+    load_images,
+    restore,
+    save_images,
+)
 from icotronic.can.node.sensor import SensorNode
+from icotronic.can.recorder import render_recording
 from icotronic.can.sensor import SensorConfiguration
+from icotronic.can.session import Session
 from icotronic.can.streaming import StreamingBufferError, StreamingTimeoutError
 from icotronic.cmdline.parse import create_icon_parser
 from icotronic.config import ConfigurationUtility, settings
+from icotronic.daemon import Daemon
+from icotronic.measurement.constants import ADC_MAX_VALUE
 from icotronic.measurement.storage import Storage, StorageData
+from icotronic.measurement.trigger import (
+    RateOfChangeTrigger,
+    RMSTrigger,
+    ThresholdTrigger,
+    TriggerCondition,
+    TriggeredCapture,
+)
+from icotronic.utility.cache import get_cache_filepath
+from icotronic.utility.log import get_log_filepath
 from icotronic.utility.performance import PerformanceMeasurement
 
+# -- Attributes ---------------------------------------------------------------
+
+REGISTRY_FILENAME = "sensor-nodes.json"
+"""Name of the file in the cache directory that stores known sensor nodes"""
+
 # -- Functions ----------------------------------------------------------------
 
 
+def command_analyze(arguments: Namespace) -> None:
+    """Print statistics about recorded CAN messages
+
+    Args:
+
+        arguments:
+            The given command line arguments
+
+    """
+
+    filepath = (
+        get_log_filepath(
+            "can.blf" if settings.Logger.can.format == "binary" else "can.log"
+        )
+        if arguments.filepath is None
+        else arguments.filepath
+    )
+
+    try:
+        analyzer = analyze_trace(
+            filepath,
+            interval=arguments.interval,
+            bitrate=Connection().configuration.get("bitrate"),
+        )
+    except (OSError, ValueError) as error:
+        exit_error(f"Unable to read CAN log file “{filepath}”: {error}")
+
+    print(analyzer)
+
+
 def command_config() -> None:
     """Open configuration file"""
 
     ConfigurationUtility.open_user_config()
 
 
+def command_log(arguments: Namespace) -> None:
+    """Print recorded CAN messages in human readable format
+
+    Args:
+
+        arguments:
+            The given command line arguments
+
+    """
+
+    filepath = (
+        get_log_filepath("can.blf")
+        if arguments.filepath is None
+        else arguments.filepath
+    )
+
+    try:
+        for line in render_recording(filepath):
+            print(line)
+    except (OSError, ValueError) as error:
+        exit_error(f"Unable to read CAN log file “{filepath}”: {error}")
+
+
 # pylint: disable=too-many-locals
 
 
@@ -46,6 +124,7 @@ async def read_data(
     sensor_config: SensorConfiguration,
     storage: StorageData,
     measurement_time_s: float,
+    capture: TriggeredCapture | None = None,
 ) -> PerformanceMeasurement:
     """Read some acceleration data from the given sensor node
 
@@ -64,6 +143,11 @@ async def read_data(
         measurement_time_s:
             The amount of time that should be used for reading data
 
+        capture:
+            An optional triggered capture that decides which data should be
+            stored. If you do not specify a capture, then the function stores
+            all data.
+
     Returns:
 
         Information about the performance of the streaming code
@@ -91,7 +175,10 @@ async def read_data(
             performance_measurement.start()
             start_time = monotonic()
             async for data, number_lost_messages in stream:
-                storage.add_streaming_data(data)
+                if capture is None:
+                    storage.add_streaming_data(data)
+                else:
+                    capture.add(data, number_lost_messages)
                 progress.update(
                     (number_lost_messages + 1) * values_per_message
                 )
@@ -114,6 +201,45 @@ async def read_data(
 # pylint: enable=too-many-locals
 
 
+def create_trigger_condition(
+    arguments: Namespace,
+    sensor_config: SensorConfiguration,
+    adc_config: ADCConfiguration,
+) -> TriggerCondition | None:
+    """Create the trigger condition specified by the command line arguments
+
+    Args:
+
+        arguments:
+            The given command line arguments
+
+        sensor_config:
+            The sensor configuration used for reading data
+
+        adc_config:
+            The ADC configuration used for reading data
+
+    Returns:
+
+        The trigger condition or ``None``, if all data should be stored
+
+    """
+
+    level = arguments.trigger_level
+    offset = ADC_MAX_VALUE / 2
+
+    if arguments.trigger == "threshold":
+        return ThresholdTrigger(level, offset)
+    if arguments.trigger == "rms":
+        window = max(1, round(adc_config.sample_rate() / 10))
+        return RMSTrigger(level, window, offset)
+    if arguments.trigger == "rate":
+        channels = sensor_config.streaming_configuration().enabled_channels()
+        return RateOfChangeTrigger(level, channels)
+
+    return None
+
+
 def print_dataloss_data(storage: StorageData) -> None:
     """Print information about data loss
 
@@ -147,6 +273,29 @@ def print_dataloss_data(storage: StorageData) -> None:
     )
 
 
+async def command_daemon(
+    arguments: Namespace,  # pylint: disable=unused-argument
+) -> None:
+    """Share the CAN connection with other processes
+
+    Args:
+
+        arguments:
+            The given command line arguments
+
+    """
+
+    try:
+        daemon = Daemon()
+    except ValueError as error:
+        exit_error(f"Unable to start daemon: {error}")
+
+    async with Session() as session:
+        session.stu.registry.load(get_cache_filepath(REGISTRY_FILENAME))
+        print(f"Listening on {daemon.host}:{daemon.port}")
+        await daemon.serve(session)
+
+
 async def command_dataloss(arguments: Namespace) -> None:
     """Check data loss at different sample rates
 
@@ -163,6 +312,7 @@ async def command_dataloss(arguments: Namespace) -> None:
     logger = getLogger(__name__)
 
     async with Connection() as stu:
+        stu.registry.load(get_cache_filepath(REGISTRY_FILENAME))
         logger.info("Connecting to “%s”", identifier)
         async with stu.connect_sensor_node(identifier) as sensor_node:
             logger.info("Connected to “%s”", identifier)
@@ -214,6 +364,112 @@ async def command_dataloss(arguments: Namespace) -> None:
                         )
 
 
+async def backup_eeprom(identifier: None | int | str, filepath: str) -> None:
+    """Store the EEPROM content of the STU and a sensor node in a file
+
+    Args:
+
+        identifier:
+            The identifier of the sensor node or ``None`` to only store the
+            EEPROM content of the STU
+
+        filepath:
+            The location of the EEPROM image file
+
+    """
+
+    async with Connection() as stu:
+        stu.registry.load(get_cache_filepath(REGISTRY_FILENAME))
+        if identifier is None:
+            images = {"STU": await backup(stu.eeprom)}
+        else:
+            async with stu.connect_sensor_node(identifier) as sensor_node:
+                # Read the EEPROM data of both nodes at the same time
+                stu_image, sensor_node_image = await gather(
+                    backup(stu.eeprom), backup(sensor_node.eeprom)
+                )
+            images = {"STU": stu_image, "Sensor Node": sensor_node_image}
+
+    try:
+        save_images(filepath, images)
+    except OSError as error:
+        exit_error(f"Unable to write EEPROM image “{filepath}”: {error}")
+
+    for name, image in images.items():
+        print(f"{name}: {image}")
+    print(f"Filepath: {filepath}")
+
+
+async def restore_eeprom(identifier: None | int | str, filepath: str) -> None:
+    """Write the EEPROM content of the STU and a sensor node from a file
+
+    Args:
+
+        identifier:
+            The identifier of the sensor node or ``None`` to only restore
+            the EEPROM content of the STU
+
+        filepath:
+            The location of the EEPROM image file
+
+    """
+
+    try:
+        images = load_images(filepath)
+    except (OSError, ValueError) as error:
+        exit_error(f"Unable to read EEPROM image “{filepath}”: {error}")
+
+    stu_image = images.get("STU")
+    sensor_node_image = images.get("Sensor Node")
+    if stu_image is None:
+        exit_error(f"EEPROM image “{filepath}” does not contain STU data")
+    if identifier is not None and sensor_node_image is None:
+        exit_error(
+            f"EEPROM image “{filepath}” does not contain sensor node data"
+        )
+    assert stu_image is not None
+
+    async with Connection() as stu:
+        stu.registry.load(get_cache_filepath(REGISTRY_FILENAME))
+        if identifier is None:
+            results = {"STU": await restore(stu.eeprom, stu_image)}
+        else:
+            assert sensor_node_image is not None
+            async with stu.connect_sensor_node(identifier) as sensor_node:
+                # Write the EEPROM data of both nodes at the same time
+                stu_result, sensor_node_result = await gather(
+                    restore(stu.eeprom, stu_image),
+                    restore(sensor_node.eeprom, sensor_node_image),
+                )
+            results = {"STU": stu_result, "Sensor Node": sensor_node_result}
+
+    for name, result in results.items():
+        print(
+            f"{name}: Wrote {result.written} blocks, "
+            f"skipped {result.skipped} unchanged blocks"
+        )
+
+
+async def command_eeprom(arguments: Namespace) -> None:
+    """Backup or restore the EEPROM content of the STU and a sensor node
+
+    Args:
+
+        arguments:
+            The given command line arguments
+
+    """
+
+    subcommand = arguments.eeprom_subcommand
+
+    if subcommand == "backup":
+        await backup_eeprom(arguments.identifier, arguments.filepath)
+    elif subcommand == "restore":
+        await restore_eeprom(arguments.identifier, arguments.filepath)
+    else:
+        raise ValueError(f"Unknown EEPROM subcommand “{subcommand}”")
+
+
 async def command_list(
     arguments: Namespace,  # pylint: disable=unused-argument
 ) -> None:
@@ -227,6 +483,7 @@ async def command_list(
     """
 
     async with Connection() as stu:
+        stu.registry.load(get_cache_filepath(REGISTRY_FILENAME))
         sensor_nodes = await stu.collect_sensor_nodes()
 
         for node in sensor_nodes:
@@ -247,6 +504,7 @@ async def command_measure(arguments: Namespace) -> None:
     measurement_time_s = arguments.time
 
     async with Connection() as stu:
+        stu.registry.load(get_cache_filepath(REGISTRY_FILENAME))
         async with stu.connect_sensor_node(identifier) as sensor_node:
 
             adc_config = ADCConfiguration(
@@ -282,17 +540,38 @@ async def command_measure(arguments: Namespace) -> None:
             ) as storage:
                 storage.write_sample_rate(adc_config)
 
+                condition = create_trigger_condition(
+                    arguments, user_sensor_config, adc_config
+                )
+                capture = (
+                    None
+                    if condition is None
+                    else TriggeredCapture(
+                        storage,
+                        condition,
+                        pre_trigger=arguments.pre_trigger,
+                        hold=arguments.hold,
+                    )
+                )
+
                 try:
                     await read_data(
                         sensor_node,
                         user_sensor_config,
                         storage,
                         measurement_time_s,
+                        capture,
                     )
                 except KeyboardInterrupt:
                     pass
                 finally:
-                    print(f"Data Loss: {storage.dataloss() * 100} %")
+                    if capture is None:
+                        print(f"Data Loss: {storage.dataloss() * 100} %")
+                    else:
+                        # Stored data contains gaps between trigger events
+                        dataloss = capture.message_stats.dataloss()
+                        print(f"Data Loss: {dataloss * 100} %")
+                        print(f"Trigger Events: {capture.events}")
                     print(f"Filepath: {filepath}")
 
 
@@ -310,6 +589,7 @@ async def command_rename(arguments: Namespace) -> None:
     name = arguments.name
 
     async with Connection() as stu:
+        stu.registry.load(get_cache_filepath(REGISTRY_FILENAME))
         async with stu.connect_sensor_node(identifier) as sensor_node:
             old_name = await sensor_node.get_name()
             mac_address = await sensor_node.get_mac_address()
@@ -384,11 +664,17 @@ def main():
     logger = getLogger(__name__)
     logger.info("CLI Arguments: %s", arguments)
 
-    if arguments.subcommand == "config":
+    if arguments.subcommand == "analyze":
+        command_analyze(arguments)
+    elif arguments.subcommand == "config":
         command_config()
+    elif arguments.subcommand == "log":
+        command_log(arguments)
     else:
         command_to_coroutine = {
+            "daemon": command_daemon,
             "dataloss": command_dataloss,
+            "eeprom": command_eeprom,
             "list": command_list,
             "measure": command_measure,
             "rename": command_rename,
@@ -0,0 +1,60 @@
+"""Utility functions for working with cached data"""
+
+# -- Imports ------------------------------------------------------------------
+
+from pathlib import Path
+
+from platformdirs import user_cache_path
+
+from icotronic.config import ConfigurationUtility
+
+# -- Functions ----------------------------------------------------------------
+
+
+def get_cache_filepath(filename: str) -> Path:
+    """Get the path of a file in the user’s cache directory
+
+    The function creates the cache directory, if it does not exist already.
+
+    Args:
+
+        filename:
+            The name of the file in the user’s cache directory
+
+    Returns:
+
+        The path of the file in the user’s cache directory
+
+    Examples:
+
+        Get the path of an example cache file
+
+        >>> get_cache_filepath("test.json").name
+        'test.json'
+
+    """
+
+    cache_filepath = (
+        user_cache_path(
+            appname=ConfigurationUtility.app_name,
+            appauthor=ConfigurationUtility.app_author,
+        )
+        / filename
+    )
+
+    # Create cache directory, if it does not exist already
+    if not cache_filepath.parent.exists():
+        cache_filepath.parent.mkdir(
+            exist_ok=True,
+            parents=True,
+        )
+
+    return cache_filepath
+
+
+# -- Main ---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    from doctest import testmod
+
+    testmod()
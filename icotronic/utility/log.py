@@ -2,14 +2,108 @@
 
 # -- Imports ------------------------------------------------------------------
 
-from logging import FileHandler, Formatter
+from logging import FileHandler, Formatter, LogRecord
+from logging.handlers import QueueHandler
+from pathlib import Path
+
 from platformdirs import user_log_path
 
 from icotronic.config import ConfigurationUtility
 
+# -- Classes ------------------------------------------------------------------
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Queue log records without formatting them in the logging thread
+
+    The standard ``QueueHandler`` formats the message of a record before it
+    adds the record to the queue. This handler adds the record unchanged, so
+    a ``QueueListener`` formats the message in its own thread. The log
+    arguments must therefore not change after the log call.
+
+    Examples:
+
+        Import required library code
+
+        >>> from logging import getLogger
+        >>> from queue import SimpleQueue
+
+        Queue an unformatted log record
+
+        >>> queue = SimpleQueue()
+        >>> logger = getLogger("test.deferred")
+        >>> logger.propagate = False
+        >>> logger.addHandler(DeferredQueueHandler(queue))
+        >>> logger.error("Hello %s", "World")
+        >>> record = queue.get()
+        >>> record.msg, record.args
+        ('Hello %s', ('World',))
+        >>> record.getMessage()
+        'Hello World'
+
+    """
+
+    def prepare(self, record: LogRecord) -> LogRecord:
+        """Prepare a record for queuing
+
+        Args:
+
+            record:
+                The log record that should be queued
+
+        Returns:
+
+            The unchanged log record
+
+        """
+
+        return record
+
+
 # -- Functions ----------------------------------------------------------------
 
 
+def get_log_filepath(filename: str) -> Path:
+    """Get the path of a file in the user’s log directory
+
+    The function creates the log directory, if it does not exist already.
+
+    Args:
+
+        filename:
+            The name of the file in the user’s log directory
+
+    Returns:
+
+        The path of the file in the user’s log directory
+
+    Examples:
+
+        Get the path of an example log file
+
+        >>> get_log_filepath("test.log").name
+        'test.log'
+
+    """
+
+    log_filepath = (
+        user_log_path(
+            appname=ConfigurationUtility.app_name,
+            appauthor=ConfigurationUtility.app_author,
+        )
+        / filename
+    )
+
+    # Create log directory, if it does not exist already
+    if not log_filepath.parent.exists():
+        log_filepath.parent.mkdir(
+            exist_ok=True,
+            parents=True,
+        )
+
+    return log_filepath
+
+
 def get_log_file_handler(filename: str) -> FileHandler:
     """Get file log handler that stores data in user’s log directory
 
@@ -74,22 +168,7 @@ def get_log_file_handler(filename: str) -> FileHandler:
 
     """
 
-    log_filepath = (
-        user_log_path(
-            appname=ConfigurationUtility.app_name,
-            appauthor=ConfigurationUtility.app_author,
-        )
-        / filename
-    )
-
-    # Create log directory, if it does not exist already
-    if not log_filepath.parent.exists():
-        log_filepath.parent.mkdir(
-            exist_ok=True,
-            parents=True,
-        )
-
-    handler = FileHandler(log_filepath, "w", "utf-8", delay=True)
+    handler = FileHandler(get_log_filepath(filename), "w", "utf-8", delay=True)
     handler.setFormatter(Formatter("{asctime} {message}", style="{"))
 
     return handler